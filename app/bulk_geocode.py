@@ -0,0 +1,337 @@
+"""일괄 오프라인 지오코딩 CLI
+
+CSV 또는 JSONL 주소 목록을 스트리밍으로 읽어 동시 처리 수와 초당 VWorld 호출 수를 제한하며
+지오코딩하고, 결과를 서비스의 영구 지오코딩 저장소(MEETPLANNER_GEOCODE_DB)에 바로 기록한다.
+
+입력은 batch 단위로 처리하며, batch가 끝날 때마다 저장소에 커밋하고 처리한 레코드 수를
+체크포인트 파일에 기록한다. 중단 후 같은 명령을 다시 실행하면 체크포인트 이후부터 이어서 처리한다.
+이미 저장소에 있는 주소는 VWorld를 호출하지 않는다.
+
+VWorld 전송/HTTP 오류는 "찾지 못함"과 구분한다. 일시 오류가 나면 호출 속도를 절반으로 줄이고
+지수 백오프 후 그 주소들만 다시 시도하며, 재시도가 다 실패하거나 한도 초과/인증키 오류가 나면
+체크포인트를 그 batch 앞에 둔 채 중단한다(종료 코드 2 또는 3).
+
+    python -m app.bulk_geocode employees.csv --column address --concurrency 8 --rate 20
+
+테스트할 때는 VWORLD_BASE_URL(또는 --base-url)을 로컬 스텁 서버로 지정한다
+(python -m benchmarks.vworld_stub).
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+from typing import Iterator, Optional
+
+from .geocode_store import GeocodeStore
+from .geocoder import MAX_CALLS_PER_ADDRESS, GeocodingUnavailable, VWorldGeocoder, normalize_address
+
+# 일시 오류 백오프 (초): 1, 2, 4, ... 최대 60
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+
+class RateLimiter:
+    """초당 호출 수 제한 (호출 간격을 일정하게 유지)
+
+    VWorld 일시 오류가 나면(failure) 속도를 절반으로 줄이고(최소 min_rate, 동시에 실패한 호출들이
+    속도를 거듭 줄이지 않도록 1초에 한 번만) 서버가 알려 준 Retry-After 동안 호출을 멈추며, 성공이 recover_after번 이어질 때마다(success) 설정한
+    속도까지 25%씩 회복한다.
+    """
+
+    def __init__(self, calls_per_second: float, min_rate: float = 0.5, recover_after: int = 50):
+        self.max_rate = calls_per_second
+        self.rate = calls_per_second
+        self.min_rate = min(min_rate, calls_per_second)
+        self.recover_after = recover_after
+        self._successes = 0
+        self._slowed_at = float("-inf")
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+                now = self._next_at
+            self._next_at = now + 1.0 / self.rate
+
+    def success(self) -> None:
+        self._successes += 1
+        if self._successes >= self.recover_after and self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate * 1.25)
+            self._successes = 0
+
+    def failure(self, retry_after: Optional[float] = None) -> None:
+        now = time.monotonic()
+        self._successes = 0
+        if now - self._slowed_at >= 1.0:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._slowed_at = now
+        if retry_after:
+            self._next_at = max(self._next_at, now + retry_after)
+
+
+def read_addresses(path: str, column: str) -> Iterator[str]:
+    """입력 파일의 주소를 순서대로 스트리밍 (.jsonl이면 JSON Lines, 아니면 헤더가 있는 CSV)"""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                yield record if isinstance(record, str) else str(record.get(column, ""))
+        else:
+            reader = csv.DictReader(f)
+            if reader.fieldnames is None or column not in reader.fieldnames:
+                raise ValueError(f"CSV 헤더에 '{column}' 열이 없습니다: {reader.fieldnames}")
+            for row in reader:
+                yield row[column] or ""
+
+
+def load_checkpoint(path: str, input_path: str) -> dict:
+    """같은 입력 파일의 체크포인트가 있으면 불러오고, 없으면 새 진행 상태 반환"""
+    state = {"input": os.path.abspath(input_path), "records": 0, "geocoded": 0, "stored": 0, "failed": 0}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        if saved.get("input") == state["input"]:
+            state.update(saved)
+    return state
+
+
+def save_checkpoint(path: str, state: dict) -> None:
+    # 임시 파일에 쓴 뒤 교체하여 저장 도중 종료되어도 기존 체크포인트가 깨지지 않도록 함
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+async def geocode_batch(
+    geocoder: VWorldGeocoder,
+    store: GeocodeStore,
+    addresses: list[str],
+    concurrency: int,
+    limiter: Optional[RateLimiter] = None
+) -> tuple[list[tuple[str, float, float]], list[str], list[tuple[str, GeocodingUnavailable]], int]:
+    """
+    batch 하나를 지오코딩 (geocoder.raise_unavailable이 True여야 VWorld 오류가 구분됨)
+
+    VWorld 오류가 concurrency번 연속되면 장애로 보고 나머지 주소는 호출하지 않고 같은 오류로 돌려준다.
+
+    Returns:
+        (새로 찾은 (주소, lat, lng) 목록, 찾지 못한 주소 목록,
+         VWorld 오류로 처리하지 못한 (주소, 오류) 목록, 저장소에 이미 있던 주소 수)
+    """
+    unique = [address for address in dict.fromkeys(addresses) if address]
+    pending = [address for address in unique if store.get(address) is None]
+    semaphore = asyncio.Semaphore(concurrency)
+    last_error: Optional[GeocodingUnavailable] = None
+    error_streak = 0
+
+    async def resolve(address: str):
+        nonlocal last_error, error_streak
+        async with semaphore:
+            if error_streak >= concurrency:
+                return last_error
+            try:
+                resolved = await geocoder.geocode(address)
+            except GeocodingUnavailable as e:
+                last_error = e
+                error_streak += 1
+                if limiter is not None:
+                    limiter.failure(e.retry_after)
+                return e
+            error_streak = 0
+            if limiter is not None:
+                limiter.success()
+            return resolved
+
+    resolved_list = await asyncio.gather(*(resolve(address) for address in pending))
+
+    found, failed, unavailable = [], [], []
+    for address, resolved in zip(pending, resolved_list):
+        if isinstance(resolved, GeocodingUnavailable):
+            unavailable.append((address, resolved))
+        elif resolved is None:
+            failed.append(address)
+        else:
+            found.append((address, resolved["lat"], resolved["lng"]))
+    return found, failed, unavailable, len(unique) - len(pending)
+
+
+async def run(
+    input_path: str,
+    store: GeocodeStore,
+    geocoder: VWorldGeocoder,
+    column: str = "address",
+    concurrency: int = 8,
+    batch_size: int = 200,
+    max_calls: int = 0,
+    checkpoint_path: Optional[str] = None,
+    failed_path: Optional[str] = None,
+    limiter: Optional[RateLimiter] = None,
+    max_retries: int = 5,
+    log=print
+) -> dict:
+    """입력 파일 전체를 지오코딩하고 진행 상태(처리량 포함) 반환
+
+    max_calls(> 0)는 이번 실행의 VWorld 호출 한도로, 다음 batch가 한도를 넘을 수 있으면
+    체크포인트를 남기고 중단한다. VWorld 일시 오류가 난 주소는 백오프 후 최대 max_retries번
+    다시 시도하고, 그래도 실패하거나 한도 초과/인증키 오류가 나면 batch를 끝내지 않고 중단한다
+    (이미 찾은 좌표는 저장되므로 재개 시 다시 호출하지 않음). 체크포인트는 batch의 모든 주소가
+    좌표를 찾았거나 "찾지 못함"으로 확정된 뒤에만 전진한다.
+    """
+    checkpoint_path = checkpoint_path or f"{input_path}.checkpoint.json"
+    state = load_checkpoint(checkpoint_path, input_path)
+    resumed_from = state["records"]
+    if resumed_from:
+        log(f"체크포인트에서 재개: {resumed_from}개 레코드 처리 완료 상태")
+
+    addresses = (normalize_address(address) for address in read_addresses(input_path, column))
+    addresses = islice(addresses, resumed_from, None)
+
+    started = time.monotonic()
+    start_calls = geocoder.api_calls
+    state["quota_exhausted"] = False
+    state["vworld_unavailable"] = False
+    geocoder.raise_unavailable = True
+    failed_file = open(failed_path, "a", encoding="utf-8") if failed_path else None
+    try:
+        while True:
+            batch = list(islice(addresses, batch_size))
+            if not batch:
+                break
+            remaining = batch
+            found_total, failed_total, already_stored = 0, [], None
+            for attempt in range(max_retries + 1):
+                calls_used = geocoder.api_calls - start_calls
+                if max_calls and calls_used + MAX_CALLS_PER_ADDRESS * len(remaining) > max_calls:
+                    state["quota_exhausted"] = True
+                    log(f"VWorld 호출 한도({max_calls}) 도달: {state['records']}번째 레코드에서 중단")
+                    break
+
+                found, failed, unavailable, stored = await geocode_batch(
+                    geocoder, store, remaining, concurrency, limiter
+                )
+                # 중단되더라도 찾은 좌표는 저장해 두어 재개 시 다시 호출하지 않음
+                store.put_many(found, source="bulk")
+                found_total += len(found)
+                failed_total += failed
+                if already_stored is None:
+                    already_stored = stored
+                if not unavailable:
+                    break
+
+                error = unavailable[0][1]
+                fatal = next((e for _, e in unavailable if e.fatal), None)
+                if fatal is not None:
+                    state["quota_exhausted"] = True
+                    log(f"VWorld 사용 불가({fatal}): {state['records']}번째 레코드에서 중단")
+                    break
+                if attempt == max_retries:
+                    state["vworld_unavailable"] = True
+                    log(f"VWorld 오류가 계속됨({error}): {state['records']}번째 레코드에서 중단")
+                    break
+                delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+                delay = max(delay, max((e.retry_after or 0.0) for _, e in unavailable))
+                log(f"VWorld 일시 오류 {len(unavailable)}건({error}): {delay:.0f}초 후 재시도")
+                remaining = [address for address, _ in unavailable]
+                await asyncio.sleep(delay)
+
+            state["geocoded"] += found_total
+            if state["quota_exhausted"] or state["vworld_unavailable"]:
+                # 이 batch는 끝나지 않았으므로 체크포인트는 batch 앞에 그대로 둠
+                break
+
+            if failed_file is not None:
+                for address in failed_total:
+                    failed_file.write(json.dumps({"address": address}, ensure_ascii=False) + "\n")
+                failed_file.flush()
+
+            state["records"] += len(batch)
+            state["stored"] += already_stored
+            state["failed"] += len(failed_total)
+            save_checkpoint(checkpoint_path, state)
+
+            elapsed = time.monotonic() - started
+            log(
+                f"{state['records']}개 처리 (새 좌표 {state['geocoded']}, 기존 {state['stored']}, "
+                f"실패 {state['failed']}) - {(state['records'] - resumed_from) / elapsed:.1f} rec/s, "
+                f"VWorld {geocoder.api_calls - start_calls}회"
+            )
+    finally:
+        if failed_file is not None:
+            failed_file.close()
+
+    elapsed = time.monotonic() - started
+    calls = geocoder.api_calls - start_calls
+    state["elapsed_seconds"] = round(elapsed, 3)
+    state["vworld_calls"] = calls
+    state["records_per_second"] = round((state["records"] - resumed_from) / elapsed, 1) if elapsed else 0.0
+    state["calls_per_second"] = round(calls / elapsed, 1) if elapsed else 0.0
+    return state
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.bulk_geocode", description="주소 목록 일괄 지오코딩")
+    parser.add_argument("input", help="주소 CSV(헤더 포함) 또는 JSONL 파일")
+    parser.add_argument("--column", default="address", help="주소 열/필드 이름 (기본: address)")
+    parser.add_argument("--db", default=os.getenv("MEETPLANNER_GEOCODE_DB", ""),
+                        help="지오코딩 저장소 경로 (기본: MEETPLANNER_GEOCODE_DB)")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 지오코딩 수")
+    parser.add_argument("--rate", type=float, default=10.0, help="초당 VWorld 호출 수 제한 (0이면 제한 없음)")
+    parser.add_argument("--max-calls", type=int, default=0, help="이번 실행의 VWorld 호출 한도 (0이면 제한 없음)")
+    parser.add_argument("--max-retries", type=int, default=5, help="VWorld 일시 오류 시 재시도 횟수")
+    parser.add_argument("--batch-size", type=int, default=200, help="체크포인트 단위 레코드 수")
+    parser.add_argument("--checkpoint", default=None, help="체크포인트 파일 (기본: <input>.checkpoint.json)")
+    parser.add_argument("--failed-out", default=None, help="찾지 못한 주소를 기록할 JSONL 파일")
+    parser.add_argument("--base-url", default=None, help="VWorld 호스트 (기본: VWORLD_BASE_URL 또는 공식 API)")
+    args = parser.parse_args(argv)
+
+    if not args.db:
+        parser.error("--db 또는 MEETPLANNER_GEOCODE_DB가 필요합니다.")
+
+    store = GeocodeStore(args.db)
+    # 메모리 캐시는 batch 내 중복 제거용으로만 쓰므로 작게 유지 (저장소가 기준)
+    geocoder = VWorldGeocoder(cache_size=args.batch_size, base_url=args.base_url)
+    limiter = RateLimiter(args.rate) if args.rate > 0 else None
+    if limiter is not None:
+        geocoder.throttle = limiter.wait
+
+    async def run_and_close() -> dict:
+        try:
+            return await run(
+                args.input, store, geocoder,
+                column=args.column,
+                concurrency=args.concurrency,
+                batch_size=args.batch_size,
+                max_calls=args.max_calls,
+                checkpoint_path=args.checkpoint,
+                failed_path=args.failed_out,
+                limiter=limiter,
+                max_retries=args.max_retries
+            )
+        finally:
+            await geocoder.aclose()
+
+    try:
+        state = asyncio.run(run_and_close())
+    finally:
+        store.close()
+
+    print(json.dumps(state, ensure_ascii=False, indent=2))
+    if state["quota_exhausted"]:
+        return 2
+    return 3 if state["vworld_unavailable"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
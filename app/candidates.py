@@ -1,9 +1,18 @@
+import hashlib
+import json
 import math
+import sys
 from typing import Optional
 
+from .records import Coord, Place
+from .spatial import GridIndex
+
 
 class CandidateGenerator:
-    """중심점 기반 후보 장소 생성기"""
+    """중심점 기반 후보 장소 생성기
+
+    locations를 지정하지 않으면 서울 카탈로그(MAJOR_LOCATIONS)를 사용한다.
+    """
 
     # 서울 주요 지하철역 및 만남 장소 데이터
     MAJOR_LOCATIONS = [
@@ -59,16 +68,56 @@ class CandidateGenerator:
         {"label": "도곡역", "lat": 37.4914, "lng": 127.0547, "type": "station", "features": ["cafe", "restaurant"]},
     ]
 
-    def generate(self, participant_coords: list[dict], max_candidates: int = 50) -> list[dict]:
+    def __init__(self, locations: Optional[list[dict]] = None):
+        # 카탈로그를 요청 간 공유되는 불변 Place 레코드로 한 번만 변환
+        self.places: tuple[Place, ...] = tuple(
+            Place(
+                label=loc["label"],
+                lat=loc["lat"],
+                lng=loc["lng"],
+                type=loc["type"],
+                features=tuple(loc["features"]),
+                index=index
+            )
+            for index, loc in enumerate(self.MAJOR_LOCATIONS if locations is None else locations)
+        )
+        self.index = GridIndex(self.places)
+
+    @classmethod
+    def catalog_fingerprint(cls) -> str:
+        """카탈로그 원본 데이터의 해시 (스냅샷 호환성 확인용)"""
+        raw = json.dumps(cls.MAJOR_LOCATIONS, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def nbytes(self) -> int:
+        """컴파일된 카탈로그와 공간 인덱스의 추정 바이트"""
+        size = sys.getsizeof(self.places)
+        for place in self.places:
+            size += sys.getsizeof(place) + sys.getsizeof(place.label) + sys.getsizeof(place.features)
+        return size + self.index.nbytes()
+
+    def export_places(self) -> list[list]:
+        """컴파일된 카탈로그를 직렬화 가능한 형태로 반환"""
+        return [[p.label, p.lat, p.lng, p.type, list(p.features)] for p in self.places]
+
+    def load_places(self, rows: list[list]) -> None:
+        """직렬화된 카탈로그로 교체 (export_places의 역변환)"""
+        self.places = tuple(
+            Place(label=label, lat=lat, lng=lng, type=type_, features=tuple(features), index=index)
+            for index, (label, lat, lng, type_, features) in enumerate(rows)
+        )
+        self.index = GridIndex(self.places)
+
+    def generate(self, participant_coords: list[Coord], max_candidates: int = 50) -> list[Place]:
         """
         참가자들의 위치를 기반으로 후보 장소 생성
 
         Args:
-            participant_coords: [{"lat": float, "lng": float}, ...]
+            participant_coords: 참가자 좌표 리스트
             max_candidates: 최대 후보 수
 
         Returns:
-            후보 장소 리스트
+            중심점에서 가까운 순으로 정렬된 후보 장소 리스트
         """
         if not participant_coords:
             return []
@@ -76,28 +125,18 @@ class CandidateGenerator:
         # 중심점 계산
         centroid = self._calculate_centroid(participant_coords)
 
-        # 중심점에서 각 후보까지의 거리 계산 후 정렬
-        candidates_with_distance = []
-        for loc in self.MAJOR_LOCATIONS:
-            distance = self._haversine_distance(
-                centroid["lat"], centroid["lng"],
-                loc["lat"], loc["lng"]
-            )
-            candidates_with_distance.append({
-                **loc,
-                "distance_from_centroid": distance
-            })
-
-        # 거리 기준 정렬
-        candidates_with_distance.sort(key=lambda x: x["distance_from_centroid"])
-
-        return candidates_with_distance[:max_candidates]
+        # 중심점에서 가까운 순으로 후보 선택 (공간 인덱스, Place 레코드는 복사하지 않음)
+        return self.index.nearest(
+            centroid,
+            max_candidates,
+            lambda place: self._haversine_distance(centroid.lat, centroid.lng, place.lat, place.lng)
+        )
 
-    def _calculate_centroid(self, coords: list[dict]) -> dict:
+    def _calculate_centroid(self, coords: list[Coord]) -> Coord:
         """좌표들의 중심점 계산"""
-        avg_lat = sum(c["lat"] for c in coords) / len(coords)
-        avg_lng = sum(c["lng"] for c in coords) / len(coords)
-        return {"lat": avg_lat, "lng": avg_lng}
+        avg_lat = sum(c.lat for c in coords) / len(coords)
+        avg_lng = sum(c.lng for c in coords) / len(coords)
+        return Coord(avg_lat, avg_lng)
 
     def _haversine_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """두 좌표 간의 거리 계산 (km)"""
@@ -0,0 +1,92 @@
+"""대규모 모임용 출발지 클러스터링 및 ETA 분포 요약
+
+수백 명 규모의 모임에서는 출발지를 격자 단위로 묶어 참가자 수로 가중된
+대표 지점만 점수 계산에 사용하고, 응답에는 참가자별 ETA 대신 분포 요약을 담는다.
+"""
+
+import math
+import os
+from typing import Optional
+
+from .records import Coord, OriginCluster
+
+
+# 위도 1도당 거리 (m)
+METERS_PER_DEGREE = 111_320
+
+
+def grid_clusters(
+    coords: dict[str, Coord],
+    weights: dict[str, int],
+    cell_meters: Optional[float] = None
+) -> list[OriginCluster]:
+    """
+    출발지를 격자 셀 단위로 묶어 가중 대표 지점 생성
+
+    Args:
+        coords: 정규화된 출발지 -> 좌표
+        weights: 정규화된 출발지 -> 참가자 수
+        cell_meters: 격자 셀 크기 (m)
+
+    Returns:
+        클러스터 리스트 (대표 지점은 구성원 좌표의 가중 평균)
+    """
+    if not coords:
+        return []
+    cell_meters = cell_meters if cell_meters is not None else float(
+        os.getenv("MEETPLANNER_CLUSTER_CELL_M", "500")
+    )
+
+    mean_lat = sum(c.lat for c in coords.values()) / len(coords)
+    lat_step = cell_meters / METERS_PER_DEGREE
+    lng_step = cell_meters / (METERS_PER_DEGREE * math.cos(math.radians(mean_lat)))
+
+    cells: dict[tuple[int, int], list[str]] = {}
+    for origin, coord in coords.items():
+        cell = (math.floor(coord.lat / lat_step), math.floor(coord.lng / lng_step))
+        cells.setdefault(cell, []).append(origin)
+
+    clusters = []
+    for members in cells.values():
+        weight = sum(weights[origin] for origin in members)
+        lat = sum(coords[origin].lat * weights[origin] for origin in members) / weight
+        lng = sum(coords[origin].lng * weights[origin] for origin in members) / weight
+        clusters.append(OriginCluster(coord=Coord(lat, lng), weight=weight, origins=members))
+    return clusters
+
+
+def eta_distribution(column, weights, bin_minutes: int = 10) -> dict:
+    """
+    가중 ETA 열의 분포 요약 (백분위수 + 히스토그램)
+
+    Args:
+        column: 대표 지점별 ETA
+        weights: 대표 지점별 참가자 수
+        bin_minutes: 히스토그램 구간 폭 (분)
+
+    Returns:
+        {"p10", "p50", "p90", "max", "histogram": [{"lower", "upper", "count"}, ...]}
+    """
+    pairs = sorted((value, weight) for value, weight in zip(column, weights) if weight)
+    total = sum(weight for _, weight in pairs)
+
+    ranks = {"p10": math.ceil(0.1 * total), "p50": math.ceil(0.5 * total), "p90": math.ceil(0.9 * total)}
+    percentiles = {}
+    histogram: dict[int, int] = {}
+    cumulative = 0
+    for value, weight in pairs:
+        cumulative += weight
+        for name, rank in ranks.items():
+            if name not in percentiles and cumulative >= rank:
+                percentiles[name] = value
+        lower = value // bin_minutes * bin_minutes
+        histogram[lower] = histogram.get(lower, 0) + weight
+
+    return {
+        **percentiles,
+        "max": pairs[-1][0] if pairs else 0,
+        "histogram": [
+            {"lower": lower, "upper": lower + bin_minutes, "count": count}
+            for lower, count in sorted(histogram.items())
+        ]
+    }
@@ -1,4 +1,8 @@
 import math
+from array import array
+from typing import Optional
+
+from .records import Coord, Place, eta_row
 
 
 class TransitEstimator:
@@ -10,22 +14,37 @@ class TransitEstimator:
     # 기본 대기/환승 시간 (분)
     BASE_WAIT_TIME = 8
 
-    def estimate(self, origin: dict, destination: dict) -> int:
+    # ETA 모델 버전 (공식이 바뀌면 올려서 미리 계산된 ETA를 무효화)
+    MODEL_VERSION = 1
+
+    def __init__(self, avg_speed_kmh: Optional[float] = None, base_wait_time: Optional[float] = None):
+        # 지역별 파라미터 (지정하지 않으면 서울 기준 기본값)
+        if avg_speed_kmh is not None:
+            self.AVG_SPEED_KMH = avg_speed_kmh
+        if base_wait_time is not None:
+            self.BASE_WAIT_TIME = base_wait_time
+
+    @property
+    def version(self) -> str:
+        """미리 계산된 ETA(이소크론 격자 등)의 호환성 확인용 버전 문자열"""
+        return f"transit-v{self.MODEL_VERSION}:{self.AVG_SPEED_KMH}:{self.BASE_WAIT_TIME}"
+
+    def estimate(self, origin: Coord, destination: Coord | Place) -> int:
         """
         출발지에서 목적지까지의 예상 이동 시간 계산
 
         PRD 공식: ETA(min) = (거리_km / 18) * 60 + 8
 
         Args:
-            origin: {"lat": float, "lng": float}
-            destination: {"lat": float, "lng": float}
+            origin: 출발지 좌표
+            destination: 목적지 좌표 (lat/lng 속성을 가진 객체)
 
         Returns:
             예상 이동 시간 (분, 정수)
         """
         distance_km = self._haversine_distance(
-            origin["lat"], origin["lng"],
-            destination["lat"], destination["lng"]
+            origin.lat, origin.lng,
+            destination.lat, destination.lng
         )
 
         # ETA 계산: (거리 / 속도) * 60 + 기본 대기시간
@@ -33,6 +52,19 @@ class TransitEstimator:
 
         return round(eta_minutes)
 
+    def estimate_row(self, origin: Coord, places: list[Place]) -> array:
+        """
+        한 출발지에서 모든 후보까지의 ETA 행 계산
+
+        Args:
+            origin: 출발지 좌표
+            places: 후보 장소 리스트
+
+        Returns:
+            후보 순서의 ETA 배열 (분, uint16)
+        """
+        return eta_row(self.estimate(origin, place) for place in places)
+
     def _haversine_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """두 좌표 간의 거리 계산 (km)"""
         R = 6371  # 지구 반경 (km)
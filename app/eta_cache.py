@@ -0,0 +1,102 @@
+"""요청 간 ETA 행 캐시
+
+같은 출발지는 서로 다른 모임에서도 반복해 등장하므로, 출발지를 약 100m 격자 셀로 양자화하고
+(샤드, ETA 모델 버전, 셀) 단위로 카탈로그 전체 ETA 행(uint16 배열)을 LRU로 보관한다.
+행은 셀 중심 좌표로 계산하므로 캐시 적중 여부와 관계없이 같은 셀의 출발지는 같은 행을 받는다.
+전체 응답 캐시(RecommendationCache)와 달리 출발지 조합이 달라도 출발지별로 재사용된다.
+"""
+
+import math
+import os
+import sys
+from array import array
+from collections import OrderedDict
+from typing import Optional
+
+from .clustering import METERS_PER_DEGREE
+from .estimator import TransitEstimator
+from .memory import ODICT_ENTRY_BYTES
+from .records import Coord, Place
+
+
+# 항목당 배열 외 부가 메모리 근사치 (키 튜플 + 셀 튜플 + OrderedDict 항목)
+ENTRY_OVERHEAD_BYTES = 2 * sys.getsizeof((0, 0, 0)) + ODICT_ENTRY_BYTES
+
+
+class EtaRowCache:
+    """(샤드, ETA 모델 버전, 양자화된 출발지 셀) -> ETA 행 LRU 캐시 (바이트 상한)
+
+    max_bytes가 0이면 비활성화되어 출발지 좌표 그대로 계산한다.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, cell_meters: Optional[float] = None):
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            os.getenv("MEETPLANNER_ETA_ROW_CACHE_BYTES", str(16 * 1024 * 1024))
+        )
+        self.cell_meters = cell_meters if cell_meters is not None else float(
+            os.getenv("MEETPLANNER_ETA_ROW_CELL_M", "100")
+        )
+        self._lat_step = self.cell_meters / METERS_PER_DEGREE
+        self._entries: OrderedDict[tuple, array] = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.cell_meters > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cell(self, coord: Coord) -> tuple[int, int]:
+        """출발지가 속한 격자 셀 (위도 띠마다 경도 간격을 보정해 셀이 대략 정사각형)"""
+        lat_index = math.floor(coord.lat / self._lat_step)
+        return lat_index, math.floor(coord.lng / self._lng_step(lat_index))
+
+    def cell_center(self, cell: tuple[int, int]) -> Coord:
+        lat_index, lng_index = cell
+        return Coord((lat_index + 0.5) * self._lat_step, (lng_index + 0.5) * self._lng_step(lat_index))
+
+    def _lng_step(self, lat_index: int) -> float:
+        return self._lat_step / math.cos(math.radians((lat_index + 0.5) * self._lat_step))
+
+    def row(self, namespace: str, coord: Coord, estimator: TransitEstimator, places: tuple[Place, ...]) -> array:
+        """
+        출발지 -> 카탈로그 전체 ETA 행 (캐시에 없으면 셀 중심 기준으로 계산해 저장)
+
+        Args:
+            namespace: 카탈로그 구분 (지역 샤드 ID)
+            coord: 출발지 좌표
+            estimator: ETA 추정기 (버전이 키에 포함됨)
+            places: 카탈로그 장소 (place.index 순서)
+        """
+        if not self.enabled:
+            return estimator.estimate_row(coord, places)
+
+        cell = self.cell(coord)
+        key = (namespace, estimator.version, cell)
+        row = self._entries.get(key)
+        if row is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return row
+
+        self.misses += 1
+        row = estimator.estimate_row(self.cell_center(cell), places)
+        self._entries[key] = row
+        self.nbytes += self._entry_bytes(row)
+        self.shrink_to(self.max_bytes)
+        return row
+
+    def shrink_to(self, max_bytes: int) -> int:
+        """캐시 추정 바이트가 max_bytes 이하가 될 때까지 오래된 행 제거 (제거한 바이트 반환)"""
+        before = self.nbytes
+        while self.nbytes > max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= self._entry_bytes(evicted)
+        return before - self.nbytes
+
+    @staticmethod
+    def _entry_bytes(row: array) -> int:
+        return sys.getsizeof(row) + ENTRY_OVERHEAD_BYTES
@@ -1,5 +1,16 @@
+import sys
+from typing import Optional
+
+from .records import Fairness, Place
+from .scoring import Scoring
+
+
 class ExplanationGenerator:
-    """추천 결과에 대한 한국어 설명 생성기"""
+    """추천 결과에 대한 한국어 설명 생성기
+
+    문장 조각은 시작 시점에 테이블로 한 번만 구성(intern)하고,
+    요청마다 달라지는 부분(평균 이동 시간)만 채워 넣는다.
+    """
 
     PURPOSE_DESCRIPTIONS = {
         "cafe_talk": "카페에서 대화하기",
@@ -21,11 +32,43 @@ class ExplanationGenerator:
         "entertainment": "놀거리가 많은",
     }
 
+    # 이동 시간 공정성 구간: (std 상한, 문장)
+    STD_PHRASES = (
+        (3, "모든 참가자가 비슷한 시간에 도착할 수 있습니다"),
+        (7, "참가자들의 이동 시간 차이가 적당합니다"),
+        (float("inf"), "이동 시간에 다소 차이가 있지만 접근성이 좋습니다"),
+    )
+
+    # 평균 이동 시간 구간: (mean 상한, 템플릿)
+    MEAN_TEMPLATES = (
+        (20, "평균 약 {}분이면 도착 가능합니다"),
+        (35, "평균 약 {}분 정도 소요됩니다"),
+        (float("inf"), "평균 약 {}분 정도 걸리지만 모두에게 공정한 위치입니다"),
+    )
+
+    def __init__(self):
+        # 구간별 문장 조각을 미리 intern (공정성 문장은 구분자 ". " 포함)
+        self._std_phrases = tuple(
+            (limit, sys.intern(phrase + ". ")) for limit, phrase in self.STD_PHRASES
+        )
+        self._mean_templates = tuple(
+            (limit, sys.intern(template)) for limit, template in self.MEAN_TEMPLATES
+        )
+
+        # 목적별 선호 특성은 Scoring과 동일한 테이블을 사용
+        self._purpose_features = {
+            purpose: frozenset(features) for purpose, features in Scoring.PURPOSE_FEATURES.items()
+        }
+        self._default_purpose_features = frozenset(Scoring.DEFAULT_PURPOSE_FEATURES)
+
+        # (장소 특성, 목적) -> 특성/목적 문장 꼬리. 카탈로그와 목적 수가 유한하므로 메모이즈
+        # (요청의 purpose는 자유 문자열이므로 알 수 없는 목적은 모두 None 키 하나로 모음)
+        self._tails: dict[tuple[tuple[str, ...], Optional[str]], str] = {}
+
     def generate(
         self,
-        candidate: dict,
-        eta_by_participant: dict[str, int],
-        fairness: dict,
+        candidate: Place,
+        fairness: Fairness,
         purpose: str
     ) -> str:
         """
@@ -33,61 +76,52 @@ class ExplanationGenerator:
 
         Args:
             candidate: 후보 장소 정보
-            eta_by_participant: 참가자별 예상 이동 시간
             fairness: 공정성 점수
             purpose: 만남 목적
 
         Returns:
             한국어 설명 문자열
         """
-        parts = []
+        std_phrase = next(phrase for limit, phrase in self._std_phrases if fairness.std < limit)
+        mean_template = next(
+            template for limit, template in self._mean_templates if fairness.mean < limit
+        )
+
+        key = (candidate.features, purpose if purpose in self._purpose_features else None)
+        tail = self._tails.get(key)
+        if tail is None:
+            tail = self._tails[key] = self._compile_tail(*key)
+
+        return std_phrase + mean_template.format(round(fairness.mean)) + tail
 
-        # 이동 시간 공정성 설명
-        std = fairness["std"]
-        mean = fairness["mean"]
-
-        if std < 3:
-            parts.append("모든 참가자가 비슷한 시간에 도착할 수 있습니다")
-        elif std < 7:
-            parts.append("참가자들의 이동 시간 차이가 적당합니다")
-        else:
-            parts.append("이동 시간에 다소 차이가 있지만 접근성이 좋습니다")
-
-        # 평균 이동 시간 언급
-        if mean < 20:
-            parts.append(f"평균 약 {round(mean)}분이면 도착 가능합니다")
-        elif mean < 35:
-            parts.append(f"평균 약 {round(mean)}분 정도 소요됩니다")
-        else:
-            parts.append(f"평균 약 {round(mean)}분 정도 걸리지만 모두에게 공정한 위치입니다")
-
-        # 장소 특성 설명
-        features = candidate.get("features", [])
-        feature_desc = []
-        for f in features[:2]:  # 최대 2개만
-            if f in self.FEATURE_DESCRIPTIONS:
-                feature_desc.append(self.FEATURE_DESCRIPTIONS[f])
+    def compiled_keys(self) -> list[tuple[tuple[str, ...], str]]:
+        """지금까지 컴파일된 (장소 특성, 목적) 키 목록 (알려진 목적만)"""
+        return [key for key in self._tails if key[1] is not None]
 
+    def warm(self, keys) -> None:
+        """(장소 특성, 목적) 키의 문장 꼬리를 미리 컴파일 (알 수 없는 목적은 무시)"""
+        for features, purpose in keys:
+            if purpose not in self._purpose_features:
+                continue
+            features = tuple(features)
+            if (features, purpose) not in self._tails:
+                self._tails[(features, purpose)] = self._compile_tail(features, purpose)
+
+    def _compile_tail(self, features: tuple[str, ...], purpose: Optional[str]) -> str:
+        """평균 이동 시간 문장 뒤에 붙는 꼬리 생성 (장소 특성/목적 적합성 + 마침표)"""
+        parts = []
+
+        # 장소 특성 설명 (최대 2개)
+        feature_desc = [
+            self.FEATURE_DESCRIPTIONS[f] for f in features[:2] if f in self.FEATURE_DESCRIPTIONS
+        ]
         if feature_desc:
             parts.append(f"{', '.join(feature_desc)} 지역입니다")
 
         # 목적 적합성 언급
-        purpose_desc = self.PURPOSE_DESCRIPTIONS.get(purpose, "만남")
-        if any(f in features for f in self._get_purpose_features(purpose)):
+        purpose_features = self._purpose_features.get(purpose, self._default_purpose_features)
+        if purpose_features.intersection(features):
+            purpose_desc = self.PURPOSE_DESCRIPTIONS.get(purpose, "만남")
             parts.append(f"{purpose_desc}에 좋은 장소입니다")
 
-        return ". ".join(parts) + "."
-
-    def _get_purpose_features(self, purpose: str) -> list[str]:
-        """목적에 해당하는 특성 목록 반환"""
-        mapping = {
-            "cafe_talk": ["cafe", "culture"],
-            "restaurant": ["restaurant"],
-            "shopping": ["shopping"],
-            "business": ["business", "cafe"],
-            "culture": ["culture"],
-            "entertainment": ["entertainment", "shopping"],
-            "study": ["cafe", "culture"],
-            "date": ["cafe", "restaurant", "culture"],
-        }
-        return mapping.get(purpose, ["cafe", "restaurant"])
+        return sys.intern("".join(". " + part for part in parts) + ".")
@@ -0,0 +1,141 @@
+"""이동 시간 공정성 커널
+
+모든 후보의 ETA 열을 한 번에 처리해 평균, 표본 표준편차, 최댓값, 범위,
+지니 계수, 90 백분위수를 계산한다. 열마다 정렬 후 한 번의 순회(C 수준의
+sum/map)로 모든 지표를 얻으며, ETA가 정수이므로 분산은 정수 합/제곱합으로
+정확하게 계산한다 (statistics.stdev와 반올림 결과가 같다).
+"""
+
+import math
+from operator import mul
+
+from .records import Fairness
+
+
+# 지원하는 공정성 지표 이름 -> Fairness 필드
+FAIRNESS_METRICS = {
+    "std": "std",
+    "range": "range",
+    "minimax": "max",
+    "gini": "gini",
+    "p90": "p90",
+}
+
+
+def column_fairness(column) -> Fairness:
+    """
+    ETA 열 하나의 공정성 지표 계산
+
+    Args:
+        column: 참가자별 ETA (정수)
+
+    Returns:
+        공정성 지표
+    """
+    n = len(column)
+    if n == 0:
+        return Fairness(std=0.0, mean=0.0)
+    if n == 1:
+        eta = column[0]
+        return Fairness(std=0.0, mean=eta, max=eta, p90=eta)
+
+    values = sorted(column)
+    total = sum(values)
+    sq_total = sum(map(mul, values, values))
+    # 지니 계수: G = (2 * sum(i * x_i) - (n + 1) * sum(x)) / (n * sum(x))  (x 오름차순, i는 1부터)
+    ranked_total = sum(map(mul, values, range(1, n + 1)))
+
+    variance = (n * sq_total - total * total) / (n * (n - 1))
+    gini = (2 * ranked_total - (n + 1) * total) / (n * total) if total else 0.0
+    low, high = values[0], values[-1]
+
+    return Fairness(
+        std=round(math.sqrt(variance), 2),
+        mean=round(total / n, 2),
+        max=high,
+        range=high - low,
+        gini=round(gini, 4),
+        p90=values[math.ceil(0.9 * n) - 1]
+    )
+
+
+def fairness_table(eta_rows: list) -> list[Fairness]:
+    """
+    참가자 x 후보 ETA 행렬의 모든 후보(열)에 대한 공정성 지표 계산
+
+    Args:
+        eta_rows: 참가자별 ETA 행 (모두 같은 길이)
+
+    Returns:
+        후보 순서의 공정성 지표 리스트
+    """
+    if not eta_rows:
+        return []
+    return [column_fairness(column) for column in zip(*eta_rows)]
+
+
+def weighted_column_fairness(column, weights) -> Fairness:
+    """
+    가중치(참가자 수)가 있는 ETA 열의 공정성 지표 계산
+
+    각 값을 가중치만큼 반복한 열에 column_fairness를 적용한 것과 같은 결과를 낸다.
+
+    Args:
+        column: 대표 지점별 ETA (정수)
+        weights: 대표 지점별 참가자 수 (정수)
+
+    Returns:
+        공정성 지표
+    """
+    pairs = sorted(zip(column, weights))
+    n = sum(weights)
+    if n == 0:
+        return Fairness(std=0.0, mean=0.0)
+    if n == 1:
+        eta = next(value for value, weight in pairs if weight)
+        return Fairness(std=0.0, mean=eta, max=eta, p90=eta)
+
+    total = sq_total = gini_total = 0
+    cumulative = 0
+    p90_rank = math.ceil(0.9 * n)
+    p90 = None
+    for value, weight in pairs:
+        if not weight:
+            continue
+        total += value * weight
+        sq_total += value * value * weight
+        # 반복 전개된 열에서 이 블록이 차지하는 순위 구간의 지니 기여분
+        gini_total += value * weight * (2 * cumulative + weight - n)
+        cumulative += weight
+        if p90 is None and cumulative >= p90_rank:
+            p90 = value
+
+    low = next(value for value, weight in pairs if weight)
+    high = next(value for value, weight in reversed(pairs) if weight)
+    variance = (n * sq_total - total * total) / (n * (n - 1))
+    gini = gini_total / (n * total) if total else 0.0
+
+    return Fairness(
+        std=round(math.sqrt(variance), 2),
+        mean=round(total / n, 2),
+        max=high,
+        range=high - low,
+        gini=round(gini, 4),
+        p90=p90
+    )
+
+
+def weighted_fairness_table(eta_rows: list, weights: list[int]) -> list[Fairness]:
+    """
+    대표 지점 x 후보 ETA 행렬의 모든 후보에 대한 가중 공정성 지표 계산
+
+    Args:
+        eta_rows: 대표 지점별 ETA 행
+        weights: 대표 지점별 참가자 수
+
+    Returns:
+        후보 순서의 공정성 지표 리스트
+    """
+    if not eta_rows:
+        return []
+    return [weighted_column_fairness(column, weights) for column in zip(*eta_rows)]
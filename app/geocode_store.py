@@ -0,0 +1,70 @@
+"""영구 지오코딩 저장소
+
+정규화된 주소 -> 좌표를 sqlite 파일에 보관한다. 메모리 LRU 캐시(VWorldGeocoder)의
+다음 단계로 사용되며, 일괄 지오코딩 CLI(app.bulk_geocode)가 같은 파일을 미리 채운다.
+WAL 모드로 열어 서비스와 CLI가 같은 파일을 동시에 읽고 쓸 수 있다.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional
+
+
+class GeocodeStore:
+    """sqlite 기반 주소 -> 좌표 저장소
+
+    서비스는 asyncio.to_thread로 여러 스레드에서 호출하므로 연결 사용은 잠금으로 직렬화한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            " address TEXT PRIMARY KEY,"
+            " lat REAL NOT NULL,"
+            " lng REAL NOT NULL,"
+            " source TEXT NOT NULL,"
+            " updated_at REAL NOT NULL"
+            ")"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def open(cls, path: str) -> Optional["GeocodeStore"]:
+        """경로가 비어 있으면 None (저장소 비활성)"""
+        return cls(path) if path else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+
+    def get(self, address: str) -> Optional[tuple[float, float]]:
+        """정규화된 주소의 좌표 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute("SELECT lat, lng FROM geocode WHERE address = ?", (address,)).fetchone()
+        return (row[0], row[1]) if row is not None else None
+
+    def put(self, address: str, lat: float, lng: float, source: str = "service") -> None:
+        self.put_many([(address, lat, lng)], source)
+
+    def put_many(self, rows: Iterable[tuple[str, float, float]], source: str = "service") -> None:
+        """(정규화된 주소, lat, lng) 목록을 한 트랜잭션으로 저장"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO geocode (address, lat, lng, source, updated_at) VALUES (?, ?, ?, ?, ?)",
+                ((address, lat, lng, source, now) for address, lat, lng in rows)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
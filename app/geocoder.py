@@ -1,17 +1,94 @@
+import asyncio
+import logging
 import os
-import httpx
-from typing import Optional
+import sys
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+from . import profiling
+from .geocode_store import GeocodeStore
+from .memory import ODICT_ENTRY_BYTES
+from .tracing import span
+
+
+logger = logging.getLogger(__name__)
+
+# 캐시 항목당 주소 문자열 외 추정 바이트 (좌표 튜플 + float 2개 + OrderedDict 항목)
+_GEOCODE_ENTRY_BYTES = sys.getsizeof((0.0, 0.0)) + 2 * sys.getsizeof(0.0) + ODICT_ENTRY_BYTES
+
+
+# 주소 하나당 최대 VWorld 호출 수 (도로명 -> 지번 -> POI)
+MAX_CALLS_PER_ADDRESS = 3
+
+# VWorld status ERROR 중 재시도해도 소용없는 코드 (일일 호출 한도 초과, 인증키 오류)
+FATAL_VWORLD_ERRORS = frozenset({"OVER_REQUEST_LIMIT", "INVALID_KEY", "INCORRECT_KEY", "UNAVAILABLE_KEY"})
+
+
+class GeocodingUnavailable(Exception):
+    """VWorld를 사용할 수 없음 (전송 오류, HTTP 오류, 응답 status ERROR)
+
+    주소를 찾지 못한 경우(None)와 구분한다. fatal이면 한도 초과/인증키 오류처럼 재시도해도
+    소용없는 오류이고, 아니면 잠시 후 재시도할 수 있는 일시 오류다. retry_after는 서버가
+    알려 준 재시도 대기 시간(초)이다.
+    """
+
+    def __init__(self, message: str, fatal: bool = False, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.fatal = fatal
+        self.retry_after = retry_after
+
+
+def _retry_after(response) -> Optional[float]:
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+def normalize_address(address: str) -> str:
+    """캐시 키용 주소 정규화 (앞뒤/중복 공백 제거)"""
+    return " ".join(address.split())
 
 
 class VWorldGeocoder:
-    """VWorld Address API를 사용한 지오코더"""
+    """VWorld Address API를 사용한 지오코더
+
+    성공한 결과는 정규화된 주소 기준 LRU 캐시에 보관하고, 영구 저장소(store)가 있으면
+    캐시 미스 시 저장소를 먼저 조회하며 새 결과를 저장소에도 기록한다.
+    """
 
-    BASE_URL = "https://api.vworld.kr/req/address"
+    DEFAULT_BASE_URL = "https://api.vworld.kr"
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_size: Optional[int] = None,
+        store: Optional[GeocodeStore] = None,
+        base_url: Optional[str] = None
+    ):
         self.api_key = os.getenv("VWORLD_API_KEY")
         if not self.api_key:
-            print("경고: VWORLD_API_KEY 환경변수가 설정되지 않았습니다. /recommend 엔드포인트가 작동하지 않을 수 있습니다.")
+            logger.warning("VWORLD_API_KEY 환경변수가 설정되지 않았습니다. /recommend 엔드포인트가 작동하지 않을 수 있습니다.")
+
+        self.cache_size = cache_size if cache_size is not None else int(
+            os.getenv("MEETPLANNER_GEOCODE_CACHE_SIZE", "10000")
+        )
+        self._cache: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        # 캐시에 새 항목이 추가될 때마다 증가 (스냅샷 저장 필요 여부 판단용)
+        self.cache_version = 0
+        # 캐시 추정 바이트 (전역 메모리 예산용)
+        self.nbytes = 0
+        # 누적 VWorld HTTP 호출 수
+        self.api_calls = 0
+        self.store = store
+        # VWorld 호스트 (로컬 스텁 서버로 교체 가능)
+        self.base_url = (base_url or os.getenv("VWORLD_BASE_URL", self.DEFAULT_BASE_URL)).rstrip("/")
+        # VWorld 호출 직전에 대기할 비동기 함수 (일괄 지오코딩의 호출 속도 제한용)
+        self.throttle: Optional[Callable[[], Awaitable[None]]] = None
+        # True이면 VWorld 장애/한도 초과를 None으로 삼키지 않고 GeocodingUnavailable로 전달
+        # (일괄 지오코딩이 "찾지 못함"과 구분해 재시도/중단하도록)
+        self.raise_unavailable = False
+        # 요청마다 새로 만들면 SSL 컨텍스트 생성(수십 ms)이 매번 이벤트 루프를 막으므로 재사용
+        self._client = None
 
     async def geocode(self, address: str) -> Optional[dict]:
         """
@@ -22,7 +99,113 @@ class VWorldGeocoder:
 
         Returns:
             {"lat": float, "lng": float} 또는 None
+
+        Raises:
+            GeocodingUnavailable: raise_unavailable이 True이고 VWorld 호출이 실패한 경우
         """
+        key = normalize_address(address)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return {"lat": cached[0], "lng": cached[1]}
+
+        # sqlite 조회/커밋은 디스크 I/O이므로 이벤트 루프를 막지 않도록 스레드에서 수행
+        if self.store is not None:
+            stored = await asyncio.to_thread(self.store.get, key)
+            if stored is not None:
+                self.remember(key, *stored)
+                return {"lat": stored[0], "lng": stored[1]}
+
+        coords = await self._lookup(address)
+        if coords is not None:
+            self.remember(key, coords["lat"], coords["lng"])
+            if self.store is not None:
+                await asyncio.to_thread(self.store.put, key, coords["lat"], coords["lng"])
+        return coords
+
+    def _http_client(self):
+        if self._client is None:
+            import httpx
+            self._client = httpx.AsyncClient()
+        return self._client
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _before_call(self) -> None:
+        """VWorld HTTP 호출 직전: 속도 제한 대기 후 호출 수 집계 (누적 + 프로파일링 중인 요청)"""
+        if self.throttle is not None:
+            await self.throttle()
+        self.api_calls += 1
+        profiling.count("vworld_calls")
+
+    async def _get_json(self, url: str, params: dict, attempt: str) -> dict:
+        """VWorld 호출 1회 (attempt: road / parcel / poi, 트레이싱 스팬 이름에 사용)"""
+        with span(f"vworld.{attempt}"):
+            await self._before_call()
+            try:
+                response = await self._http_client().get(url, params=params)
+            except Exception as e:
+                raise GeocodingUnavailable(f"VWorld 요청 실패: {e!r}") from e
+            if response.status_code >= 400:
+                raise GeocodingUnavailable(
+                    f"VWorld HTTP {response.status_code}",
+                    fatal=response.status_code in (401, 403),
+                    retry_after=_retry_after(response)
+                )
+            try:
+                data = response.json()
+            except ValueError as e:
+                raise GeocodingUnavailable(f"VWorld 응답 파싱 실패: {e}") from e
+
+            body = data.get("response", {})
+            if body.get("status") == "ERROR":
+                error = body.get("error") or {}
+                code = error.get("code", "")
+                raise GeocodingUnavailable(
+                    f"VWorld 오류 {code}: {error.get('text', '')}",
+                    fatal=code in FATAL_VWORLD_ERRORS
+                )
+            return data
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def is_cached(self, address: str) -> bool:
+        """주소의 좌표가 캐시에 있는지 확인 (LRU 순서는 바꾸지 않음)"""
+        return normalize_address(address) in self._cache
+
+    def remember(self, address: str, lat: float, lng: float) -> None:
+        """정규화된 주소의 좌표를 캐시에 저장"""
+        if address not in self._cache:
+            self.cache_version += 1
+            self.nbytes += sys.getsizeof(address) + _GEOCODE_ENTRY_BYTES
+        self._cache[address] = (lat, lng)
+        self._cache.move_to_end(address)
+        while len(self._cache) > self.cache_size:
+            self._evict_oldest()
+
+    def shrink_to(self, max_bytes: int) -> int:
+        """캐시 추정 바이트가 max_bytes 이하가 될 때까지 오래된 항목 제거 (제거한 바이트 반환)"""
+        before = self.nbytes
+        while self.nbytes > max_bytes and self._cache:
+            self._evict_oldest()
+        return before - self.nbytes
+
+    def _evict_oldest(self) -> None:
+        address, _ = self._cache.popitem(last=False)
+        self.nbytes -= sys.getsizeof(address) + _GEOCODE_ENTRY_BYTES
+
+    def hot_entries(self, limit: int) -> list[tuple[str, float, float]]:
+        """최근 사용 순으로 캐시 항목 반환 (가장 최근 항목이 마지막)"""
+        items = list(self._cache.items())[-limit:] if limit > 0 else []
+        return [(address, lat, lng) for address, (lat, lng) in items]
+
+    async def _lookup(self, address: str) -> Optional[dict]:
+        """VWorld API 조회 (도로명 -> 지번 -> POI 순)"""
         if not self.api_key:
             raise ValueError("VWORLD_API_KEY 환경변수가 설정되지 않았습니다.")
 
@@ -39,47 +222,44 @@ class VWorldGeocoder:
             "key": self.api_key
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(self.BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
+        try:
+            data = await self._get_json(f"{self.base_url}/req/address", params, "road")
 
-                # VWorld API 응답 구조 확인
-                if data.get("response", {}).get("status") == "OK":
-                    result = data["response"]["result"]
-                    if result and result.get("point"):
-                        point = result["point"]
-                        return {
-                            "lat": float(point["y"]),
-                            "lng": float(point["x"])
-                        }
+            # VWorld API 응답 구조 확인
+            if data.get("response", {}).get("status") == "OK":
+                result = data["response"]["result"]
+                if result and result.get("point"):
+                    point = result["point"]
+                    return {
+                        "lat": float(point["y"]),
+                        "lng": float(point["x"])
+                    }
 
-                # road 타입 실패시 parcel 타입으로 재시도
-                params["type"] = "parcel"
-                response = await client.get(self.BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
+            # road 타입 실패시 parcel 타입으로 재시도
+            params["type"] = "parcel"
+            data = await self._get_json(f"{self.base_url}/req/address", params, "parcel")
 
-                if data.get("response", {}).get("status") == "OK":
-                    result = data["response"]["result"]
-                    if result and result.get("point"):
-                        point = result["point"]
-                        return {
-                            "lat": float(point["y"]),
-                            "lng": float(point["x"])
-                        }
+            if data.get("response", {}).get("status") == "OK":
+                result = data["response"]["result"]
+                if result and result.get("point"):
+                    point = result["point"]
+                    return {
+                        "lat": float(point["y"]),
+                        "lng": float(point["x"])
+                    }
 
-                # 주소 API 실패시 POI 검색으로 시도 (장소명 검색)
-                return await self._search_poi(address)
+            # 주소 API 실패시 POI 검색으로 시도 (장소명 검색)
+            return await self._search_poi(address)
 
-            except Exception as e:
-                print(f"Geocoding error for '{address}': {e}")
-                return None
+        except Exception as e:
+            if self.raise_unavailable and isinstance(e, GeocodingUnavailable):
+                raise
+            logger.warning("geocoding failed", extra={"address": address, "error": str(e)})
+            return None
 
     async def _search_poi(self, query: str) -> Optional[dict]:
         """POI(관심 지점) 검색을 통한 좌표 반환"""
-        search_url = "https://api.vworld.kr/req/search"
+        search_url = f"{self.base_url}/req/search"
         params = {
             "service": "search",
             "request": "search",
@@ -93,22 +273,21 @@ class VWorldGeocoder:
             "key": self.api_key
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(search_url, params=params)
-                response.raise_for_status()
-                data = response.json()
+        try:
+            data = await self._get_json(search_url, params, "poi")
 
-                if data.get("response", {}).get("status") == "OK":
-                    items = data["response"].get("result", {}).get("items", [])
-                    if items:
-                        point = items[0].get("point", {})
-                        if point:
-                            return {
-                                "lat": float(point["y"]),
-                                "lng": float(point["x"])
-                            }
-                return None
-            except Exception as e:
-                print(f"POI search error for '{query}': {e}")
-                return None
+            if data.get("response", {}).get("status") == "OK":
+                items = data["response"].get("result", {}).get("items", [])
+                if items:
+                    point = items[0].get("point", {})
+                    if point:
+                        return {
+                            "lat": float(point["y"]),
+                            "lng": float(point["x"])
+                        }
+            return None
+        except Exception as e:
+            if self.raise_unavailable and isinstance(e, GeocodingUnavailable):
+                raise
+            logger.warning("POI search failed", extra={"query": query, "error": str(e)})
+            return None
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""이소크론 격자: 서비스 지역 격자 셀 -> 모든 후보까지의 ETA 사전 계산 테이블
+
+서비스 지역을 고정 크기 격자(기본 250m)로 나누고, 셀 중심에서 카탈로그의 모든 장소까지의
+ETA를 uint16 텐서(셀 x 장소)로 파일에 저장한다. 요청 시에는 파일을 메모리 맵으로 열어
+출발지가 속한 셀의 ETA 행을 슬라이스 하나로 읽는다 (복사 없음).
+
+빌드: python -m app.isochrone build --out isochrone.bin [--cell 250]
+"""
+
+import argparse
+import logging
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Optional
+
+from .candidates import CandidateGenerator
+from .clustering import METERS_PER_DEGREE
+from .estimator import TransitEstimator
+from .records import Coord, Place
+
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MPISO\x00\x00\x01"
+# magic, lat0, lng0, lat_step, lng_step, n_rows, n_cols, n_places, catalog_fingerprint, estimator_version
+HEADER = struct.Struct("<8sddddIII64s64s")
+HEADER_SIZE = 256
+
+# 서울 서비스 지역 (south, west, north, east)
+SEOUL_BBOX = (37.41, 126.76, 37.72, 127.19)
+
+
+def build_grid(
+    path: str,
+    places: tuple[Place, ...],
+    estimator: TransitEstimator,
+    catalog_fingerprint: str,
+    bbox: tuple[float, float, float, float] = SEOUL_BBOX,
+    cell_meters: float = 250
+) -> dict:
+    """
+    이소크론 격자 파일 생성
+
+    Args:
+        path: 출력 파일 경로
+        places: 카탈로그 장소 (place.index 순서)
+        estimator: 셀 중심 -> 장소 ETA 계산에 사용할 추정기
+        catalog_fingerprint: 카탈로그 원본 해시
+        bbox: 서비스 지역 (south, west, north, east)
+        cell_meters: 격자 셀 크기 (m)
+
+    Returns:
+        빌드 통계 {"rows", "cols", "cells", "bytes", "seconds"}
+    """
+    south, west, north, east = bbox
+    lat_step = cell_meters / METERS_PER_DEGREE
+    lng_step = cell_meters / (METERS_PER_DEGREE * math.cos(math.radians((south + north) / 2)))
+    n_rows = math.ceil((north - south) / lat_step)
+    n_cols = math.ceil((east - west) / lng_step)
+
+    started = time.perf_counter()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        header = HEADER.pack(
+            MAGIC, south, west, lat_step, lng_step, n_rows, n_cols, len(places),
+            catalog_fingerprint.encode("ascii"), estimator.version.encode("ascii")
+        )
+        f.write(header.ljust(HEADER_SIZE, b"\x00"))
+
+        for r in range(n_rows):
+            center_lat = south + (r + 0.5) * lat_step
+            for c in range(n_cols):
+                row = estimator.estimate_row(Coord(center_lat, west + (c + 0.5) * lng_step), places)
+                if sys.byteorder != "little":
+                    row.byteswap()
+                f.write(row.tobytes())
+    os.replace(tmp_path, path)
+
+    return {
+        "rows": n_rows,
+        "cols": n_cols,
+        "cells": n_rows * n_cols,
+        "bytes": os.path.getsize(path),
+        "seconds": time.perf_counter() - started,
+    }
+
+
+class IsochroneGrid:
+    """메모리 맵으로 연 이소크론 격자"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, self.lat0, self.lng0, self.lat_step, self.lng_step,
+         self.n_rows, self.n_cols, self.n_places,
+         fingerprint, version) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"'{path}' is not an isochrone grid file")
+        # 잘리거나 손상된 파일은 조회 시 IndexError/TypeError가 나므로 헤더 크기와 대조해 거부
+        expected = HEADER_SIZE + self.n_rows * self.n_cols * self.n_places * 2
+        if len(self._mmap) != expected or self.lat_step <= 0 or self.lng_step <= 0:
+            size = len(self._mmap)
+            self._mmap.close()
+            raise ValueError(f"'{path}' size {size} does not match its header (expected {expected} bytes)")
+
+        self.catalog_fingerprint = fingerprint.rstrip(b"\x00").decode("ascii")
+        self.estimator_version = version.rstrip(b"\x00").decode("ascii")
+        self._etas = memoryview(self._mmap)[HEADER_SIZE:].cast("H")
+
+    @classmethod
+    def open_compatible(
+        cls,
+        path: str,
+        catalog_fingerprint: str,
+        estimator: TransitEstimator
+    ) -> Optional["IsochroneGrid"]:
+        """카탈로그/추정기 버전이 일치할 때만 격자를 연다 (없거나 불일치하면 None)"""
+        if not path or not os.path.exists(path) or sys.byteorder != "little":
+            return None
+        try:
+            grid = cls(path)
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning("isochrone grid load error", extra={"path": path, "error": repr(e)})
+            return None
+        if grid.catalog_fingerprint != catalog_fingerprint or grid.estimator_version != estimator.version:
+            grid.close()
+            return None
+        return grid
+
+    def row(self, coord: Coord) -> Optional[memoryview]:
+        """출발지가 속한 셀의 ETA 행 (카탈로그 순서, 서비스 지역 밖이면 None)"""
+        r = math.floor((coord.lat - self.lat0) / self.lat_step)
+        c = math.floor((coord.lng - self.lng0) / self.lng_step)
+        if not (0 <= r < self.n_rows and 0 <= c < self.n_cols):
+            return None
+        offset = (r * self.n_cols + c) * self.n_places
+        return self._etas[offset:offset + self.n_places]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._mmap)
+
+    def close(self) -> None:
+        self._etas.release()
+        self._mmap.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MeetPlanner isochrone grid builder")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="build an isochrone grid for the Seoul catalog")
+    build.add_argument("--out", required=True, help="output file path")
+    build.add_argument("--cell", type=float, default=250, help="cell size in metres")
+    args = parser.parse_args()
+
+    candidate_generator = CandidateGenerator()
+    stats = build_grid(
+        args.out,
+        candidate_generator.places,
+        TransitEstimator(),
+        candidate_generator.catalog_fingerprint(),
+        cell_meters=args.cell
+    )
+    print(
+        f"built {args.out}: {stats['rows']}x{stats['cols']} cells x {len(candidate_generator.places)} places, "
+        f"{stats['bytes'] / 1024 / 1024:.1f} MiB in {stats['seconds']:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
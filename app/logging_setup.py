@@ -0,0 +1,94 @@
+"""큐 기반 비동기 구조화 로깅
+
+요청 경로(이벤트 루프)에서는 로그 레코드를 큐에 넣기만 하고, 포매팅과 stderr 출력은
+QueueListener의 백그라운드 스레드가 수행한다. 레코드에는 큐에 넣는 시점의 요청 ID와
+트레이스 ID가 함께 기록된다.
+
+    MEETPLANNER_LOG_LEVEL   로그 레벨 (기본 INFO)
+    MEETPLANNER_LOG_FORMAT  json(기본) 또는 text
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from typing import Optional
+
+import orjson
+
+from . import tracing
+
+
+# 앱 모듈 로거(app.*)의 공통 부모
+ROOT_LOGGER = "app"
+
+# LogRecord 기본 속성 (이외의 속성은 extra로 전달된 구조화 필드로 취급)
+_RESERVED = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _ContextFilter(logging.Filter):
+    """큐에 넣기 전(호출 스레드/태스크)에 요청 ID와 트레이스 ID를 레코드에 기록"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = tracing.current_request_id()
+        record.trace_id = tracing.current_trace_id()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포매터 (extra 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED and value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode("utf-8")
+
+
+def setup_logging(level: Optional[str] = None, fmt: Optional[str] = None) -> None:
+    """app.* 로거를 큐 핸들러로 연결하고 백그라운드 출력 스레드 시작 (중복 호출 시 무시)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    level = level or os.getenv("MEETPLANNER_LOG_LEVEL", "INFO")
+    fmt = fmt or os.getenv("MEETPLANNER_LOG_FORMAT", "json")
+
+    output = logging.StreamHandler(sys.stderr)
+    if fmt == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"
+        ))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.addFilter(_ContextFilter())
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.setLevel(level.upper())
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 레코드를 모두 출력하고 백그라운드 스레드 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
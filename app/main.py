@@ -1,25 +1,78 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import json
+import logging
 import os
-from fastapi import FastAPI, HTTPException, Request
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Optional
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 
-from .models import RecommendRequest, RecommendResponse, HealthResponse, Recommendation, FairnessScore, PurposeScore
-from .geocoder import VWorldGeocoder
+from .models import (
+    RecommendRequest, RecommendResponse, HealthResponse,
+    SessionCreateRequest, ParticipantOrigin, SessionResponse
+)
+from .geocoder import VWorldGeocoder, normalize_address
+from .geocode_store import GeocodeStore
 from .candidates import CandidateGenerator
+from .clustering import eta_distribution, grid_clusters
 from .estimator import TransitEstimator
+from .eta_cache import EtaRowCache
 from .scoring import Scoring
 from .explanation import ExplanationGenerator
+from .map_generator import MapGenerator, MapStore
+from .memory import MemoryBudget
+from .popularity import CachePrewarmer, PopularityTracker
+from .profiling import RequestProfiler
+from .logging_setup import setup_logging, shutdown_logging
+from .tracing import span
+from . import profiling, tracing
+from .isochrone import IsochroneGrid
+from .records import Coord, EtaRow, RankedResult, ScoredCandidate, eta_row
+from .regions import RegionRouter, RegionShard
+from .result_cache import RecommendationCache, ranking_key
+from .session import MeetingSession, SessionStore
+from .snapshot import WarmStateSnapshot
 from .mcp.handler import MCPHandler
 
 load_dotenv()
+setup_logging()
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """부팅 시 웜 스테이트 스냅샷을 불러오고 백그라운드 작업(스냅샷 저장, 캐시 프리워밍) 실행"""
+    snapshot.load()
+    memory_budget.enforce()
+    tracing.tracer.start()
+    tasks = []
+    if snapshot.enabled:
+        tasks.append(asyncio.create_task(snapshot.run_periodic()))
+    if prewarmer.enabled:
+        tasks.append(asyncio.create_task(prewarmer.run_periodic()))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        snapshot.save()
+        await geocoder.aclose()
+        tracing.tracer.shutdown()
+        shutdown_logging()
+
 
 app = FastAPI(
     title="MeetPlanner MCP",
     description="여러 사용자의 출발 위치와 만남 목적을 입력받아 최적의 만남 장소를 추천하는 MCP 서버",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -30,82 +83,513 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-geocoder = VWorldGeocoder()
+@app.middleware("http")
+async def request_context(request: Request, call_next):
+    """요청 ID 설정(X-Request-Id 헤더를 이어받거나 새로 생성) 및 요청 단위 루트 스팬"""
+    request_id = tracing.begin_request(request.headers.get(tracing.REQUEST_ID_HEADER))
+    if tracing.tracer.enabled:
+        with tracing.tracer.span("http.request", kind=tracing.SPAN_KIND_SERVER) as root:
+            root.set_attribute("request.id", request_id)
+            root.set_attribute("http.method", request.method)
+            root.set_attribute("http.target", request.url.path)
+            response = await call_next(request)
+            root.set_attribute("http.status_code", response.status_code)
+    else:
+        response = await call_next(request)
+    response.headers["X-Request-Id"] = request_id
+    # 요청 중 캐시가 커졌으면 전역 메모리 예산에 맞게 줄임 (캐시 수만큼의 합산만 수행)
+    memory_budget.enforce()
+    return response
+
+
+geocoder = VWorldGeocoder(store=GeocodeStore.open(os.getenv("MEETPLANNER_GEOCODE_DB", "")))
 candidate_generator = CandidateGenerator()
 estimator = TransitEstimator()
 scoring = Scoring()
 explanation_generator = ExplanationGenerator()
+session_store = SessionStore()
+map_store = MapStore(MapGenerator())
+snapshot = WarmStateSnapshot(geocoder, explanation_generator)
+isochrone_grid = IsochroneGrid.open_compatible(
+    os.getenv("MEETPLANNER_ISOCHRONE_PATH", ""), candidate_generator.catalog_fingerprint(), estimator
+)
+region_router = RegionRouter(candidate_generator, estimator)
+eta_row_cache = EtaRowCache()
+result_cache = RecommendationCache()
+popularity = PopularityTracker()
+profiler = RequestProfiler()
+
+# 메모리 집계 (제거 가능한 캐시는 전역 예산 적용 대상)
+memory_budget = MemoryBudget()
+memory_budget.register_cache("geocode", geocoder)
+memory_budget.register_cache("results", result_cache)
+memory_budget.register_cache("eta_rows", eta_row_cache)
+memory_budget.register_cache("maps", map_store)
+memory_budget.register_component("sessions", session_store.nbytes)
+memory_budget.register_component("catalogs", lambda: sum(region_router.catalog_nbytes().values()))
+memory_budget.register_component("popularity", popularity.nbytes)
+
+# 대규모 모임 모드의 동시 지오코딩 수
+GEOCODE_CONCURRENCY = int(os.getenv("MEETPLANNER_GEOCODE_CONCURRENCY", "8"))
+
+# deadline_ms 모드: 지오코딩 이후 점수 계산과 응답 생성용으로 남겨 두는 시간, 1차(coarse) 단계의 후보 수
+ANYTIME_RESERVE_MS = int(os.getenv("MEETPLANNER_ANYTIME_RESERVE_MS", "20"))
+ANYTIME_COARSE_CANDIDATES = int(os.getenv("MEETPLANNER_ANYTIME_COARSE_CANDIDATES", "10"))
+
+# 마감 시각 이후에도 계속되는 지오코딩 작업 (끝나면 캐시에 남음)
+_background_geocodes: set[asyncio.Task] = set()
 
 
 # ============================================================
 # 핵심 추천 로직 (REST API와 MCP에서 공유)
 # ============================================================
-async def recommend_logic(participants: list, purpose: str = "cafe_talk") -> dict:
-    """추천 로직 (내부 함수)"""
+async def recommend_logic(
+    participants: list,
+    purpose: str = "cafe_talk",
+    include_explanations: bool = True,
+    include_map: bool = False,
+    fairness_metric: str = "std",
+    large_group: bool = False,
+    include_participant_etas: bool = False,
+    deadline_ms: Optional[int] = None
+) -> dict:
+    """추천 로직 (내부 함수)
+
+    large_group이면 출발지를 클러스터로 묶어 계산하고, 참가자별 ETA 대신 ETA 분포를 반환한다
+    (include_participant_etas이면 최종 상위 후보에 한해 참가자별 ETA도 포함).
+
+    deadline_ms가 있으면 그 시간 안에 얻은 가장 좋은 결과를 반환하고, 응답의 complete로
+    전체 계산 결과인지(True) 근사 결과인지(False, approximation에 단계와 제외된 참가자) 알린다.
+    """
+    started = time.monotonic()
     if len(participants) < 2:
         raise ValueError("최소 2명 이상의 참가자가 필요합니다.")
+    if deadline_ms is not None and deadline_ms <= 0:
+        raise ValueError("deadline_ms는 1 이상이어야 합니다.")
+    deadline = started + deadline_ms / 1000 if deadline_ms is not None else None
+    if fairness_metric not in scoring.FAIRNESS_PENALTIES:
+        raise ValueError(
+            f"지원하지 않는 공정성 지표입니다: '{fairness_metric}' "
+            f"(지원: {', '.join(scoring.FAIRNESS_PENALTIES)})"
+        )
 
-    # 1. 지오코딩
-    participant_coords = {}
+    # 참가자별 정규화된 출발지 (같은 이름은 마지막 값 사용)
+    participant_origins: dict[str, str] = {}
     for p in participants:
         name = p.get("name") if isinstance(p, dict) else p.name
         origin_text = p.get("origin_text") if isinstance(p, dict) else p.origin_text
+        participant_origins[name] = normalize_address(origin_text)
 
-        coords = await geocoder.geocode(origin_text)
-        if coords is None:
-            raise ValueError(f"'{origin_text}' 주소를 찾을 수 없습니다.")
-        participant_coords[name] = coords
+    origins = list(participant_origins.values())
+    prewarmer.touch()
+
+    stage = "full"
+    if large_group:
+        coords, result = await recommend_large_group(
+            participant_origins, purpose, include_explanations, fairness_metric, include_participant_etas, deadline
+        )
+    else:
+        key = ranking_key(origins, purpose, fairness_metric)
+        popularity.record(key[0], purpose)
 
-    # 2. 후보 장소 생성
-    candidates = candidate_generator.generate(list(participant_coords.values()))
+        # 1~5. 출발지 조합 + 목적 단위 순위 계산 (캐시)
+        if deadline is None:
+            ranked = await rank_origins(origins, purpose, fairness_metric)
+        else:
+            ranked, stage = await rank_origins_anytime(origins, purpose, fairness_metric, deadline)
+        coords = ranked.coords
 
-    # 3. 각 후보에 대해 ETA 계산
+        # 6. 추천 결과 생성 (참가자 이름은 여기서 연결, 마감까지 지오코딩되지 않은 참가자는 제외)
+        names = [name for name, origin in participant_origins.items() if origin in coords]
+        eta_rows = [ranked.rows[participant_origins[name]] for name in names]
+        with span("recommendations"):
+            result = {"recommendations": build_recommendations(
+                ranked.top, names, eta_rows, purpose, include_explanations
+            )}
+
+    # 7. 지도 요청 시 GeoJSON을 결과 해시로 저장하고 경로만 반환
+    if include_map:
+        with span("map"):
+            map_id = map_store.put(
+                result["recommendations"],
+                {
+                    name: {"lat": coords[origin].lat, "lng": coords[origin].lng}
+                    for name, origin in participant_origins.items() if origin in coords
+                }
+            )
+        result["map_url"] = f"/map/{map_id}"
+
+    if deadline is not None:
+        unresolved = [name for name, origin in participant_origins.items() if origin not in coords]
+        result["complete"] = stage == "full" and not unresolved
+        if not result["complete"]:
+            profiling.count("anytime_approximate")
+            result["approximation"] = {"stage": stage, "unresolved_participants": unresolved}
+
+    return result
+
+
+async def geocode_origins(origins, concurrency: int = 1, deadline: Optional[float] = None) -> dict[str, Coord]:
+    """
+    정규화된 출발지들을 좌표로 변환 (같은 출발지는 한 번만)
+
+    Args:
+        origins: 정규화된 출발지 목록 (중복 가능)
+        concurrency: 동시 지오코딩 수
+        deadline: 지정 시 이 시각(time.monotonic)까지 끝난 출발지만 반환. 끝나지 않은 출발지는
+            백그라운드에서 계속 지오코딩되어 캐시에 남으므로 다음 요청에서 바로 사용된다
+    """
+    unique = list(dict.fromkeys(origins))
+    if concurrency > 1:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def resolve(origin: str):
+            async with semaphore:
+                return await geocoder.geocode(origin)
+
+        if deadline is not None:
+            tasks = [asyncio.ensure_future(resolve(origin)) for origin in unique]
+            await asyncio.wait(tasks, timeout=max(0.0, deadline - time.monotonic()))
+            for task in tasks:
+                if not task.done():
+                    _background_geocodes.add(task)
+                    task.add_done_callback(_finish_background_geocode)
+            pairs = [(origin, task.result()) for origin, task in zip(unique, tasks) if task.done()]
+        else:
+            pairs = zip(unique, await asyncio.gather(*(resolve(origin) for origin in unique)))
+    else:
+        pairs = [(origin, await geocoder.geocode(origin)) for origin in unique]
+
+    coords: dict[str, Coord] = {}
+    for origin, resolved in pairs:
+        if resolved is None:
+            raise ValueError(f"'{origin}' 주소를 찾을 수 없습니다.")
+        coords[origin] = Coord(resolved["lat"], resolved["lng"])
+    return coords
+
+
+def _finish_background_geocode(task: asyncio.Task) -> None:
+    _background_geocodes.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("background geocode failed", extra={"error": repr(task.exception())})
+
+
+def origin_eta_row(coord: Coord, shard: RegionShard) -> EtaRow:
+    """출발지 -> 샤드 카탈로그 전체 ETA 행
+
+    수도권은 이소크론 격자가 있으면 슬라이스 조회, 그 외에는 출발지 셀 단위 ETA 행 캐시에서 조회/계산.
+    """
+    if isochrone_grid is not None and shard.generator is candidate_generator:
+        row = isochrone_grid.row(coord)
+        if row is not None:
+            return row
+    return eta_row_cache.row(shard.region, coord, shard.estimator, shard.generator.places)
+
+
+def score_candidates(
+    candidates: list,
+    fairness_by_col: dict,
+    purpose: str,
+    fairness_metric: str,
+    limit: int = 5
+) -> list[ScoredCandidate]:
+    """후보별 공정성 지표(카탈로그 열 -> 지표, candidate_fairness 참고)와 목적 적합도로 종합 점수를 매겨 상위 후보 반환"""
     scored_candidates = []
     for candidate in candidates:
-        eta_by_participant = {}
-        for name, coords in participant_coords.items():
-            eta = estimator.estimate(coords, candidate)
-            eta_by_participant[name] = eta
-
-        # 4. 공정성 및 목적 적합도 점수 계산
-        fairness = scoring.calculate_fairness(list(eta_by_participant.values()))
+        col = candidate.index
+        fairness = fairness_by_col[col]
         purpose_score = scoring.calculate_purpose_score(candidate, purpose)
-        total_score = scoring.calculate_total_score(fairness, purpose_score)
-
-        scored_candidates.append({
-            "candidate": candidate,
-            "eta_by_participant": eta_by_participant,
-            "fairness": fairness,
-            "purpose_score": purpose_score,
-            "total_score": total_score
-        })
+        total_score = scoring.calculate_total_score(fairness, purpose_score, fairness_metric)
+
+        scored_candidates.append(ScoredCandidate(
+            place=candidate,
+            col=col,
+            fairness=fairness,
+            purpose_score=purpose_score,
+            total_score=total_score
+        ))
+
+    # 점수 기준 정렬 및 상위 후보 선택
+    scored_candidates.sort(key=lambda x: x.total_score, reverse=True)
+    return scored_candidates[:limit]
+
+
+def candidate_fairness(candidates: list, eta_rows: list, weights: Optional[list[int]] = None) -> dict:
+    """
+    후보 열에 대해서만 공정성 지표 계산 (열 -> 지표, 전체 표의 같은 열과 같은 값)
+
+    ETA 행은 카탈로그 전체 길이이지만 점수를 매기는 것은 후보(최대 50개)뿐이므로,
+    카탈로그 크기와 무관하게 후보 수에 비례하는 비용만 든다.
+
+    Args:
+        candidates: 점수를 매길 후보 장소
+        eta_rows: 출발지(또는 대표 지점)별 카탈로그 전체 ETA 행
+        weights: 대표 지점별 참가자 수 (대규모 모임 모드, 없으면 가중치 없음)
+    """
+    if weights is None:
+        return {
+            candidate.index: scoring.calculate_fairness([row[candidate.index] for row in eta_rows])
+            for candidate in candidates
+        }
+    return {
+        candidate.index: scoring.calculate_weighted_fairness([row[candidate.index] for row in eta_rows], weights)
+        for candidate in candidates
+    }
+
+
+async def rank_origins(origins: list[str], purpose: str, fairness_metric: str = "std") -> RankedResult:
+    """
+    출발지 조합과 목적에 대한 상위 후보 계산 (참가자 이름과 무관하므로 결과 캐시 사용)
+
+    Args:
+        origins: 참가자별 정규화된 출발지 (중복 가능)
+        purpose: 만남 목적
+        fairness_metric: 종합 점수에 사용할 공정성 지표
+    """
+    key = ranking_key(origins, purpose, fairness_metric)
+    cached = result_cache.get(key)
+    if cached is not None:
+        profiling.count("result_cache_hits")
+        return cached
+
+    # 1. 지오코딩 (같은 출발지는 한 번만)
+    with span("geocode"):
+        coords = await geocode_origins(origins)
+
+    # 캐시 키와 같은 순서(정렬)로 계산해 캐시 여부와 무관하게 같은 결과를 보장
+    sorted_origins = key[0]
+
+    # 2. 지역 샤드 선택 및 후보 장소 생성
+    origin_coords = [coords[origin] for origin in sorted_origins]
+    with span("candidates"):
+        shard = region_router.route(origin_coords)
+        candidates = shard.generator.generate(origin_coords)
+
+    # 3. 출발지별 ETA 행 (출발지 x 샤드 카탈로그 행렬)
+    with span("eta_rows"):
+        rows = {origin: origin_eta_row(coord, shard) for origin, coord in coords.items()}
+    eta_rows = [rows[origin] for origin in sorted_origins]
+
+    # 4~5. 후보 열의 공정성 및 목적 적합도 점수 계산 후 상위 5개 선택
+    with span("scoring"):
+        top = score_candidates(candidates, candidate_fairness(candidates, eta_rows), purpose, fairness_metric)
+
+    ranked = RankedResult(coords=coords, rows=rows, top=top)
+    result_cache.put(key, ranked)
+    return ranked
+
+
+async def rank_origins_anytime(
+    origins: list[str],
+    purpose: str,
+    fairness_metric: str,
+    deadline: float
+) -> tuple[RankedResult, str]:
+    """
+    마감 시각까지 얻은 가장 좋은 순위 결과와 단계("full" / "coarse") 반환
+
+    1. 지오코딩은 마감 ANYTIME_RESERVE_MS 전까지만 기다린다 (끝나지 않은 출발지는 결과에서 제외)
+    2. coarse: 중심점에 가까운 후보 일부만 출발지 좌표에서 직접 ETA를 계산해 점수화
+    3. full: 남은 시간 안에 출발지별 카탈로그 ETA 행을 모두 얻으면 rank_origins와 같은 결과로 교체.
+       다음 행의 예상 계산 시간(coarse 단계의 ETA 1회 시간 x 카탈로그 크기)과 전체 후보 점수 계산의 예상 시간이
+       남은 시간보다 길면 중단한다
+
+    모든 출발지로 full 단계까지 끝난 결과만 결과 캐시에 저장한다.
+
+    Args:
+        origins: 참가자별 정규화된 출발지 (중복 가능)
+        purpose: 만남 목적
+        fairness_metric: 종합 점수에 사용할 공정성 지표
+        deadline: 마감 시각 (time.monotonic 기준)
+    """
+    key = ranking_key(origins, purpose, fairness_metric)
+    cached = result_cache.get(key)
+    if cached is not None:
+        profiling.count("result_cache_hits")
+        return cached, "full"
+
+    # 1. 지오코딩 (마감 전 예약 시간까지)
+    with span("geocode"):
+        coords = await geocode_origins(
+            origins, concurrency=GEOCODE_CONCURRENCY, deadline=deadline - ANYTIME_RESERVE_MS / 1000
+        )
+    resolved = [origin for origin in key[0] if origin in coords]
+    if len(resolved) < 2:
+        raise TimeoutError("deadline_ms 안에 2명 이상의 출발지를 지오코딩하지 못했습니다.")
+
+    # 2. 지역 샤드 선택 및 후보 장소 생성 (중심점에서 가까운 순)
+    origin_coords = [coords[origin] for origin in resolved]
+    with span("candidates"):
+        shard = region_router.route(origin_coords)
+        candidates = shard.generator.generate(origin_coords)
+    n_places = len(shard.generator.places)
+
+    # 3. coarse: 가까운 후보만 직접 계산 (나머지 열은 0인 카탈로그 길이 행)
+    with span("coarse"):
+        coarse = candidates[:ANYTIME_COARSE_CANDIDATES]
+        coarse_started = time.monotonic()
+        coarse_rows = {}
+        for origin, coord in coords.items():
+            row = eta_row((0,)) * n_places
+            for place in coarse:
+                row[place.index] = shard.estimator.estimate(coord, place)
+            coarse_rows[origin] = row
+        estimate_s = (time.monotonic() - coarse_started) / max(1, len(coords) * len(coarse))
+        best = RankedResult(coords=coords, rows=coarse_rows, top=score_candidates(
+            coarse, candidate_fairness(coarse, [coarse_rows[origin] for origin in resolved]), purpose, fairness_metric
+        ))
+        coarse_s = time.monotonic() - coarse_started
+
+    # 4. full: 출발지별 카탈로그 전체 ETA 행 (마감 전에 끝나지 않을 것 같으면 coarse 결과 반환)
+    with span("refine"):
+        # 행 하나의 예상 시간, 행을 모두 얻은 뒤 전체 후보 점수 계산의 예상 시간 (coarse 단계 기준으로 환산)
+        row_s = estimate_s * n_places
+        finish_by = deadline - coarse_s * len(candidates) / max(1, len(coarse))
+        rows = {}
+        for origin, coord in coords.items():
+            if time.monotonic() + row_s > finish_by:
+                return best, "coarse"
+            rows[origin] = origin_eta_row(coord, shard)
+        top = score_candidates(
+            candidates, candidate_fairness(candidates, [rows[origin] for origin in resolved]), purpose, fairness_metric
+        )
+
+    ranked = RankedResult(coords=coords, rows=rows, top=top)
+    if len(resolved) == len(origins):
+        result_cache.put(key, ranked)
+    return ranked, "full"
+
+
+async def warm_ranking(origins: tuple[str, ...], purpose: str) -> bool:
+    """프리워밍용: 캐시에 없는 (출발지 조합, 목적)의 순위를 미리 계산"""
+    if ranking_key(origins, purpose) in result_cache:
+        return False
+    await rank_origins(list(origins), purpose)
+    memory_budget.enforce()
+    return True
+
+
+async def recommend_large_group(
+    participant_origins: dict[str, str],
+    purpose: str,
+    include_explanations: bool,
+    fairness_metric: str,
+    include_participant_etas: bool,
+    deadline: Optional[float] = None
+) -> tuple[dict[str, Coord], dict]:
+    """
+    대규모 모임 추천: 출발지를 격자 클러스터로 묶어 가중 대표 지점 기준으로 점수 계산
+
+    deadline이 있으면 마감 ANYTIME_RESERVE_MS 전까지 지오코딩된 참가자만으로 계산한다.
+
+    Returns:
+        (출발지 좌표, 응답 dict)
+    """
+    # 1. 지오코딩 (중복 제거 + 동시 처리)
+    with span("geocode"):
+        coords = await geocode_origins(
+            Counter(participant_origins.values()),
+            concurrency=GEOCODE_CONCURRENCY,
+            deadline=deadline - ANYTIME_RESERVE_MS / 1000 if deadline is not None else None
+        )
+    if deadline is not None:
+        participant_origins = {name: origin for name, origin in participant_origins.items() if origin in coords}
+        if len(participant_origins) < 2:
+            raise TimeoutError("deadline_ms 안에 2명 이상의 출발지를 지오코딩하지 못했습니다.")
+    origins = list(participant_origins.values())
+    weights = Counter(origins)
+
+    # 2. 출발지 클러스터링, 지역 샤드 선택 및 후보 장소 생성
+    origin_coords = [coords[origin] for origin in origins]
+    with span("candidates"):
+        clusters = grid_clusters(coords, weights)
+        cluster_weights = [cluster.weight for cluster in clusters]
+        shard = region_router.route(origin_coords)
+        candidates = shard.generator.generate(origin_coords)
+
+    # 3. 클러스터 대표 지점별 ETA 행 (클러스터 x 샤드 카탈로그 행렬)
+    with span("eta_rows"):
+        eta_rows = [origin_eta_row(cluster.coord, shard) for cluster in clusters]
+
+    # 4~5. 가중 공정성 및 목적 적합도 점수 계산 후 상위 5개 선택
+    with span("scoring"):
+        top = score_candidates(
+            candidates,
+            candidate_fairness(candidates, eta_rows, cluster_weights),
+            purpose,
+            fairness_metric
+        )
+
+    # 6. 추천 결과 생성 (참가자별 ETA 대신 분포 요약)
+    recommendations = []
+    with span("recommendations"):
+        for rank, item in enumerate(top, 1):
+            etas = {}
+            if include_participant_etas:
+                # 최종 상위 후보에 한해 참가자 본인 좌표로 정확한 ETA 계산
+                etas["eta_by_participant"] = {
+                    name: shard.estimator.estimate(coords[origin], item.place)
+                    for name, origin in participant_origins.items()
+                }
+            etas["eta_distribution"] = eta_distribution(
+                [row[item.col] for row in eta_rows], cluster_weights
+            )
+            recommendations.append(_recommendation(rank, item, purpose, include_explanations, **etas))
+
+    return coords, {
+        "recommendations": recommendations,
+        "group": {
+            "participants": len(participant_origins),
+            "origins": len(coords),
+            "clusters": len(clusters)
+        }
+    }
+
 
-    # 5. 점수 기준 정렬 및 상위 5개 선택
-    scored_candidates.sort(key=lambda x: x["total_score"], reverse=True)
-    top_candidates = scored_candidates[:5]
+def _recommendation(
+    rank: int,
+    item: ScoredCandidate,
+    purpose: str,
+    include_explanations: bool,
+    **etas
+) -> dict:
+    """추천 항목 dict (etas: eta_by_participant / eta_distribution 등 ETA 필드)"""
+    recommendation = {
+        "rank": rank,
+        "label": item.place.label,
+        "lat": item.place.lat,
+        "lng": item.place.lng,
+        **etas,
+        "fairness": {"std": item.fairness.std, "mean": item.fairness.mean},
+        "purpose": {"score": item.purpose_score}
+    }
+    if include_explanations:
+        with span("explanation"):
+            recommendation["why"] = explanation_generator.generate(item.place, item.fairness, purpose)
+    return recommendation
 
-    # 6. 추천 결과 생성
+
+def build_recommendations(
+    top_candidates: list[ScoredCandidate],
+    names: list[str],
+    eta_rows: list,
+    purpose: str,
+    include_explanations: bool = True
+) -> list[dict]:
+    """상위 후보를 응답 dict로 변환 (API 경계: 여기서만 dict로 변환)
+
+    설명(why)은 include_explanations가 True일 때만 생성한다.
+    """
     recommendations = []
     for rank, item in enumerate(top_candidates, 1):
-        why = explanation_generator.generate(
-            item["candidate"],
-            item["eta_by_participant"],
-            item["fairness"],
-            purpose
-        )
-        recommendations.append({
-            "rank": rank,
-            "label": item["candidate"]["label"],
-            "lat": item["candidate"]["lat"],
-            "lng": item["candidate"]["lng"],
-            "eta_by_participant": item["eta_by_participant"],
-            "fairness": {"std": item["fairness"]["std"], "mean": item["fairness"]["mean"]},
-            "purpose": {"score": item["purpose_score"]},
-            "why": why
-        })
+        recommendations.append(_recommendation(
+            rank, item, purpose, include_explanations,
+            eta_by_participant={name: row[item.col] for name, row in zip(names, eta_rows)}
+        ))
+    return recommendations
 
-    return {"recommendations": recommendations}
 
+prewarmer = CachePrewarmer(popularity, geocoder, warm_ranking)
 
 # MCP Handler 초기화
 mcp_handler = MCPHandler(recommend_logic)
@@ -134,31 +618,237 @@ async def get_mcp_spec():
     raise HTTPException(status_code=404, detail="mcp.json not found")
 
 
+async def _run_profiled(http_request: Request, endpoint: str, call) -> tuple:
+    """프로파일링 대상 요청이면 프로파일을 수집해 (결과, 프로파일 ID), 아니면 (결과, None) 반환"""
+    profile = profiler.begin(http_request.headers, http_request.query_params, endpoint)
+    if profile is None:
+        return await call(), None
+    try:
+        with profile:
+            result = await call()
+    finally:
+        # 실패한 요청이 가장 살펴볼 가치가 있으므로 예외가 나도 보관 (오류 응답에는 헤더가 없으므로 ID는 로그로 남김)
+        profile_id = await profiler.store(profile)
+        if profile.error is not None:
+            logger.warning(
+                "profiled request failed",
+                extra={"profile_id": profile_id, "endpoint": endpoint, "error": profile.error}
+            )
+    return result, profile_id
+
+
+def _json_response(content) -> Response:
+    """dict를 orjson으로 바로 직렬화한 JSON 응답
+
+    (ORJSONResponse는 현재 FastAPI에서 deprecated이고, response_model 경로는 Pydantic 재검증 비용이 듦)
+    """
+    return Response(content=orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS), media_type="application/json")
+
+
+def _profiled_response(content, profile_id) -> Response:
+    response = _json_response(content)
+    if profile_id is not None:
+        response.headers["X-Profile-Id"] = profile_id
+    return response
+
+
 @app.post("/recommend", response_model=RecommendResponse)
-async def recommend(request: RecommendRequest):
+async def recommend(request: RecommendRequest, http_request: Request):
     """REST API: 만남 장소 추천"""
     try:
-        result = await recommend_logic(
+        result, profile_id = await _run_profiled(http_request, "/recommend", lambda: recommend_logic(
             [{"name": p.name, "origin_text": p.origin_text} for p in request.participants],
-            request.purpose
+            request.purpose,
+            request.include_explanations,
+            request.include_map,
+            request.fairness_metric,
+            request.large_group,
+            request.include_participant_etas,
+            request.deadline_ms
+        ))
+        # recommend_logic 결과는 이미 응답 스키마와 동일한 형태이므로
+        # Pydantic 모델 재구성/재검증 없이 orjson으로 바로 직렬화
+        # (response_model은 OpenAPI 문서용으로만 유지)
+        return _profiled_response(result, profile_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except TimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+
+
+@app.get("/metrics")
+async def metrics():
+    """메모리 사용량(구성 요소별 추정 바이트, 예산, RSS)과 캐시 상태"""
+    memory = memory_budget.report()
+    memory["catalogs_by_region"] = region_router.catalog_nbytes()
+    memory["isochrone_mapped_bytes"] = isochrone_grid.nbytes if isochrone_grid is not None else 0
+    return _json_response({
+        "memory": memory,
+        "caches": {
+            "geocode": {"entries": len(geocoder), "vworld_calls": geocoder.api_calls},
+            "results": {"entries": len(result_cache)},
+            "eta_rows": {"entries": len(eta_row_cache), "hits": eta_row_cache.hits, "misses": eta_row_cache.misses},
+            "maps": {"entries": len(map_store)},
+        },
+        "sessions": len(session_store),
+        "regions_loaded": region_router.loaded_regions(),
+    })
+
+
+# ============================================================
+# Map (content-addressed GeoJSON + 정적 페이지)
+# ============================================================
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _conditional_response(request: Request, body: bytes, etag: str, media_type: str) -> Response:
+    """If-None-Match가 ETag와 일치하면 304, 아니면 본문 반환"""
+    headers = {"ETag": etag, "Cache-Control": _IMMUTABLE_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match == "*" or etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+@app.get("/map/{map_id}.geojson")
+async def get_map_geojson(map_id: str, request: Request):
+    """추천 결과 마커 데이터 (GeoJSON, map_id = 내용 해시)"""
+    body = map_store.get(map_id)
+    if body is None:
+        raise HTTPException(status_code=404, detail="지도 결과를 찾을 수 없거나 만료되었습니다.")
+    return _conditional_response(request, body, f'"{map_id}"', "application/geo+json")
+
+
+@app.get("/map/{map_id}")
+async def get_map_page(map_id: str, request: Request):
+    """추천 결과 지도 페이지 (모든 결과가 공유하는 정적 HTML)"""
+    if map_store.get(map_id) is None:
+        raise HTTPException(status_code=404, detail="지도 결과를 찾을 수 없거나 만료되었습니다.")
+    generator = map_store.generator
+    return _conditional_response(
+        request, generator.page_html(), generator.page_etag(), "text/html; charset=utf-8"
+    )
+
+
+# ============================================================
+# Session API (참가자 증분 변경)
+# ============================================================
+async def _resolve_origin(origin_text: str) -> Coord:
+    """출발지 텍스트를 좌표로 변환"""
+    coords = await geocoder.geocode(origin_text)
+    if coords is None:
+        raise ValueError(f"'{origin_text}' 주소를 찾을 수 없습니다.")
+    return Coord(coords["lat"], coords["lng"])
+
+
+def _get_session(session_id: str) -> MeetingSession:
+    session = session_store.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없거나 만료되었습니다.")
+    return session
+
+
+def _session_payload(session: MeetingSession, include_explanations: bool = True) -> dict:
+    """세션의 현재 추천 결과 (참가자 2명 미만이면 빈 추천)"""
+    recommendations = []
+    if len(session) >= 2:
+        recommendations = build_recommendations(
+            session.rank(scoring),
+            list(session.rows),
+            list(session.rows.values()),
+            session.purpose,
+            include_explanations
         )
-        # Pydantic 모델로 변환
-        recommendations = []
-        for r in result["recommendations"]:
-            recommendations.append(Recommendation(
-                rank=r["rank"],
-                label=r["label"],
-                lat=r["lat"],
-                lng=r["lng"],
-                eta_by_participant=r["eta_by_participant"],
-                fairness=FairnessScore(std=r["fairness"]["std"], mean=r["fairness"]["mean"]),
-                purpose=PurposeScore(score=r["purpose"]["score"]),
-                why=r["why"]
-            ))
-        return RecommendResponse(recommendations=recommendations)
+    return {
+        "session_id": session.session_id,
+        "participants": list(session.rows),
+        "recommendations": recommendations
+    }
+
+
+@app.post("/sessions", response_model=SessionResponse)
+async def create_session(request: SessionCreateRequest):
+    """세션 생성 (초기 참가자는 선택)"""
+    try:
+        resolved = [(p.name, await _resolve_origin(p.origin_text)) for p in request.participants]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 세션 지역은 초기 참가자 기준으로 고정 (없으면 기본 지역)
+    # ETA 행은 샤드 카탈로그 전체 기준이므로 세션 후보도 카탈로그 전체로 고정
+    shard = region_router.route([coord for _, coord in resolved])
+    session = session_store.create(shard.generator.places, request.purpose, scoring, shard.region)
+    for name, coord in resolved:
+        session.upsert(name, coord, origin_eta_row(coord, shard))
+    return _json_response(_session_payload(session, request.include_explanations))
+
+
+@app.get("/sessions/{session_id}", response_model=SessionResponse)
+async def get_session(session_id: str, include_explanations: bool = True):
+    """세션의 현재 추천 결과 조회"""
+    return _json_response(_session_payload(_get_session(session_id), include_explanations))
+
+
+@app.put("/sessions/{session_id}/participants/{name}", response_model=SessionResponse)
+async def upsert_session_participant(
+    session_id: str,
+    name: str,
+    request: ParticipantOrigin,
+    include_explanations: bool = True
+):
+    """참가자 추가 또는 출발지 변경 (해당 참가자만 지오코딩/ETA 계산)"""
+    _get_session(session_id)
+    try:
+        coord = await _resolve_origin(request.origin_text)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    # 지오코딩 대기 중 만료되었을 수 있으므로 다시 조회
+    session = _get_session(session_id)
+    session.upsert(name, coord, origin_eta_row(coord, region_router.get(session.region)))
+    return _json_response(_session_payload(session, include_explanations))
+
+
+@app.delete("/sessions/{session_id}/participants/{name}", response_model=SessionResponse)
+async def remove_session_participant(session_id: str, name: str, include_explanations: bool = True):
+    """참가자 삭제"""
+    session = _get_session(session_id)
+    if not session.remove(name):
+        raise HTTPException(status_code=404, detail=f"'{name}' 참가자가 세션에 없습니다.")
+    return _json_response(_session_payload(session, include_explanations))
+
+
+@app.delete("/sessions/{session_id}")
+async def delete_session(session_id: str):
+    """세션 삭제"""
+    if not session_store.delete(session_id):
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없거나 만료되었습니다.")
+    return {"status": "deleted", "session_id": session_id}
+
+
+# ============================================================
+# Profiling (온디맨드 요청 프로파일 조회)
+# ============================================================
+def _get_profile(profile_id: str, request: Request):
+    """토큰 인증 후 보관된 프로파일 조회 (토큰 불일치도 404로 응답해 존재 여부를 숨김)"""
+    supplied = request.headers.get(profiling.PROFILE_HEADER) or request.query_params.get(profiling.PROFILE_QUERY)
+    profile = profiler.get(profile_id) if profiler.authorized(supplied) else None
+    if profile is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return profile
+
+
+@app.get("/profiles/{profile_id}.folded")
+async def get_profile_stacks(profile_id: str, request: Request):
+    """프로파일의 collapsed stack (플레임 그래프 입력)"""
+    return Response(content=_get_profile(profile_id, request).collapsed(), media_type="text/plain; charset=utf-8")
+
+
+@app.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str, request: Request):
+    """프로파일 요약 (단계별 소요 시간, VWorld 호출 수, 샘플 수)"""
+    return _json_response(_get_profile(profile_id, request).summary())
+
 
 # ============================================================
 # MCP JSON-RPC Endpoint
@@ -168,10 +858,15 @@ async def mcp_endpoint(request: Request):
     """MCP JSON-RPC 2.0 엔드포인트"""
     try:
         body = await request.json()
-        response = await mcp_handler.handle_request(body)
-        return JSONResponse(content=response)
+        response, profile_id = await _run_profiled(
+            request, "/mcp", lambda: mcp_handler.handle_request(body)
+        )
+        # 응답과 서버 로그/트레이스를 연결할 수 있도록 요청 ID를 결과 _meta에 포함
+        if isinstance(response, dict) and isinstance(response.get("result"), dict):
+            response["result"].setdefault("_meta", {})["meetplanner/requestId"] = tracing.current_request_id()
+        return _profiled_response(response, profile_id)
     except json.JSONDecodeError:
-        return JSONResponse(content={
+        return _json_response({
             "jsonrpc": "2.0",
             "error": {"code": -32700, "message": "Parse error"},
             "id": None
@@ -1,57 +1,25 @@
 # -*- coding: utf-8 -*-
-"""VWorld 지도 HTML 생성기"""
+"""VWorld 지도 HTML 생성기
 
+지도 HTML은 정적 템플릿을 한 번만 컴파일해 두고, 마커 데이터는 별도의 GeoJSON으로 분리한다.
+서버에서는 결과 해시로 주소가 정해지는(content-addressed) GeoJSON을 캐시해 /map 엔드포인트로 제공한다.
+"""
+
+import hashlib
 import os
-import webbrowser
+import sys
+from collections import OrderedDict
 from datetime import datetime
+from string import Template
+from typing import Optional
 
+import orjson
 
-class MapGenerator:
-    """VWorld 지도를 사용해서 추천 결과를 시각화하는 HTML 생성기"""
-
-    def __init__(self):
-        self.api_key = os.getenv("VWORLD_API_KEY", "")
-
-    def generate_map_html(
-        self,
-        recommendations: list[dict],
-        participants: dict[str, dict],
-        output_path: str = None,
-        open_browser: bool = True
-    ) -> str:
-        """
-        추천 결과를 VWorld 지도에 표시하는 HTML 파일 생성
-
-        Args:
-            recommendations: 추천 장소 리스트
-            participants: 참가자 좌표 딕셔너리 {"이름": {"lat": float, "lng": float}}
-            output_path: 출력 파일 경로 (None이면 자동 생성)
-            open_browser: 생성 후 브라우저에서 열기
-
-        Returns:
-            생성된 HTML 파일 경로
-        """
-        if output_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                f"map_result_{timestamp}.html"
-            )
-
-        # 중심점 계산
-        all_lats = [r["lat"] for r in recommendations[:5]]
-        all_lngs = [r["lng"] for r in recommendations[:5]]
-        for coords in participants.values():
-            all_lats.append(coords["lat"])
-            all_lngs.append(coords["lng"])
-
-        center_lat = sum(all_lats) / len(all_lats)
-        center_lng = sum(all_lngs) / len(all_lngs)
+from .memory import ODICT_ENTRY_BYTES
 
-        # 마커 데이터 생성
-        markers_js = self._generate_markers_js(recommendations, participants)
 
-        html_content = f'''<!DOCTYPE html>
+# 지도 페이지 템플릿 (api_key, geojson_loader 치환)
+MAP_TEMPLATE = Template('''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -59,32 +27,32 @@ class MapGenerator:
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/ol@v7.4.0/ol.css">
     <script src="https://cdn.jsdelivr.net/npm/ol@v7.4.0/dist/ol.js"></script>
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Malgun Gothic', sans-serif; }}
-        #map {{ width: 100%; height: 70vh; }}
-        .header {{
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Malgun Gothic', sans-serif; }
+        #map { width: 100%; height: 70vh; }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 20px;
             text-align: center;
-        }}
-        .header h1 {{ font-size: 24px; margin-bottom: 5px; }}
-        .header p {{ font-size: 14px; opacity: 0.9; }}
-        .legend {{
+        }
+        .header h1 { font-size: 24px; margin-bottom: 5px; }
+        .header p { font-size: 14px; opacity: 0.9; }
+        .legend {
             padding: 15px 20px;
             background: #f8f9fa;
             border-bottom: 1px solid #dee2e6;
             display: flex;
             gap: 30px;
             flex-wrap: wrap;
-        }}
-        .legend-item {{
+        }
+        .legend-item {
             display: flex;
             align-items: center;
             gap: 8px;
             font-size: 14px;
-        }}
-        .legend-marker {{
+        }
+        .legend-marker {
             width: 24px;
             height: 24px;
             border-radius: 50%;
@@ -94,36 +62,36 @@ class MapGenerator:
             color: white;
             font-size: 12px;
             font-weight: bold;
-        }}
-        .marker-recommend {{ background: #e74c3c; }}
-        .marker-participant {{ background: #3498db; }}
-        .info-panel {{
+        }
+        .marker-recommend { background: #e74c3c; }
+        .marker-participant { background: #3498db; }
+        .info-panel {
             padding: 20px;
             max-height: 30vh;
             overflow-y: auto;
-        }}
-        .info-panel h2 {{
+        }
+        .info-panel h2 {
             font-size: 18px;
             margin-bottom: 15px;
             color: #333;
-        }}
-        .place-card {{
+        }
+        .place-card {
             background: white;
             border: 1px solid #dee2e6;
             border-radius: 8px;
             padding: 15px;
             margin-bottom: 10px;
-        }}
-        .place-card.rank-1 {{ border-left: 4px solid #e74c3c; }}
-        .place-card.rank-2 {{ border-left: 4px solid #e67e22; }}
-        .place-card.rank-3 {{ border-left: 4px solid #f1c40f; }}
-        .place-header {{
+        }
+        .place-card.rank-1 { border-left: 4px solid #e74c3c; }
+        .place-card.rank-2 { border-left: 4px solid #e67e22; }
+        .place-card.rank-3 { border-left: 4px solid #f1c40f; }
+        .place-header {
             display: flex;
             align-items: center;
             gap: 10px;
             margin-bottom: 8px;
-        }}
-        .rank-badge {{
+        }
+        .rank-badge {
             background: #e74c3c;
             color: white;
             width: 24px;
@@ -134,11 +102,11 @@ class MapGenerator:
             justify-content: center;
             font-size: 12px;
             font-weight: bold;
-        }}
-        .place-name {{ font-size: 16px; font-weight: bold; color: #333; }}
-        .place-info {{ font-size: 13px; color: #666; line-height: 1.6; }}
-        .eta-list {{ margin-top: 8px; }}
-        .eta-item {{
+        }
+        .place-name { font-size: 16px; font-weight: bold; color: #333; }
+        .place-info { font-size: 13px; color: #666; line-height: 1.6; }
+        .eta-list { margin-top: 8px; }
+        .eta-item {
             display: inline-block;
             background: #e8f4f8;
             padding: 3px 8px;
@@ -146,8 +114,8 @@ class MapGenerator:
             margin-right: 5px;
             margin-bottom: 5px;
             font-size: 12px;
-        }}
-        .ol-popup {{
+        }
+        .ol-popup {
             position: absolute;
             background-color: white;
             box-shadow: 0 1px 4px rgba(0,0,0,0.2);
@@ -157,8 +125,8 @@ class MapGenerator:
             bottom: 12px;
             left: -50px;
             min-width: 200px;
-        }}
-        .ol-popup:after, .ol-popup:before {{
+        }
+        .ol-popup:after, .ol-popup:before {
             top: 100%;
             border: solid transparent;
             content: " ";
@@ -166,28 +134,28 @@ class MapGenerator:
             width: 0;
             position: absolute;
             pointer-events: none;
-        }}
-        .ol-popup:after {{
+        }
+        .ol-popup:after {
             border-top-color: white;
             border-width: 10px;
             left: 48px;
             margin-left: -10px;
-        }}
-        .ol-popup:before {{
+        }
+        .ol-popup:before {
             border-top-color: #cccccc;
             border-width: 11px;
             left: 48px;
             margin-left: -11px;
-        }}
-        .ol-popup-closer {{
+        }
+        .ol-popup-closer {
             text-decoration: none;
             position: absolute;
             top: 2px;
             right: 8px;
-        }}
-        .ol-popup-closer:after {{
+        }
+        .ol-popup-closer:after {
             content: "✖";
-        }}
+        }
     </style>
 </head>
 <body>
@@ -216,53 +184,53 @@ class MapGenerator:
 
     <div class="info-panel">
         <h2>추천 장소 상세</h2>
-        {self._generate_place_cards_html(recommendations)}
+        <div id="place-cards"></div>
     </div>
 
     <script>
         // VWorld 타일 레이어
-        var vworldLayer = new ol.layer.Tile({{
-            source: new ol.source.XYZ({{
-                url: 'https://api.vworld.kr/req/wmts/1.0.0/{self.api_key}/Base/{{z}}/{{y}}/{{x}}.png'
-            }})
-        }});
+        var vworldLayer = new ol.layer.Tile({
+            source: new ol.source.XYZ({
+                url: 'https://api.vworld.kr/req/wmts/1.0.0/${api_key}/Base/{z}/{y}/{x}.png'
+            })
+        });
 
         // 지도 생성
-        var map = new ol.Map({{
+        var map = new ol.Map({
             target: 'map',
             layers: [vworldLayer],
-            view: new ol.View({{
-                center: ol.proj.fromLonLat([{center_lng}, {center_lat}]),
+            view: new ol.View({
+                center: ol.proj.fromLonLat([126.9780, 37.5665]),
                 zoom: 12
-            }})
-        }});
+            })
+        });
 
         // 팝업 설정
         var container = document.getElementById('popup');
         var content = document.getElementById('popup-content');
         var closer = document.getElementById('popup-closer');
 
-        var overlay = new ol.Overlay({{
+        var overlay = new ol.Overlay({
             element: container,
             autoPan: true,
-            autoPanAnimation: {{
+            autoPanAnimation: {
                 duration: 250
-            }}
-        }});
+            }
+        });
         map.addOverlay(overlay);
 
-        closer.onclick = function() {{
+        closer.onclick = function() {
             overlay.setPosition(undefined);
             closer.blur();
             return false;
-        }};
+        };
 
         // 마커 생성 함수
-        function createMarker(lon, lat, label, color, isRank) {{
-            var feature = new ol.Feature({{
+        function createMarker(lon, lat, label, color, isRank) {
+            var feature = new ol.Feature({
                 geometry: new ol.geom.Point(ol.proj.fromLonLat([lon, lat])),
                 name: label
-            }});
+            });
 
             // SVG 마커 스타일
             var svg = '<svg width="32" height="40" xmlns="http://www.w3.org/2000/svg">' +
@@ -271,104 +239,267 @@ class MapGenerator:
                 '<text x="16" y="18" text-anchor="middle" font-size="10" font-weight="bold" fill="' + color + '">' + (isRank ? label : 'P') + '</text>' +
                 '</svg>';
 
-            var style = new ol.style.Style({{
-                image: new ol.style.Icon({{
+            var style = new ol.style.Style({
+                image: new ol.style.Icon({
                     src: 'data:image/svg+xml;charset=utf-8,' + encodeURIComponent(svg),
                     anchor: [0.5, 1],
                     scale: 1
-                }})
-            }});
+                })
+            });
 
             feature.setStyle(style);
             return feature;
-        }}
-
-        // 마커 추가
-        var features = [];
-
-        {markers_js}
+        }
 
         // 벡터 레이어 생성
-        var vectorSource = new ol.source.Vector({{
-            features: features
-        }});
-
-        var vectorLayer = new ol.layer.Vector({{
+        var vectorSource = new ol.source.Vector();
+        var vectorLayer = new ol.layer.Vector({
             source: vectorSource
-        }});
-
+        });
         map.addLayer(vectorLayer);
 
+        // 장소 카드 생성 (텍스트는 textContent로만 삽입)
+        function el(tag, className, text) {
+            var node = document.createElement(tag);
+            if (className) node.className = className;
+            if (text !== undefined) node.textContent = text;
+            return node;
+        }
+
+        function createPlaceCard(props) {
+            var card = el('div', 'place-card rank-' + props.rank);
+            var header = el('div', 'place-header');
+            header.appendChild(el('div', 'rank-badge', String(props.rank)));
+            header.appendChild(el('span', 'place-name', props.label));
+            card.appendChild(header);
+
+            var info = el('div', 'place-info');
+            info.appendChild(el('div', null,
+                '평균 이동시간: ' + Math.round(props.fairness.mean) + '분 | 표준편차: ' + props.fairness.std.toFixed(1) + '분'));
+            var etaList = el('div', 'eta-list');
+            Object.keys(props.eta_by_participant || {}).forEach(function(name) {
+                etaList.appendChild(el('span', 'eta-item', name + ': ' + props.eta_by_participant[name] + '분'));
+            });
+            info.appendChild(etaList);
+            if (props.why) {
+                var why = el('div', null, props.why);
+                why.style.marginTop = '8px';
+                why.style.color = '#555';
+                info.appendChild(why);
+            }
+            card.appendChild(info);
+            return card;
+        }
+
+        // 마커 데이터(GeoJSON) 로드 후 마커/카드 추가
+        ${geojson_loader}.then(function(geojson) {
+            var cards = document.getElementById('place-cards');
+            geojson.features.forEach(function(f) {
+                var lon = f.geometry.coordinates[0];
+                var lat = f.geometry.coordinates[1];
+                var props = f.properties;
+                if (props.kind === 'recommendation') {
+                    // 추천 장소 마커 (빨간색, 숫자)
+                    var marker = createMarker(lon, lat, String(props.rank), '#e74c3c', true);
+                    marker.set('name', props.label);
+                    vectorSource.addFeature(marker);
+                    cards.appendChild(createPlaceCard(props));
+                } else {
+                    // 참가자 출발 위치 마커 (파란색)
+                    vectorSource.addFeature(createMarker(lon, lat, props.name, '#3498db', false));
+                }
+            });
+            if (vectorSource.getFeatures().length) {
+                map.getView().fit(vectorSource.getExtent(), { padding: [40, 40, 40, 40], maxZoom: 14 });
+            }
+        });
+
         // 클릭 이벤트
-        map.on('click', function(evt) {{
-            var feature = map.forEachFeatureAtPixel(evt.pixel, function(feature) {{
+        map.on('click', function(evt) {
+            var feature = map.forEachFeatureAtPixel(evt.pixel, function(feature) {
                 return feature;
-            }});
-            if (feature) {{
+            });
+            if (feature) {
                 var coordinates = feature.getGeometry().getCoordinates();
-                content.innerHTML = '<strong>' + feature.get('name') + '</strong>';
+                content.replaceChildren(el('strong', null, feature.get('name')));
                 overlay.setPosition(coordinates);
-            }} else {{
+            } else {
                 overlay.setPosition(undefined);
-            }}
-        }});
+            }
+        });
 
         // 커서 변경
-        map.on('pointermove', function(e) {{
+        map.on('pointermove', function(e) {
             var pixel = map.getEventPixel(e.originalEvent);
             var hit = map.hasFeatureAtPixel(pixel);
             map.getTarget().style.cursor = hit ? 'pointer' : '';
-        }});
+        });
     </script>
 </body>
-</html>'''
+</html>''')
+
+# 서버 제공용: 페이지 경로(/map/{map_id}) 옆의 GeoJSON(/map/{map_id}.geojson)을 불러온다
+_FETCH_LOADER = "fetch(window.location.pathname + '.geojson').then(function(r) { return r.json(); })"
+
+
+class MapGenerator:
+    """VWorld 지도를 사용해서 추천 결과를 시각화하는 HTML 생성기"""
+
+    def __init__(self):
+        self.api_key = os.getenv("VWORLD_API_KEY", "")
+        self._page: Optional[bytes] = None
+        self._page_etag: Optional[str] = None
+
+    def page_html(self) -> bytes:
+        """서버 제공용 지도 페이지 (결과와 무관한 정적 HTML, 최초 1회만 렌더링)"""
+        if self._page is None:
+            self._page = MAP_TEMPLATE.substitute(
+                api_key=self.api_key,
+                geojson_loader=_FETCH_LOADER
+            ).encode("utf-8")
+            self._page_etag = f'"{hashlib.sha256(self._page).hexdigest()[:32]}"'
+        return self._page
+
+    def page_etag(self) -> str:
+        """서버 제공용 지도 페이지의 ETag"""
+        self.page_html()
+        return self._page_etag
+
+    def build_geojson(self, recommendations: list[dict], participants: dict[str, dict]) -> dict:
+        """
+        추천 결과와 참가자 위치를 GeoJSON FeatureCollection으로 변환
+
+        Args:
+            recommendations: 추천 장소 리스트
+            participants: 참가자 좌표 딕셔너리 {"이름": {"lat": float, "lng": float}}
+
+        Returns:
+            GeoJSON FeatureCollection
+        """
+        features = []
+
+        # 추천 장소 (상위 5개)
+        for rec in recommendations[:5]:
+            features.append({
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [rec["lng"], rec["lat"]]},
+                "properties": {
+                    "kind": "recommendation",
+                    "rank": rec["rank"],
+                    "label": rec["label"],
+                    "eta_by_participant": rec.get("eta_by_participant", {}),
+                    "fairness": rec.get("fairness", {"std": 0, "mean": 0}),
+                    "why": rec.get("why", "")
+                }
+            })
+
+        # 참가자 출발 위치
+        for name, coords in participants.items():
+            features.append({
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [coords["lng"], coords["lat"]]},
+                "properties": {"kind": "participant", "name": name}
+            })
+
+        return {"type": "FeatureCollection", "features": features}
+
+    def generate_map_html(
+        self,
+        recommendations: list[dict],
+        participants: dict[str, dict],
+        output_path: str = None,
+        open_browser: bool = True
+    ) -> str:
+        """
+        추천 결과를 VWorld 지도에 표시하는 HTML 파일 생성 (로컬 확인용)
+
+        Args:
+            recommendations: 추천 장소 리스트
+            participants: 참가자 좌표 딕셔너리 {"이름": {"lat": float, "lng": float}}
+            output_path: 출력 파일 경로 (None이면 자동 생성)
+            open_browser: 생성 후 브라우저에서 열기
+
+        Returns:
+            생성된 HTML 파일 경로
+        """
+        if output_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = os.path.join(
+                os.path.dirname(os.path.dirname(__file__)),
+                f"map_result_{timestamp}.html"
+            )
+
+        # GeoJSON을 페이지에 직접 포함 ("</" 이스케이프로 script 태그 종료 방지)
+        geojson = orjson.dumps(self.build_geojson(recommendations, participants)).decode("utf-8")
+        geojson = geojson.replace("</", "<\\/")
+        html_content = MAP_TEMPLATE.substitute(
+            api_key=self.api_key,
+            geojson_loader=f"Promise.resolve({geojson})"
+        )
 
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
 
         if open_browser:
+            import webbrowser
             webbrowser.open(f'file://{os.path.abspath(output_path)}')
 
         return output_path
 
-    def _generate_markers_js(self, recommendations: list[dict], participants: dict[str, dict]) -> str:
-        """마커 JavaScript 코드 생성"""
-        js_lines = []
-
-        # 추천 장소 마커 (빨간색, 숫자)
-        for i, rec in enumerate(recommendations[:5], 1):
-            js_lines.append(
-                f"features.push(createMarker({rec['lng']}, {rec['lat']}, '{i}', '#e74c3c', true));  // {rec['label']}"
-            )
-
-        # 참가자 출발 위치 마커 (파란색)
-        for name, coords in participants.items():
-            js_lines.append(
-                f"features.push(createMarker({coords['lng']}, {coords['lat']}, '{name}', '#3498db', false));"
-            )
 
-        return '\n        '.join(js_lines)
-
-    def _generate_place_cards_html(self, recommendations: list[dict]) -> str:
-        """장소 카드 HTML 생성"""
-        cards = []
-        for i, rec in enumerate(recommendations[:5], 1):
-            eta_items = ''.join([
-                f'<span class="eta-item">{name}: {eta}분</span>'
-                for name, eta in rec.get("eta_by_participant", {}).items()
-            ])
-
-            cards.append(f'''
-        <div class="place-card rank-{i}">
-            <div class="place-header">
-                <div class="rank-badge">{i}</div>
-                <span class="place-name">{rec["label"]}</span>
-            </div>
-            <div class="place-info">
-                <div>평균 이동시간: {rec.get("fairness", {}).get("mean", 0):.0f}분 | 표준편차: {rec.get("fairness", {}).get("std", 0):.1f}분</div>
-                <div class="eta-list">{eta_items}</div>
-                <div style="margin-top: 8px; color: #555;">{rec.get("why", "")}</div>
-            </div>
-        </div>''')
-
-        return '\n'.join(cards)
+class MapStore:
+    """결과 해시로 주소가 정해지는 지도 GeoJSON의 LRU 캐시
+
+    같은 결과는 같은 map_id를 가지므로 ETag로 그대로 사용할 수 있다.
+    """
+
+    def __init__(self, generator: MapGenerator, max_entries: Optional[int] = None):
+        self.generator = generator
+        self.max_entries = max_entries if max_entries is not None else int(
+            os.getenv("MEETPLANNER_MAP_CACHE_SIZE", "1024")
+        )
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        # 캐시 추정 바이트 (전역 메모리 예산용)
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, recommendations: list[dict], participants: dict[str, dict]) -> str:
+        """결과의 GeoJSON을 저장하고 map_id(내용 해시) 반환"""
+        body = orjson.dumps(
+            self.generator.build_geojson(recommendations, participants),
+            option=orjson.OPT_SORT_KEYS
+        )
+        map_id = hashlib.sha256(body).hexdigest()[:32]
+
+        if map_id in self._entries:
+            self._entries.move_to_end(map_id)
+        else:
+            self._entries[map_id] = body
+            self.nbytes += self._entry_bytes(map_id, body)
+            while len(self._entries) > self.max_entries:
+                self._evict_oldest()
+        return map_id
+
+    def shrink_to(self, max_bytes: int) -> int:
+        """캐시 추정 바이트가 max_bytes 이하가 될 때까지 오래된 항목 제거 (제거한 바이트 반환)"""
+        before = self.nbytes
+        while self.nbytes > max_bytes and self._entries:
+            self._evict_oldest()
+        return before - self.nbytes
+
+    def _evict_oldest(self) -> None:
+        map_id, body = self._entries.popitem(last=False)
+        self.nbytes -= self._entry_bytes(map_id, body)
+
+    @staticmethod
+    def _entry_bytes(map_id: str, body: bytes) -> int:
+        return sys.getsizeof(map_id) + sys.getsizeof(body) + ODICT_ENTRY_BYTES
+
+    def get(self, map_id: str) -> Optional[bytes]:
+        """저장된 GeoJSON 바이트 반환 (없으면 None)"""
+        body = self._entries.get(map_id)
+        if body is not None:
+            self._entries.move_to_end(map_id)
+        return body
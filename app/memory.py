@@ -0,0 +1,81 @@
+"""메모리 사용량 집계와 전역 캐시 메모리 예산
+
+1GB VM에서 캐시, 카탈로그, 세션이 늘어날 때 어디에 메모리가 쓰이는지 알 수 있도록
+구성 요소별 추정 바이트를 모으고(/metrics), 제거 가능한 캐시들의 합이 전역 예산을 넘으면
+각 캐시를 같은 비율로 줄인다(각 캐시의 LRU 순서대로 제거).
+
+추정치는 sys.getsizeof 기반 근사값이며, 캐시끼리 공유하는 객체(예: ETA 행 배열)는 양쪽에 모두 계산되므로
+실제 사용량보다 크게 잡힐 수 있다.
+"""
+
+import os
+from typing import Callable, Optional, Protocol
+
+
+# OrderedDict 항목당 해시 테이블 슬롯 + 연결 노드 근사치
+ODICT_ENTRY_BYTES = 104
+
+
+class EvictableCache(Protocol):
+    nbytes: int
+
+    def shrink_to(self, max_bytes: int) -> int:
+        """추정 바이트가 max_bytes 이하가 될 때까지 오래된 항목 제거 후 제거한 바이트 반환"""
+
+
+def process_rss_bytes() -> Optional[int]:
+    """현재 프로세스 RSS (리눅스 /proc 기준, 알 수 없으면 None)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class MemoryBudget:
+    """전역 캐시 메모리 예산 및 구성 요소별 메모리 리포트
+
+    MEETPLANNER_MEMORY_BUDGET_BYTES(기본 256MiB)는 제거 가능한 캐시들의 추정 바이트 합의 상한이며,
+    0이면 예산을 적용하지 않는다(집계만 수행). 세션, 카탈로그 등 제거할 수 없는 구성 요소는 집계만 한다.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            os.getenv("MEETPLANNER_MEMORY_BUDGET_BYTES", str(256 * 1024 * 1024))
+        )
+        self._caches: dict[str, EvictableCache] = {}
+        self._components: dict[str, Callable[[], int]] = {}
+        self.evicted_bytes = 0
+
+    def register_cache(self, name: str, cache: EvictableCache) -> None:
+        self._caches[name] = cache
+
+    def register_component(self, name: str, nbytes: Callable[[], int]) -> None:
+        self._components[name] = nbytes
+
+    def cache_bytes(self) -> int:
+        return sum(cache.nbytes for cache in self._caches.values())
+
+    def enforce(self) -> int:
+        """캐시 합이 예산을 넘으면 각 캐시를 같은 비율로 줄이고 제거한 바이트 반환 (요청마다 호출, O(캐시 수))"""
+        total = self.cache_bytes()
+        if self.max_bytes <= 0 or total <= self.max_bytes:
+            return 0
+
+        ratio = self.max_bytes / total
+        freed = sum(cache.shrink_to(int(cache.nbytes * ratio)) for cache in self._caches.values())
+        self.evicted_bytes += freed
+        return freed
+
+    def report(self) -> dict:
+        """구성 요소별 추정 바이트 (제거 가능한 캐시 / 그 외 구성 요소 / 프로세스 RSS)"""
+        caches = {name: cache.nbytes for name, cache in self._caches.items()}
+        components = {name: nbytes() for name, nbytes in self._components.items()}
+        return {
+            "budget_bytes": self.max_bytes,
+            "cache_bytes": sum(caches.values()),
+            "caches": caches,
+            "components": components,
+            "evicted_bytes": self.evicted_bytes,
+            "rss_bytes": process_rss_bytes(),
+        }
@@ -10,6 +10,12 @@ class Participant(BaseModel):
 class RecommendRequest(BaseModel):
     participants: list[Participant]
     purpose: str = "cafe_talk"
+    include_explanations: bool = True
+    include_map: bool = False
+    fairness_metric: str = "std"
+    large_group: bool = False
+    include_participant_etas: bool = False
+    deadline_ms: Optional[int] = None
 
 
 class ETAByParticipant(BaseModel):
@@ -25,19 +31,65 @@ class PurposeScore(BaseModel):
     score: float
 
 
+class HistogramBin(BaseModel):
+    lower: int
+    upper: int
+    count: int
+
+
+class ETADistribution(BaseModel):
+    p10: int
+    p50: int
+    p90: int
+    max: int
+    histogram: list[HistogramBin]
+
+
 class Recommendation(BaseModel):
     rank: int
     label: str
     lat: float
     lng: float
-    eta_by_participant: dict[str, int]
+    eta_by_participant: Optional[dict[str, int]] = None
+    eta_distribution: Optional[ETADistribution] = None
     fairness: FairnessScore
     purpose: PurposeScore
-    why: str
+    why: Optional[str] = None
+
+
+class GroupSummary(BaseModel):
+    participants: int
+    origins: int
+    clusters: int
+
+
+class Approximation(BaseModel):
+    stage: str
+    unresolved_participants: list[str] = []
 
 
 class RecommendResponse(BaseModel):
     recommendations: list[Recommendation]
+    map_url: Optional[str] = None
+    group: Optional[GroupSummary] = None
+    complete: Optional[bool] = None
+    approximation: Optional[Approximation] = None
+
+
+class SessionCreateRequest(BaseModel):
+    participants: list[Participant] = []
+    purpose: str = "cafe_talk"
+    include_explanations: bool = True
+
+
+class ParticipantOrigin(BaseModel):
+    origin_text: str
+
+
+class SessionResponse(BaseModel):
+    session_id: str
+    participants: list[str]
+    recommendations: list[Recommendation]
 
 
 class HealthResponse(BaseModel):
@@ -0,0 +1,256 @@
+"""관측된 트래픽 기반 인기 키 추적 및 캐시 프리워밍
+
+출발지 문자열과 (출발지 조합, 목적) 키의 빈도를 Count-Min Sketch로 근사하고,
+상위 k개 키만 별도로 유지한다. 키는 프로세스마다 새로 만든 비밀 키로 해시(keyed BLAKE2b)해
+다루며, 원문 키는 추정 빈도가 최소 빈도에 도달해 상위 k개에 들어간 뒤에만 해시에 연결해
+메모리에 보관하고 디스크나 로그로 내보내지 않는다.
+
+유휴 시간에 백그라운드 작업이 상위 키의 지오코딩 캐시와 추천 결과 캐시를
+VWorld 호출 예산 안에서 미리 채운다.
+"""
+
+import asyncio
+import hashlib
+import os
+import sys
+import time
+from array import array
+from typing import Awaitable, Callable, Hashable, Optional
+
+from .geocoder import MAX_CALLS_PER_ADDRESS, VWorldGeocoder
+
+
+class CountMinSketch:
+    """고정 메모리 빈도 근사 구조 (과대 추정만 발생)
+
+    키는 digest()로 만든 keyed 해시로 다룬다. 비밀 키는 프로세스마다 새로 만들므로
+    카운터나 해시만으로는 원문 키를 추측(사전 대입)할 수 없다.
+    """
+
+    def __init__(self, width: int = 4096, depth: int = 4, secret: Optional[bytes] = None):
+        self.width = width
+        self.depth = depth
+        self._secret = secret if secret is not None else os.urandom(16)
+        self._rows = [array("I", bytes(4 * width)) for _ in range(depth)]
+
+    def digest(self, key: str) -> bytes:
+        """키의 keyed 해시 (행마다 4바이트)"""
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=4 * self.depth, key=self._secret).digest()
+
+    def _indexes(self, digest: bytes) -> list[int]:
+        return [
+            int.from_bytes(digest[4 * i:4 * i + 4], "little") % self.width
+            for i in range(self.depth)
+        ]
+
+    def add(self, digest: bytes) -> int:
+        """키(digest) 빈도를 1 증가시키고 추정 빈도 반환"""
+        estimate = None
+        for row, index in zip(self._rows, self._indexes(digest)):
+            if row[index] < 0xFFFFFFFF:
+                row[index] += 1
+            estimate = row[index] if estimate is None else min(estimate, row[index])
+        return estimate
+
+    def nbytes(self) -> int:
+        return sum(sys.getsizeof(row) for row in self._rows)
+
+    def estimate(self, digest: bytes) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(digest)))
+
+    def decay(self) -> None:
+        """모든 카운터를 절반으로 감소 (오래된 인기 키가 자연스럽게 밀려나도록)"""
+        for row in self._rows:
+            for i, count in enumerate(row):
+                if count:
+                    row[i] = count >> 1
+
+
+class TopK:
+    """스케치 추정 빈도 기준 상위 k개 키
+
+    항목은 키의 digest로 식별하며, 추정 빈도가 min_count 이상인 키만 받아들인다.
+    원문 키(keys)는 받아들인 항목에만 연결하고 항목이 빠지면 함께 지운다.
+    """
+
+    def __init__(self, k: int, min_count: int = 1):
+        self.k = k
+        self.min_count = min_count
+        self.counts: dict[bytes, int] = {}
+        self.keys: dict[bytes, Hashable] = {}
+        self._floor = 0
+
+    def offer(self, digest: bytes, estimate: int, key: Callable[[], Hashable]) -> None:
+        """digest의 추정 빈도 갱신 (key는 새로 받아들일 때만 호출해 원문 키를 만듦)"""
+        if digest in self.counts:
+            self.counts[digest] = estimate
+            return
+        if estimate < self.min_count:
+            return
+        if len(self.counts) >= self.k:
+            if estimate <= self._floor:
+                return
+            evicted = min(self.counts, key=self.counts.__getitem__)
+            del self.counts[evicted]
+            del self.keys[evicted]
+        self.counts[digest] = estimate
+        self.keys[digest] = key()
+        if len(self.counts) >= self.k:
+            self._floor = min(self.counts.values())
+
+    def decay(self) -> None:
+        self.counts = {digest: count >> 1 for digest, count in self.counts.items() if count > 1}
+        self.keys = {digest: self.keys[digest] for digest in self.counts}
+        self._floor >>= 1
+
+    def most_common(self, min_count: int = 1) -> list[tuple[Hashable, int]]:
+        items = [(self.keys[digest], count) for digest, count in self.counts.items() if count >= min_count]
+        items.sort(key=lambda item: item[1], reverse=True)
+        return items
+
+
+class PopularityTracker:
+    """출발지 및 (출발지 조합, 목적) 빈도 추적기
+
+    min_count: 상위 k개에 받아들이는(원문 키를 보관하는) 최소 추정 빈도
+    """
+
+    def __init__(
+        self,
+        top_k: Optional[int] = None,
+        half_life_seconds: Optional[float] = None,
+        min_count: Optional[int] = None
+    ):
+        top_k = top_k if top_k is not None else int(os.getenv("MEETPLANNER_POPULARITY_TOP_K", "512"))
+        self.half_life_seconds = half_life_seconds if half_life_seconds is not None else float(
+            os.getenv("MEETPLANNER_POPULARITY_HALF_LIFE", "3600")
+        )
+        self.min_count = min_count if min_count is not None else int(
+            os.getenv("MEETPLANNER_PREWARM_MIN_COUNT", "3")
+        )
+        self._sketch = CountMinSketch()
+        self.origins = TopK(top_k, self.min_count)
+        self.groups = TopK(top_k, self.min_count)
+        self._decayed_at = time.monotonic()
+
+    def record(self, origins: tuple[str, ...], purpose: str) -> None:
+        """요청 하나의 정규화된 출발지 조합(정렬된 튜플)과 목적을 기록"""
+        for origin in set(origins):
+            digest = self._sketch.digest("o\x1f" + origin)
+            self.origins.offer(digest, self._sketch.add(digest), lambda: origin)
+
+        digest = self._sketch.digest("g\x1f" + "\x1f".join(origins) + "\x1e" + purpose)
+        self.groups.offer(digest, self._sketch.add(digest), lambda: (origins, purpose))
+
+    def nbytes(self) -> int:
+        """스케치와 상위 k개 항목(digest, 원문 키)의 추정 바이트"""
+        size = self._sketch.nbytes()
+        for top in (self.origins, self.groups):
+            size += sys.getsizeof(top.counts) + sys.getsizeof(top.keys)
+            size += sum(sys.getsizeof(digest) for digest in top.counts)
+            size += sum(sys.getsizeof(key) for key in top.keys.values())
+        return size
+
+    def maybe_decay(self) -> None:
+        """반감기가 지났으면 모든 빈도를 절반으로 감소"""
+        now = time.monotonic()
+        if now - self._decayed_at >= self.half_life_seconds:
+            self._sketch.decay()
+            self.origins.decay()
+            self.groups.decay()
+            self._decayed_at = now
+
+
+class CachePrewarmer:
+    """유휴 시간에 인기 키의 지오코딩/추천 결과 캐시를 미리 채우는 백그라운드 작업
+
+    Args:
+        tracker: 인기 키 추적기
+        geocoder: 지오코더 (api_calls로 VWorld 호출 수를 집계)
+        warm_ranking: (출발지 조합, 목적) 키를 계산해 추천 결과 캐시에 넣는 코루틴.
+            이미 캐시에 있으면 False를 반환한다.
+    """
+
+    def __init__(
+        self,
+        tracker: PopularityTracker,
+        geocoder: VWorldGeocoder,
+        warm_ranking: Callable[[tuple[str, ...], str], Awaitable[bool]],
+        interval_seconds: Optional[float] = None,
+        idle_seconds: Optional[float] = None,
+        call_budget: Optional[int] = None,
+        min_count: Optional[int] = None
+    ):
+        self.tracker = tracker
+        self.geocoder = geocoder
+        self.warm_ranking = warm_ranking
+        self.interval_seconds = interval_seconds if interval_seconds is not None else float(
+            os.getenv("MEETPLANNER_PREWARM_INTERVAL", "60")
+        )
+        self.idle_seconds = idle_seconds if idle_seconds is not None else float(
+            os.getenv("MEETPLANNER_PREWARM_IDLE", "5")
+        )
+        self.call_budget = call_budget if call_budget is not None else int(
+            os.getenv("MEETPLANNER_PREWARM_VWORLD_BUDGET", "50")
+        )
+        # 추적기가 받아들인 키만 후보이므로 기본값은 추적기의 최소 빈도
+        self.min_count = min_count if min_count is not None else tracker.min_count
+        self.last_request_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.call_budget > 0 and self.interval_seconds > 0
+
+    def touch(self) -> None:
+        """요청 처리 시점 기록 (유휴 판단용)"""
+        self.last_request_at = time.monotonic()
+
+    def is_idle(self) -> bool:
+        return time.monotonic() - self.last_request_at >= self.idle_seconds
+
+    async def run_periodic(self) -> None:
+        """interval_seconds마다 유휴 상태이면 프리워밍 수행"""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            self.tracker.maybe_decay()
+            if self.is_idle():
+                await self.prewarm()
+
+    async def prewarm(self) -> dict:
+        """인기 키를 빈도 순으로 예열하고 결과 통계 반환
+
+        지오코딩 캐시가 비어 있는 출발지부터 채우고, 출발지가 모두 캐시된
+        조합의 추천 결과를 계산한다. 지오코딩이나 추천 계산을 시작하기 전에 최악의 경우
+        VWorld 호출 수(캐시되지 않은 출발지당 MAX_CALLS_PER_ADDRESS)를 남은 예산에서 확보하고,
+        확보할 수 없으면 건너뛰므로 예산을 넘지 않는다. 새 요청이 들어오면(유휴 상태 종료) 중단한다.
+        """
+        start_calls = self.geocoder.api_calls
+        stats = {"origins": 0, "rankings": 0, "vworld_calls": 0}
+
+        def reserve(n_uncached: int) -> bool:
+            used = self.geocoder.api_calls - start_calls
+            return used + MAX_CALLS_PER_ADDRESS * n_uncached <= self.call_budget
+
+        for origin, _ in self.tracker.origins.most_common(self.min_count):
+            if not self.is_idle():
+                break
+            if not self.geocoder.is_cached(origin):
+                if not reserve(1):
+                    break
+                if await self.geocoder.geocode(origin) is not None:
+                    stats["origins"] += 1
+
+        for (origins, purpose), _ in self.tracker.groups.most_common(self.min_count):
+            if not self.is_idle():
+                break
+            uncached = sum(1 for origin in set(origins) if not self.geocoder.is_cached(origin))
+            if not reserve(uncached):
+                continue
+            try:
+                if await self.warm_ranking(origins, purpose):
+                    stats["rankings"] += 1
+            except ValueError:
+                continue
+
+        stats["vworld_calls"] = self.geocoder.api_calls - start_calls
+        return stats
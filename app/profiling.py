@@ -0,0 +1,210 @@
+"""요청 단위 온디맨드 프로파일링
+
+인증 토큰을 헤더(X-MeetPlanner-Profile) 또는 쿼리(?profile=)로 전달한 요청, 또는
+설정된 낮은 비율로 표본 추출된 요청만 프로파일링한다. 프로파일링 중에는 별도 스레드가
+이벤트 루프 스레드의 스택을 주기적으로 샘플링해 collapsed stack(플레임 그래프 입력 형식)을
+모으고, 추천 파이프라인의 단계별 소요 시간과 VWorld 호출 수를 함께 기록한다.
+
+비활성 상태에서는 요청당 속성 확인 두 번과 단계마다 ContextVar 조회 한 번만 발생한다.
+샘플러는 이벤트 루프 스레드 전체를 보므로 동시에 처리 중인 다른 요청의 스택이 섞일 수 있다.
+"""
+
+import asyncio
+import hmac
+import logging
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Optional
+
+import orjson
+
+
+logger = logging.getLogger(__name__)
+
+
+PROFILE_HEADER = "x-meetplanner-profile"
+PROFILE_QUERY = "profile"
+
+_active_profile: ContextVar[Optional["RequestProfile"]] = ContextVar("meetplanner_profile", default=None)
+_NULL_STAGE = nullcontext()
+
+
+def stage(name: str):
+    """현재 요청이 프로파일링 중이면 단계 소요 시간을 기록하는 컨텍스트 매니저 반환"""
+    profile = _active_profile.get()
+    if profile is None:
+        return _NULL_STAGE
+    return _Stage(profile, name)
+
+
+def count(name: str, amount: int = 1) -> None:
+    """현재 요청이 프로파일링 중이면 카운터 증가 (예: VWorld 호출 수)"""
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.counters[name] += amount
+
+
+class _Stage:
+    __slots__ = ("profile", "name", "started")
+
+    def __init__(self, profile: "RequestProfile", name: str):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        stages = self.profile.stages
+        stages[self.name] = stages.get(self.name, 0.0) + elapsed_ms
+        return False
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class RequestProfile:
+    """요청 하나의 프로파일 (with 블록 동안 스택 샘플링과 단계 기록)"""
+
+    def __init__(self, endpoint: str, interval_seconds: float, sampled: bool = False):
+        self.profile_id = secrets.token_hex(8)
+        self.endpoint = endpoint
+        self.interval_seconds = interval_seconds
+        self.sampled = sampled
+        self.stages: dict[str, float] = {}
+        self.counters: Counter = Counter({"vworld_calls": 0})
+        self.stacks: Counter = Counter()
+        self.total_ms = 0.0
+        # 요청이 예외로 끝났으면 예외 표현 (실패한 요청의 프로파일도 보관)
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._target_thread = 0
+        self._token = None
+        self._started = 0.0
+
+    def __enter__(self):
+        self._target_thread = threading.get_ident()
+        self._token = _active_profile.set(self)
+        self._sampler = threading.Thread(target=self._sample, name="meetplanner-profiler", daemon=True)
+        self._sampler.start()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.total_ms = (time.perf_counter() - self._started) * 1000
+        if exc_value is not None:
+            self.error = repr(exc_value)
+        self._stop.set()
+        self._sampler.join()
+        _active_profile.reset(self._token)
+        return False
+
+    def _sample(self) -> None:
+        current_frames = sys._current_frames
+        while not self._stop.wait(self.interval_seconds):
+            frame = current_frames().get(self._target_thread)
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                labels.reverse()
+                self.stacks[";".join(labels)] += 1
+
+    def collapsed(self) -> str:
+        """collapsed stack 형식 ("frame;frame;frame count" 줄 단위, flamegraph.pl/speedscope 입력)"""
+        return "".join(f"{stack} {samples}\n" for stack, samples in self.stacks.most_common())
+
+    def summary(self) -> dict:
+        return {
+            "profile_id": self.profile_id,
+            "endpoint": self.endpoint,
+            "sampled": self.sampled,
+            "created_at": self.created_at,
+            "total_ms": round(self.total_ms, 3),
+            "error": self.error,
+            "stages_ms": {name: round(ms, 3) for name, ms in self.stages.items()},
+            "vworld_calls": self.counters["vworld_calls"],
+            "counters": dict(self.counters),
+            "sample_interval_ms": self.interval_seconds * 1000,
+            "samples": sum(self.stacks.values())
+        }
+
+
+class RequestProfiler:
+    """프로파일링 대상 요청 판별 및 프로파일 보관
+
+    MEETPLANNER_PROFILE_TOKEN이 없으면 온디맨드 프로파일링이 비활성화되고,
+    MEETPLANNER_PROFILE_SAMPLE_RATE(0~1)가 0이면 표본 프로파일링이 비활성화된다.
+    MEETPLANNER_PROFILE_DIR가 설정되면 프로파일을 <id>.folded / <id>.json 파일로도 저장한다.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        sample_rate: Optional[float] = None,
+        interval_ms: Optional[float] = None,
+        max_profiles: Optional[int] = None,
+        directory: Optional[str] = None
+    ):
+        self.token = token if token is not None else os.getenv("MEETPLANNER_PROFILE_TOKEN", "")
+        self.sample_rate = sample_rate if sample_rate is not None else float(
+            os.getenv("MEETPLANNER_PROFILE_SAMPLE_RATE", "0")
+        )
+        self.interval_seconds = (interval_ms if interval_ms is not None else float(
+            os.getenv("MEETPLANNER_PROFILE_INTERVAL_MS", "1")
+        )) / 1000
+        self.max_profiles = max_profiles if max_profiles is not None else int(
+            os.getenv("MEETPLANNER_PROFILE_STORE_SIZE", "64")
+        )
+        self.directory = directory if directory is not None else os.getenv("MEETPLANNER_PROFILE_DIR", "")
+        self._profiles: OrderedDict[str, RequestProfile] = OrderedDict()
+
+    def authorized(self, supplied: Optional[str]) -> bool:
+        return bool(self.token) and supplied is not None and hmac.compare_digest(supplied, self.token)
+
+    def begin(self, headers, query_params, endpoint: str) -> Optional[RequestProfile]:
+        """요청이 프로파일링 대상이면 새 프로파일 반환 (아니면 None)"""
+        if self.token:
+            supplied = headers.get(PROFILE_HEADER) or query_params.get(PROFILE_QUERY)
+            if self.authorized(supplied):
+                return RequestProfile(endpoint, self.interval_seconds)
+        if self.sample_rate and random.random() < self.sample_rate:
+            return RequestProfile(endpoint, self.interval_seconds, sampled=True)
+        return None
+
+    async def store(self, profile: RequestProfile) -> str:
+        """완료된 프로파일을 보관하고 ID 반환 (파일 저장은 이벤트 루프를 막지 않도록 스레드에서 수행)"""
+        self._profiles[profile.profile_id] = profile
+        while len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+        if self.directory:
+            await asyncio.to_thread(self._write, profile)
+        return profile.profile_id
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        return self._profiles.get(profile_id)
+
+    def _write(self, profile: RequestProfile) -> None:
+        base = os.path.join(self.directory, profile.profile_id)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(base + ".folded", "w", encoding="utf-8") as f:
+                f.write(profile.collapsed())
+            with open(base + ".json", "wb") as f:
+                f.write(orjson.dumps(profile.summary()))
+        except OSError as e:
+            logger.warning("profile write failed", extra={"path": base, "error": str(e)})
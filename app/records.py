@@ -0,0 +1,90 @@
+"""추천 파이프라인 내부 레코드 타입
+
+후보 장소, ETA 행, 점수 결과를 dict 대신 __slots__ 기반 dataclass로 표현한다.
+dict 변환은 API 경계(recommend_logic 반환값)에서만 수행한다.
+"""
+
+from array import array
+from dataclasses import dataclass
+
+
+# ETA 행 타입 코드 (unsigned short, 분 단위)
+ETA_TYPECODE = "H"
+
+
+@dataclass(frozen=True, slots=True)
+class Coord:
+    """위경도 좌표"""
+    lat: float
+    lng: float
+
+
+@dataclass(frozen=True, slots=True)
+class Place:
+    """후보 카탈로그의 장소 (요청 간 공유, 불변)
+
+    index는 카탈로그 내 위치로, ETA 행(출발지 -> 카탈로그 전체)의 열 인덱스와 같다.
+    """
+    label: str
+    lat: float
+    lng: float
+    type: str
+    features: tuple[str, ...]
+    index: int
+
+
+@dataclass(slots=True)
+class Fairness:
+    """이동 시간 공정성 지표
+
+    std/mean 외 지표는 fairness 커널(app.fairness)이 계산하며,
+    세션처럼 누적 통계만 있는 경우 기본값 0으로 남는다.
+    """
+    std: float
+    mean: float
+    max: float = 0.0
+    range: float = 0.0
+    gini: float = 0.0
+    p90: float = 0.0
+
+
+@dataclass(slots=True)
+class ScoredCandidate:
+    """점수가 계산된 후보
+
+    col은 ETA 행(출발지 -> 카탈로그 전체)에서 이 후보의 열 인덱스(place.index)로,
+    참가자별 ETA는 행에서 필요할 때만 꺼내 쓴다.
+    """
+    place: Place
+    col: int
+    fairness: Fairness
+    purpose_score: float
+    total_score: float
+
+
+# ETA 행: array('H') 또는 이소크론 격자의 memoryview 슬라이스 (둘 다 정수 인덱싱/순회 가능)
+EtaRow = array | memoryview
+
+
+def eta_row(values) -> array:
+    """정수 ETA 시퀀스를 압축된 ETA 행으로 변환"""
+    return array(ETA_TYPECODE, values)
+
+
+@dataclass(slots=True)
+class RankedResult:
+    """참가자 이름과 무관한 순위 결과 (출발지 조합 + 목적 단위로 캐시)
+
+    rows는 출발지(정규화된 주소)별 카탈로그 전체 ETA 행이며, 참가자 이름은 API 경계에서 연결한다.
+    """
+    coords: dict[str, Coord]
+    rows: dict[str, array]
+    top: list[ScoredCandidate]
+
+
+@dataclass(slots=True)
+class OriginCluster:
+    """대규모 모임 모드의 출발지 클러스터 (가중 대표 지점)"""
+    coord: Coord
+    weight: int
+    origins: list[str]
@@ -0,0 +1,145 @@
+"""지역별 후보 카탈로그 샤드와 bbox 라우팅
+
+전국 후보를 하나의 목록으로 두면 모든 요청이 무관한 지역까지 훑게 되므로, 지역(수도권, 부산,
+대구, 대전, 광주 등)마다 카탈로그, 공간 인덱스, ETA 파라미터를 가진 샤드로 나눈다.
+요청은 참가자 좌표를 포함하는 bbox의 샤드로 보내며, 수도권 외 샤드는 처음 사용될 때
+app/catalogs/<region>.json을 읽어 컴파일한다. 수도권 트래픽만 있으면 다른 샤드는 메모리에 올라오지 않는다.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Optional
+
+from .candidates import CandidateGenerator
+from .estimator import TransitEstimator
+from .records import Coord
+
+
+logger = logging.getLogger(__name__)
+
+CATALOG_DIR = os.path.join(os.path.dirname(__file__), "catalogs")
+
+DEFAULT_REGION = "seoul"
+
+# (지역 ID, 이름, bbox (south, west, north, east))
+# 카탈로그 파일은 catalogs/<지역 ID>.json (수도권은 CandidateGenerator.MAJOR_LOCATIONS)
+REGIONS = [
+    ("seoul", "수도권", (36.90, 126.30, 38.00, 127.80)),
+    ("busan", "부산", (34.95, 128.75, 35.40, 129.35)),
+    ("daegu", "대구", (35.70, 128.35, 36.05, 128.85)),
+    ("daejeon", "대전", (36.18, 127.25, 36.50, 127.56)),
+    ("gwangju", "광주", (35.05, 126.65, 35.27, 127.02)),
+]
+
+
+class RegionShard:
+    """지역 하나의 후보 카탈로그(공간 인덱스 포함)와 ETA 추정기 (처음 사용 시 로드)"""
+
+    def __init__(
+        self,
+        region: str,
+        name: str,
+        bbox: tuple[float, float, float, float],
+        generator: Optional[CandidateGenerator] = None,
+        estimator: Optional[TransitEstimator] = None
+    ):
+        self.region = region
+        self.name = name
+        self.bbox = bbox
+        self._generator = generator
+        self._estimator = estimator
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._generator is not None
+
+    @property
+    def generator(self) -> CandidateGenerator:
+        if self._generator is None:
+            self._load()
+        return self._generator
+
+    @property
+    def estimator(self) -> TransitEstimator:
+        if self._estimator is None:
+            self._load()
+        return self._estimator
+
+    @property
+    def center(self) -> Coord:
+        south, west, north, east = self.bbox
+        return Coord((south + north) / 2, (west + east) / 2)
+
+    def contains(self, coord: Coord) -> bool:
+        south, west, north, east = self.bbox
+        return south <= coord.lat <= north and west <= coord.lng <= east
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._generator is not None:
+                return
+            path = os.path.join(CATALOG_DIR, f"{self.region}.json")
+            with open(path, "r", encoding="utf-8") as f:
+                catalog = json.load(f)
+            eta = catalog.get("eta", {})
+            self._estimator = TransitEstimator(eta.get("avg_speed_kmh"), eta.get("base_wait_time"))
+            self._generator = CandidateGenerator(catalog["places"])
+            logger.info("region shard loaded", extra={"region": self.region, "places": len(self._generator.places)})
+
+
+class RegionRouter:
+    """참가자 좌표 -> 지역 샤드 라우팅
+
+    Args:
+        default_generator: 수도권 샤드의 후보 생성기 (서비스 기본 카탈로그, 미리 로드됨)
+        default_estimator: 수도권 샤드의 ETA 추정기
+    """
+
+    def __init__(self, default_generator: CandidateGenerator, default_estimator: TransitEstimator):
+        self.shards: dict[str, RegionShard] = {}
+        for region, name, bbox in REGIONS:
+            if region == DEFAULT_REGION:
+                self.shards[region] = RegionShard(region, name, bbox, default_generator, default_estimator)
+            else:
+                self.shards[region] = RegionShard(region, name, bbox)
+
+    def get(self, region: str) -> RegionShard:
+        return self.shards.get(region) or self.shards[DEFAULT_REGION]
+
+    def route(self, coords: list[Coord]) -> RegionShard:
+        """
+        참가자 좌표를 가장 많이 포함하는 샤드 선택
+
+        참가자가 여러 지역에 걸쳐 있으면 가장 많은 참가자를 포함하는 샤드(동률이면 참가자 중심점을
+        포함하는 샤드 우선, 그다음 기본 샤드 우선)를, 어느 bbox에도 속하지 않으면 중심점에서
+        가장 가까운 샤드를 사용한다. bbox 비교만 하므로 샤드 데이터는 로드하지 않는다.
+        """
+        if not coords:
+            return self.shards[DEFAULT_REGION]
+
+        centroid = Coord(sum(c.lat for c in coords) / len(coords), sum(c.lng for c in coords) / len(coords))
+        best, best_key = None, None
+        for shard in self.shards.values():
+            covered = sum(1 for coord in coords if shard.contains(coord))
+            if covered == 0:
+                continue
+            key = (covered, shard.contains(centroid), shard.region == DEFAULT_REGION)
+            if best_key is None or key > best_key:
+                best, best_key = shard, key
+        if best is not None:
+            return best
+
+        return min(
+            self.shards.values(),
+            key=lambda shard: (shard.center.lat - centroid.lat) ** 2 + (shard.center.lng - centroid.lng) ** 2
+        )
+
+    def loaded_regions(self) -> list[str]:
+        return [region for region, shard in self.shards.items() if shard.loaded]
+
+    def catalog_nbytes(self) -> dict[str, int]:
+        """로드된 샤드별 카탈로그 추정 바이트 (로드되지 않은 샤드는 로드하지 않음)"""
+        return {region: shard.generator.nbytes() for region, shard in self.shards.items() if shard.loaded}
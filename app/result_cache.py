@@ -0,0 +1,77 @@
+"""추천 순위 결과 캐시
+
+같은 출발지 조합(순서 무관), 목적, 공정성 지표의 요청은 같은 순위 결과를 가지므로,
+참가자 이름과 분리된 RankedResult를 LRU로 보관한다.
+"""
+
+import os
+import sys
+from collections import OrderedDict
+from typing import Optional
+
+from .memory import ODICT_ENTRY_BYTES
+from .records import Coord, Fairness, RankedResult, ScoredCandidate
+
+
+# 상위 후보 하나의 추정 바이트 (ScoredCandidate + Fairness, Place는 카탈로그와 공유)
+_SCORED_BYTES = sys.getsizeof(ScoredCandidate(None, 0, Fairness(0.0, 0.0), 0, 0.0)) + sys.getsizeof(Fairness(0.0, 0.0))
+_COORD_BYTES = sys.getsizeof(Coord(0.0, 0.0)) + 2 * sys.getsizeof(0.0)
+
+
+def ranked_result_nbytes(key: tuple, result: RankedResult) -> int:
+    """캐시 항목 하나의 추정 바이트 (ETA 행 배열은 ETA 행 캐시와 공유되어도 포함)"""
+    size = ODICT_ENTRY_BYTES + sys.getsizeof(key) + sys.getsizeof(key[0])
+    size += sys.getsizeof(result.coords) + sys.getsizeof(result.rows) + sys.getsizeof(result.top)
+    size += sum(sys.getsizeof(origin) + _COORD_BYTES for origin in result.coords)
+    size += sum(sys.getsizeof(row) for row in result.rows.values())
+    return size + len(result.top) * _SCORED_BYTES
+
+
+def ranking_key(origins, purpose: str, fairness_metric: str = "std") -> tuple[tuple[str, ...], str, str]:
+    """정규화된 출발지 목록(중복 포함), 목적, 공정성 지표로 캐시 키 생성"""
+    return (tuple(sorted(origins)), purpose, fairness_metric)
+
+
+class RecommendationCache:
+    """(출발지 조합, 목적, 공정성 지표) -> RankedResult LRU 캐시"""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries if max_entries is not None else int(
+            os.getenv("MEETPLANNER_RESULT_CACHE_SIZE", "2048")
+        )
+        self._entries: OrderedDict[tuple, RankedResult] = OrderedDict()
+        # 캐시 추정 바이트 (전역 메모리 예산용)
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._entries
+
+    def get(self, key: tuple) -> Optional[RankedResult]:
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: tuple, result: RankedResult) -> None:
+        previous = self._entries.get(key)
+        if previous is not None:
+            self.nbytes -= ranked_result_nbytes(key, previous)
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        self.nbytes += ranked_result_nbytes(key, result)
+        while len(self._entries) > self.max_entries:
+            self._evict_oldest()
+
+    def shrink_to(self, max_bytes: int) -> int:
+        """캐시 추정 바이트가 max_bytes 이하가 될 때까지 오래된 항목 제거 (제거한 바이트 반환)"""
+        before = self.nbytes
+        while self.nbytes > max_bytes and self._entries:
+            self._evict_oldest()
+        return before - self.nbytes
+
+    def _evict_oldest(self) -> None:
+        key, result = self._entries.popitem(last=False)
+        self.nbytes -= ranked_result_nbytes(key, result)
@@ -1,5 +1,7 @@
-import statistics
-from typing import Optional
+from .fairness import (
+    FAIRNESS_METRICS, column_fairness, fairness_table, weighted_column_fairness, weighted_fairness_table
+)
+from .records import Fairness, Place
 
 
 class Scoring:
@@ -17,10 +19,22 @@ class Scoring:
         "date": ["cafe", "restaurant", "culture"],
     }
 
+    # 알 수 없는 목적의 선호 특성
+    DEFAULT_PURPOSE_FEATURES = ["cafe", "restaurant"]
+
     # 목적별 기본 점수 (특성 매칭 시 가산)
     FEATURE_SCORE = 20
 
-    def calculate_fairness(self, eta_list: list[int]) -> dict:
+    # 공정성 지표별 감점 가중치 (지표 1단위당 감점)
+    FAIRNESS_PENALTIES = {
+        "std": 5,        # 표준편차 1분당 5점
+        "range": 3.5,    # 최대-최소 차이 1분당 3.5점
+        "minimax": 2,    # 가장 오래 걸리는 사람의 이동 시간 1분당 2점
+        "gini": 100,     # 지니 계수 0.01당 1점
+        "p90": 2,        # 90 백분위 이동 시간 1분당 2점
+    }
+
+    def calculate_fairness(self, eta_list: list[int]) -> Fairness:
         """
         이동 시간 공정성 점수 계산
 
@@ -28,20 +42,49 @@ class Scoring:
             eta_list: 각 참가자의 예상 이동 시간 리스트
 
         Returns:
-            {"std": float, "mean": float}
+            공정성 지표 (std, mean, max, range, gini, p90)
+        """
+        return column_fairness(eta_list)
+
+    def calculate_weighted_fairness(self, eta_list: list[int], weights: list[int]) -> Fairness:
+        """
+        가중치(대표 지점별 참가자 수)가 있는 이동 시간 공정성 점수 계산
+
+        Args:
+            eta_list: 대표 지점별 예상 이동 시간 리스트
+            weights: 대표 지점별 참가자 수
+
+        Returns:
+            공정성 지표 (std, mean, max, range, gini, p90)
+        """
+        return weighted_column_fairness(eta_list, weights)
+
+    def calculate_fairness_table(self, eta_rows: list) -> list[Fairness]:
+        """
+        참가자 x 후보 ETA 행렬의 모든 후보에 대한 공정성 점수를 한 번에 계산
+
+        Args:
+            eta_rows: 참가자별 ETA 행
+
+        Returns:
+            후보 순서의 공정성 지표 리스트
         """
-        if len(eta_list) < 2:
-            return {"std": 0.0, "mean": eta_list[0] if eta_list else 0.0}
+        return fairness_table(eta_rows)
 
-        mean_eta = statistics.mean(eta_list)
-        std_eta = statistics.stdev(eta_list)
+    def calculate_weighted_fairness_table(self, eta_rows: list, weights: list[int]) -> list[Fairness]:
+        """
+        대표 지점(클러스터) x 후보 ETA 행렬의 가중 공정성 점수 계산
+
+        Args:
+            eta_rows: 대표 지점별 ETA 행
+            weights: 대표 지점별 참가자 수
 
-        return {
-            "std": round(std_eta, 2),
-            "mean": round(mean_eta, 2)
-        }
+        Returns:
+            후보 순서의 공정성 지표 리스트
+        """
+        return weighted_fairness_table(eta_rows, weights)
 
-    def calculate_purpose_score(self, candidate: dict, purpose: str) -> float:
+    def calculate_purpose_score(self, candidate: Place, purpose: str) -> float:
         """
         목적 적합도 점수 계산
 
@@ -53,8 +96,8 @@ class Scoring:
             목적 적합도 점수
         """
         base_score = 100.0
-        features = candidate.get("features", [])
-        preferred_features = self.PURPOSE_FEATURES.get(purpose, ["cafe", "restaurant"])
+        features = candidate.features
+        preferred_features = self.PURPOSE_FEATURES.get(purpose, self.DEFAULT_PURPOSE_FEATURES)
 
         # 선호 특성이 후보 장소에 있으면 가산점
         matching_features = set(features) & set(preferred_features)
@@ -62,26 +105,26 @@ class Scoring:
 
         return base_score + feature_bonus
 
-    def calculate_total_score(self, fairness: dict, purpose_score: float) -> float:
+    def calculate_total_score(self, fairness: Fairness, purpose_score: float, metric: str = "std") -> float:
         """
         종합 점수 계산
 
-        낮은 std(편차)가 좋고, 높은 purpose_score가 좋음
+        선택한 공정성 지표가 낮을수록 좋고, 높은 purpose_score가 좋음
 
         Args:
-            fairness: 공정성 점수 {"std": float, "mean": float}
+            fairness: 공정성 점수
             purpose_score: 목적 적합도 점수
+            metric: 공정성 지표 이름 (std, range, minimax, gini, p90)
 
         Returns:
             종합 점수 (높을수록 좋음)
         """
-        # std가 낮을수록 좋으므로 역수 개념 적용
-        # std가 0이면 최고 점수
-        std_penalty = fairness["std"] * 5  # std 1분당 5점 감점
+        # 지표가 낮을수록 좋으므로 감점 방식 적용 (0이면 최고 점수)
+        fairness_penalty = getattr(fairness, FAIRNESS_METRICS[metric]) * self.FAIRNESS_PENALTIES[metric]
 
         # 평균 이동시간이 짧을수록 좋음
-        mean_penalty = fairness["mean"] * 0.5  # 평균 1분당 0.5점 감점
+        mean_penalty = fairness.mean * 0.5  # 평균 1분당 0.5점 감점
 
-        total = purpose_score - std_penalty - mean_penalty
+        total = purpose_score - fairness_penalty - mean_penalty
 
         return round(total, 2)
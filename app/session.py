@@ -0,0 +1,180 @@
+"""참가자 변경을 증분 반영하는 추천 세션
+
+채팅처럼 참가자가 한 명씩 추가/삭제/변경되는 경우, 세션이 좌표와
+참가자 x 후보 ETA 행렬을 유지하고 후보별 ETA 합/제곱합을 증분 갱신한다.
+참가자 변경 비용은 O(후보 수)로 그룹 크기와 무관하다.
+"""
+
+import math
+import os
+import sys
+import time
+import uuid
+from array import array
+from collections import OrderedDict
+from typing import Optional
+
+from .records import Coord, Fairness, Place, ScoredCandidate
+from .scoring import Scoring
+
+
+class MeetingSession:
+    """한 모임의 좌표, ETA 행렬, 후보별 누적 통계"""
+
+    def __init__(
+        self,
+        session_id: str,
+        places: tuple[Place, ...],
+        purpose: str,
+        scoring: Scoring,
+        region: str = "seoul"
+    ):
+        self.session_id = session_id
+        self.places = places
+        # 세션 생성 시 정해진 지역 샤드 (ETA 행은 이 샤드의 카탈로그 기준)
+        self.region = region
+        self.purpose = purpose
+        self.coords: dict[str, Coord] = {}
+        self.rows: dict[str, array] = {}
+        self.touched_at = time.monotonic()
+
+        # ETA는 정수이므로 합/제곱합을 정수로 누적하면 추가/삭제를 반복해도 오차가 없다
+        self._sums = [0] * len(places)
+        self._sq_sums = [0] * len(places)
+
+        # 목적 적합도는 참가자와 무관하므로 세션 생성 시 한 번만 계산
+        self._purpose_scores = [scoring.calculate_purpose_score(place, purpose) for place in places]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def upsert(self, name: str, coord: Coord, row: array) -> None:
+        """참가자 추가 또는 출발지 변경 (ETA 행 하나만 반영)"""
+        if name in self.rows:
+            self.remove(name)
+
+        sums, sq_sums = self._sums, self._sq_sums
+        for col, eta in enumerate(row):
+            sums[col] += eta
+            sq_sums[col] += eta * eta
+
+        self.coords[name] = coord
+        self.rows[name] = row
+
+    def remove(self, name: str) -> bool:
+        """참가자 삭제 (ETA 행 하나만 차감)"""
+        row = self.rows.pop(name, None)
+        if row is None:
+            return False
+        del self.coords[name]
+
+        sums, sq_sums = self._sums, self._sq_sums
+        for col, eta in enumerate(row):
+            sums[col] -= eta
+            sq_sums[col] -= eta * eta
+        return True
+
+    def fairness(self, col: int) -> Fairness:
+        """누적 통계로부터 후보의 공정성 지표 계산 (표본 표준편차)"""
+        n = len(self.rows)
+        if n == 0:
+            return Fairness(std=0.0, mean=0.0)
+
+        total = self._sums[col]
+        if n < 2:
+            return Fairness(std=0.0, mean=total)
+
+        variance = (n * self._sq_sums[col] - total * total) / (n * (n - 1))
+        return Fairness(std=round(math.sqrt(variance), 2), mean=round(total / n, 2))
+
+    def nbytes(self) -> int:
+        """세션 추정 바이트 (ETA 행 + 후보별 누적 통계, 정수는 개당 28바이트로 근사)"""
+        size = sys.getsizeof(self.coords) + sys.getsizeof(self.rows)
+        size += sum(sys.getsizeof(name) + sys.getsizeof(row) for name, row in self.rows.items())
+        size += len(self.coords) * sys.getsizeof(Coord(0.0, 0.0))
+        for values in (self._sums, self._sq_sums, self._purpose_scores):
+            size += sys.getsizeof(values) + 28 * len(values)
+        return size
+
+    def rank(self, scoring: Scoring, limit: int = 5) -> list[ScoredCandidate]:
+        """현재 참가자 기준 상위 후보 반환"""
+        scored = []
+        for col, place in enumerate(self.places):
+            fairness = self.fairness(col)
+            purpose_score = self._purpose_scores[col]
+            scored.append(ScoredCandidate(
+                place=place,
+                col=col,
+                fairness=fairness,
+                purpose_score=purpose_score,
+                total_score=scoring.calculate_total_score(fairness, purpose_score)
+            ))
+
+        scored.sort(key=lambda x: x.total_score, reverse=True)
+        return scored[:limit]
+
+
+class SessionStore:
+    """TTL 기반으로 만료되는 세션 저장소
+
+    마지막 접근 순서로 정렬된 OrderedDict를 사용하므로 만료 세션은 항상 앞쪽에 있다.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_sessions: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("MEETPLANNER_SESSION_TTL", "1800")
+        )
+        self.max_sessions = max_sessions if max_sessions is not None else int(
+            os.getenv("MEETPLANNER_SESSION_MAX", "10000")
+        )
+        self._sessions: OrderedDict[str, MeetingSession] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def nbytes(self) -> int:
+        """전체 세션 추정 바이트 (세션 수에 비례하므로 지표 조회 시에만 호출)"""
+        return sum(session.nbytes() for session in self._sessions.values())
+
+    def create(
+        self,
+        places: tuple[Place, ...],
+        purpose: str,
+        scoring: Scoring,
+        region: str = "seoul"
+    ) -> MeetingSession:
+        """새 세션 생성"""
+        self.evict_expired()
+        while len(self._sessions) >= self.max_sessions:
+            self._sessions.popitem(last=False)
+
+        session = MeetingSession(uuid.uuid4().hex, places, purpose, scoring, region)
+        self._sessions[session.session_id] = session
+        return session
+
+    def get(self, session_id: str) -> Optional[MeetingSession]:
+        """세션 조회 (접근 시 TTL 갱신, 만료 시 None)"""
+        self.evict_expired()
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+
+        session.touched_at = time.monotonic()
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def delete(self, session_id: str) -> bool:
+        """세션 삭제"""
+        return self._sessions.pop(session_id, None) is not None
+
+    def evict_expired(self) -> int:
+        """만료된 세션 제거 후 제거 수 반환"""
+        deadline = time.monotonic() - self.ttl_seconds
+        evicted = 0
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if session.touched_at > deadline:
+                break
+            self._sessions.popitem(last=False)
+            evicted += 1
+        return evicted
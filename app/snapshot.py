@@ -0,0 +1,123 @@
+"""웜 스테이트 스냅샷
+
+scale-to-zero 환경에서 머신이 깨어날 때 빈 캐시로 시작하지 않도록,
+자주 쓰인 지오코딩 결과와 설명 문장 테이블을 파일로 저장해 두었다가 부팅 시 불러온다.
+저장은 주기적으로, 그리고 종료 시 수행한다. 후보 카탈로그는 코드에서 컴파일하는 비용이
+스냅샷을 읽는 비용과 같으므로 저장하지 않는다.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Optional
+
+import orjson
+
+from .explanation import ExplanationGenerator
+from .geocoder import VWorldGeocoder
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+class WarmStateSnapshot:
+    """웜 스테이트 스냅샷 로더/저장기
+
+    MEETPLANNER_SNAPSHOT_PATH가 설정되지 않으면 비활성화된다.
+    """
+
+    def __init__(
+        self,
+        geocoder: VWorldGeocoder,
+        explanation_generator: ExplanationGenerator,
+        path: Optional[str] = None,
+        interval_seconds: Optional[float] = None,
+        max_geocode_entries: Optional[int] = None
+    ):
+        self.geocoder = geocoder
+        self.explanation_generator = explanation_generator
+        self.path = path if path is not None else os.getenv("MEETPLANNER_SNAPSHOT_PATH", "")
+        self.interval_seconds = interval_seconds if interval_seconds is not None else float(
+            os.getenv("MEETPLANNER_SNAPSHOT_INTERVAL", "300")
+        )
+        self.max_geocode_entries = max_geocode_entries if max_geocode_entries is not None else int(
+            os.getenv("MEETPLANNER_SNAPSHOT_GEOCODE_ENTRIES", "5000")
+        )
+        self._saved_state: Optional[tuple[int, int]] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def load(self) -> bool:
+        """스냅샷을 읽어 캐시/테이블을 채움 (파일이 없거나 손상되면 False)"""
+        if not self.enabled or not os.path.exists(self.path):
+            return False
+
+        try:
+            with open(self.path, "rb") as f:
+                state = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning("snapshot load failed", extra={"path": self.path, "error": str(e)})
+            return False
+
+        if state.get("version") != SNAPSHOT_VERSION:
+            return False
+
+        for address, lat, lng in state.get("geocode", []):
+            self.geocoder.remember(address, lat, lng)
+        self.explanation_generator.warm(state.get("explanation_keys", []))
+
+        self._saved_state = self._current_state()
+        return True
+
+    def save(self, force: bool = False) -> bool:
+        """현재 상태를 스냅샷으로 저장 (변경이 없으면 건너뜀)"""
+        data = self._serialize(force)
+        return data is not None and self._write(*data)
+
+    async def run_periodic(self) -> None:
+        """interval_seconds마다 변경 사항이 있으면 저장"""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            # 캐시 직렬화는 이벤트 루프에서, 파일 쓰기만 스레드에서 수행
+            data = self._serialize()
+            if data is not None:
+                await asyncio.to_thread(self._write, *data)
+
+    def _serialize(self, force: bool = False) -> Optional[tuple[bytes, tuple[int, int]]]:
+        if not self.enabled:
+            return None
+
+        current = self._current_state()
+        if not force and current == self._saved_state:
+            return None
+
+        state = {
+            "version": SNAPSHOT_VERSION,
+            "geocode": self.geocoder.hot_entries(self.max_geocode_entries),
+            "explanation_keys": self.explanation_generator.compiled_keys(),
+        }
+        return orjson.dumps(state), current
+
+    def _write(self, data: bytes, state: tuple[int, int]) -> bool:
+        # 임시 파일에 쓴 뒤 교체하여 저장 도중 종료되어도 기존 스냅샷이 깨지지 않도록 함
+        tmp_path = f"{self.path}.tmp"
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("snapshot save failed", extra={"path": self.path, "error": str(e)})
+            return False
+
+        self._saved_state = state
+        return True
+
+    def _current_state(self) -> tuple[int, int]:
+        return (self.geocoder.cache_version, len(self.explanation_generator.compiled_keys()))
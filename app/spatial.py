@@ -0,0 +1,85 @@
+"""후보 카탈로그용 격자 공간 인덱스
+
+장소를 고정 크기 위경도 격자 셀에 나누어 두고, 기준점에서 가까운 k개를 찾을 때
+기준 셀부터 바깥쪽 고리(ring) 순서로만 살펴본다. 카탈로그가 k개 이하이면 전체를 정렬한다.
+"""
+
+import math
+import sys
+from typing import Callable
+
+from .clustering import METERS_PER_DEGREE
+from .records import Coord, Place
+
+
+class GridIndex:
+    """위경도 격자 버킷 기반 k-최근접 장소 검색
+
+    Args:
+        places: 카탈로그 장소 (place.index 순서)
+        cell_degrees: 격자 셀 크기 (위경도 도 단위, 기본 약 5.5km)
+    """
+
+    def __init__(self, places: tuple[Place, ...], cell_degrees: float = 0.05):
+        self.places = places
+        self.cell_degrees = cell_degrees
+        self._buckets: dict[tuple[int, int], list[Place]] = {}
+        for place in places:
+            self._buckets.setdefault(self._cell(place.lat, place.lng), []).append(place)
+
+        if places:
+            max_abs_lat = max(abs(place.lat) for place in places)
+            # 셀 한 칸의 최소 실제 길이(km): 경도 방향은 고위도일수록 짧다
+            self._min_cell_km = cell_degrees * METERS_PER_DEGREE / 1000 * math.cos(math.radians(max_abs_lat))
+            rows = [cell[0] for cell in self._buckets]
+            cols = [cell[1] for cell in self._buckets]
+            self._extent = (min(rows), min(cols), max(rows), max(cols))
+
+    def nbytes(self) -> int:
+        """버킷 구조의 추정 바이트 (Place는 카탈로그와 공유하므로 제외)"""
+        return sys.getsizeof(self._buckets) + sum(
+            sys.getsizeof(cell) + sys.getsizeof(bucket) for cell, bucket in self._buckets.items()
+        )
+
+    def _cell(self, lat: float, lng: float) -> tuple[int, int]:
+        return (math.floor(lat / self.cell_degrees), math.floor(lng / self.cell_degrees))
+
+    def nearest(self, origin: Coord, k: int, distance_km: Callable[[Place], float]) -> list[Place]:
+        """
+        origin에서 가까운 순으로 최대 k개 장소 반환
+
+        Args:
+            origin: 기준 좌표
+            k: 반환할 최대 장소 수
+            distance_km: 장소 -> origin까지 거리(km) 함수 (정렬 기준)
+        """
+        if k >= len(self.places):
+            return sorted(self.places, key=distance_km)
+
+        center_row, center_col = self._cell(origin.lat, origin.lng)
+        min_row, min_col, max_row, max_col = self._extent
+        # 모든 버킷을 덮는 데 필요한 최대 고리 반경
+        max_ring = max(
+            abs(center_row - min_row), abs(center_row - max_row),
+            abs(center_col - min_col), abs(center_col - max_col)
+        )
+
+        found: list[Place] = []
+        ring = 0
+        while True:
+            for row in range(center_row - ring, center_row + ring + 1):
+                step = 1 if row in (center_row - ring, center_row + ring) else 2 * ring
+                for col in range(center_col - ring, center_col + ring + 1, max(step, 1)):
+                    found.extend(self._buckets.get((row, col), ()))
+
+            if ring >= max_ring:
+                break
+            if len(found) >= k:
+                found.sort(key=distance_km)
+                # 살펴보지 않은 장소는 모두 ring칸 이상 떨어져 있으므로, k번째가 그보다 가까우면 확정
+                if distance_km(found[k - 1]) <= ring * self._min_cell_km:
+                    return found[:k]
+            ring += 1
+
+        found.sort(key=distance_km)
+        return found[:k]
@@ -0,0 +1,232 @@
+"""요청 ID 전파와 경량 트레이싱 스팬
+
+HTTP 미들웨어가 요청마다 요청 ID(X-Request-Id 헤더 또는 새로 생성)와 트레이스 ID를
+ContextVar에 설정하면, 그 요청에서 만든 스팬(지오코딩 시도, 후보 생성, 점수 계산, 설명 생성 등)이
+같은 트레이스로 묶인다. asyncio.gather 등으로 만든 하위 태스크도 컨텍스트를 물려받는다.
+
+완료된 스팬은 큐에 넣기만 하고, 백그라운드 스레드가 모아서 OTLP/JSON 형식으로 내보낸다.
+
+    MEETPLANNER_TRACE_FILE     OTLP/JSON 줄 단위 파일로 저장 (collector의 file 수신기/exporter와 같은 형식)
+    MEETPLANNER_OTLP_ENDPOINT  OTLP/HTTP 수집기 주소 (예: http://localhost:4318, /v1/traces로 전송)
+
+둘 다 설정하지 않으면 스팬을 만들지 않으며(요청 ID만 전파), 스팬 위치는 요청 프로파일링의
+단계 시간 기록(profiling.stage)으로만 동작한다.
+"""
+
+import logging
+import os
+import queue
+import secrets
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+import orjson
+
+from . import profiling
+
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = "x-request-id"
+SERVICE_NAME = "meetplanner"
+
+# OTLP SpanKind / StatusCode
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_request_id: ContextVar[str] = ContextVar("meetplanner_request_id", default="")
+_current_span: ContextVar[Optional["Span"]] = ContextVar("meetplanner_span", default=None)
+
+
+def current_request_id() -> str:
+    return _request_id.get()
+
+
+def current_trace_id() -> str:
+    span = _current_span.get()
+    return span.trace_id if span is not None else ""
+
+
+def new_request_id() -> str:
+    return secrets.token_hex(16)
+
+
+def _attribute(key: str, value) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class Span:
+    """트레이스 스팬 하나 (with 블록 동안 현재 스팬으로 설정)"""
+
+    __slots__ = (
+        "tracer", "name", "kind", "attributes", "trace_id", "span_id", "parent_id",
+        "start_ns", "end_ns", "status", "_token", "_stage"
+    )
+
+    def __init__(self, tracer: "Tracer", name: str, kind: int = SPAN_KIND_INTERNAL, attributes: Optional[dict] = None):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes or {}
+        parent = _current_span.get()
+        self.trace_id = parent.trace_id if parent is not None else secrets.token_hex(16)
+        self.parent_id = parent.span_id if parent is not None else ""
+        self.span_id = secrets.token_hex(8)
+        self.status = STATUS_OK
+        self._stage = profiling.stage(name)
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self):
+        self._stage.__enter__()
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        self._stage.__exit__(exc_type, exc, tb)
+        if exc_type is not None:
+            self.status = STATUS_ERROR
+            self.attributes["error.type"] = exc_type.__name__
+        self.tracer.finish(self)
+        return False
+
+    def to_otlp(self) -> dict:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": self.status}
+        }
+
+
+class Tracer:
+    """스팬 생성과 백그라운드 내보내기 (내보낼 곳이 없으면 비활성)"""
+
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        otlp_endpoint: Optional[str] = None,
+        flush_interval: float = 1.0,
+        max_batch: int = 512
+    ):
+        self.file_path = file_path if file_path is not None else os.getenv("MEETPLANNER_TRACE_FILE", "")
+        endpoint = otlp_endpoint if otlp_endpoint is not None else os.getenv("MEETPLANNER_OTLP_ENDPOINT", "")
+        self.otlp_url = f"{endpoint.rstrip('/')}/v1/traces" if endpoint else ""
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.file_path or self.otlp_url)
+
+    def span(self, name: str, kind: int = SPAN_KIND_INTERNAL, **attributes):
+        """스팬 컨텍스트 매니저 (비활성이면 프로파일링 단계 기록만 수행)"""
+        if not self.enabled:
+            return profiling.stage(name)
+        return Span(self, name, kind, attributes)
+
+    def finish(self, span: Span) -> None:
+        self._queue.put(span)
+
+    def start(self) -> None:
+        if self.enabled and self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="meetplanner-tracer", daemon=True)
+            self._thread.start()
+
+    def shutdown(self) -> None:
+        """남은 스팬을 내보내고 백그라운드 스레드 종료"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self._flush()
+        self._flush()
+
+    def _drain(self) -> list[Span]:
+        spans = []
+        while len(spans) < self.max_batch:
+            try:
+                spans.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return spans
+
+    def _flush(self) -> None:
+        while True:
+            spans = self._drain()
+            if not spans:
+                return
+            payload = orjson.dumps({
+                "resourceSpans": [{
+                    "resource": {"attributes": [_attribute("service.name", SERVICE_NAME)]},
+                    "scopeSpans": [{
+                        "scope": {"name": "app.tracing"},
+                        "spans": [span.to_otlp() for span in spans]
+                    }]
+                }]
+            })
+            self._export(payload, len(spans))
+
+    def _export(self, payload: bytes, count: int) -> None:
+        if self.file_path:
+            try:
+                with open(self.file_path, "ab") as f:
+                    f.write(payload + b"\n")
+            except OSError as e:
+                logger.warning("trace file export failed", extra={"path": self.file_path, "error": str(e)})
+        if self.otlp_url:
+            # OTLP 내보내기를 쓰지 않는 프로세스의 부팅 시간에 포함되지 않도록 필요할 때 import
+            import urllib.request
+
+            request = urllib.request.Request(
+                self.otlp_url, data=payload, headers={"Content-Type": "application/json"}, method="POST"
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=5) as response:
+                    response.read()
+            except OSError as e:
+                logger.warning(
+                    "OTLP export failed", extra={"endpoint": self.otlp_url, "spans": count, "error": str(e)}
+                )
+
+
+tracer = Tracer()
+
+
+def span(name: str, **attributes):
+    """모듈 전역 트레이서의 스팬 (with span("scoring"): ...)"""
+    return tracer.span(name, **attributes)
+
+
+def begin_request(request_id: Optional[str] = None) -> str:
+    """현재 컨텍스트에 요청 ID 설정 (없거나 형식이 이상하면 새로 생성) 후 반환"""
+    if not request_id or len(request_id) > 128 or not request_id.isprintable():
+        request_id = new_request_id()
+    _request_id.set(request_id)
+    return request_id
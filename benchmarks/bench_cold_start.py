@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""콜드 스타트 벤치마크: 머신 기상 -> 첫 /recommend 응답까지의 시간
+
+1. 새 프로세스에서 app.main import 시간
+2. 웜 스테이트 스냅샷을 준비한 뒤 uvicorn 프로세스를 띄우고,
+   프로세스 시작부터 첫 /recommend 200 응답까지의 시간
+
+스냅샷에 참가자 출발지의 지오코딩 결과가 들어 있으므로 VWorld 호출 없이 측정된다.
+
+실행: python -m benchmarks.bench_cold_start [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PARTICIPANTS = [
+    {"name": "A", "origin_text": "강남역"},
+    {"name": "B", "origin_text": "홍대입구역"},
+    {"name": "C", "origin_text": "잠실역"},
+]
+
+
+def measure_import(env: dict) -> float:
+    code = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def write_snapshot(path: str) -> None:
+    sys.path.insert(0, ROOT)
+    from app.candidates import CandidateGenerator
+    from app.explanation import ExplanationGenerator
+    from app.geocoder import VWorldGeocoder
+    from app.snapshot import WarmStateSnapshot
+
+    candidate_generator = CandidateGenerator()
+    geocoder = VWorldGeocoder()
+    for place in candidate_generator.places:
+        geocoder.remember(place.label, place.lat, place.lng)
+    WarmStateSnapshot(geocoder, ExplanationGenerator(), path=path).save(force=True)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_first_recommend(env: dict, timeout: float = 30.0) -> tuple[float, float]:
+    """(프로세스 시작 -> 첫 200 응답, 첫 요청 자체의 지연) 초 단위"""
+    port = free_port()
+    body = json.dumps({"participants": PARTICIPANTS, "purpose": "cafe_talk"}).encode("utf-8")
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            request = urllib.request.Request(
+                f"http://127.0.0.1:{port}/recommend", data=body,
+                headers={"Content-Type": "application/json"}
+            )
+            sent = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=5) as response:
+                    if response.status == 200:
+                        done = time.perf_counter()
+                        return done - started, done - sent
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise TimeoutError("server did not answer /recommend in time")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = os.path.join(tmp, "warm_state.json")
+        write_snapshot(snapshot_path)
+
+        env = dict(os.environ, VWORLD_API_KEY="bench", MEETPLANNER_SNAPSHOT_PATH=snapshot_path)
+        imports = [measure_import(env) for _ in range(args.runs)]
+        wakes = [measure_first_recommend(env) for _ in range(args.runs)]
+        print(f"snapshot: {os.path.getsize(snapshot_path)} bytes")
+
+    print(f"import app.main        median {statistics.median(imports) * 1000:7.1f} ms")
+    print(f"wake -> first 200      median {statistics.median(w[0] for w in wakes) * 1000:7.1f} ms")
+    print(f"first /recommend only  median {statistics.median(w[1] for w in wakes) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""ETA 행 캐시 벤치마크: 출발지가 겹치는 서로 다른 모임 스트림에서의 적중률, 계산 시간, 근사 오차
+
+출발지는 Zipf 분포의 인기 출발지 풀에서 뽑고(같은 출발지 문자열은 같은 좌표), 모임 구성은 매번 새로 만든다.
+실행: python -m benchmarks.bench_eta_cache [--groups 5000] [--pool 2000]
+"""
+
+import argparse
+import random
+import time
+
+from app.candidates import CandidateGenerator
+from app.estimator import TransitEstimator
+from app.eta_cache import EtaRowCache
+from app.isochrone import SEOUL_BBOX
+from app.records import Coord
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=5000)
+    parser.add_argument("--pool", type=int, default=2000, help="서로 다른 출발지 수")
+    parser.add_argument("--group-size", type=int, default=5)
+    parser.add_argument("--cell", type=float, default=100)
+    args = parser.parse_args()
+
+    places = CandidateGenerator().places
+    estimator = TransitEstimator()
+
+    rng = random.Random(11)
+    south, west, north, east = SEOUL_BBOX
+    pool = [Coord(rng.uniform(south, north), rng.uniform(west, east)) for _ in range(args.pool)]
+    weights = [1 / (rank + 1) for rank in range(args.pool)]
+    groups = [rng.choices(pool, weights, k=args.group_size) for _ in range(args.groups)]
+
+    started = time.perf_counter()
+    for group in groups:
+        for origin in group:
+            estimator.estimate_row(origin, places)
+    uncached_s = time.perf_counter() - started
+
+    cache = EtaRowCache(max_bytes=16 * 1024 * 1024, cell_meters=args.cell)
+    started = time.perf_counter()
+    for group in groups:
+        for origin in group:
+            cache.row("seoul", origin, estimator, places)
+    cached_s = time.perf_counter() - started
+
+    errors = [
+        abs(a - b)
+        for origin in pool[:500]
+        for a, b in zip(cache.row("seoul", origin, estimator, places), estimator.estimate_row(origin, places))
+    ]
+
+    lookups = args.groups * args.group_size
+    print(f"{args.groups} groups x {args.group_size} origins from a pool of {args.pool} (Zipf), "
+          f"{len(places)} places, {args.cell:.0f} m cells")
+    print(f"  hit ratio    {cache.hits / (cache.hits + cache.misses) * 100:8.1f} %  ({cache.misses} rows computed)")
+    print(f"  per origin   {cached_s / lookups * 1e6:8.2f} us  (uncached {uncached_s / lookups * 1e6:.2f} us, "
+          f"{uncached_s / cached_s:.1f}x)")
+    print(f"  cache size   {cache.nbytes / 1024:8.1f} KiB  ({len(cache)} rows)")
+    print(f"  abs error    max {max(errors)} min, mean {sum(errors) / len(errors):.3f} min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""공정성 계산 벤치마크: statistics 기반 후보별 계산 vs 일괄 fairness 커널
+
+후보 50개에 대해 참가자 수별로 한 요청분의 공정성 계산 시간을 비교하고,
+std/mean이 기존 구현과 반올림 결과까지 같은지 확인한다.
+
+실행: python -m benchmarks.bench_fairness [--candidates 50]
+"""
+
+import argparse
+import random
+import statistics
+import timeit
+
+from app.fairness import fairness_table
+from app.records import eta_row
+
+
+def legacy_fairness(eta_rows: list, n_candidates: int) -> list[dict]:
+    """기존 Scoring.calculate_fairness (statistics.mean/stdev, 후보마다 열 구성)"""
+    results = []
+    for col in range(n_candidates):
+        eta_list = [row[col] for row in eta_rows]
+        results.append({
+            "std": round(statistics.stdev(eta_list), 2),
+            "mean": round(statistics.mean(eta_list), 2)
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=50)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"candidates={args.candidates}")
+    for n_participants in (2, 5, 10, 50, 200):
+        eta_rows = [
+            eta_row(rng.randint(8, 90) for _ in range(args.candidates))
+            for _ in range(n_participants)
+        ]
+
+        legacy = legacy_fairness(eta_rows, args.candidates)
+        kernel = fairness_table(eta_rows)
+        assert all(
+            f.std == l["std"] and f.mean == l["mean"] for f, l in zip(kernel, legacy)
+        ), "fairness kernel diverged from statistics-based result"
+
+        legacy_s = min(timeit.repeat(
+            lambda: legacy_fairness(eta_rows, args.candidates), number=args.number, repeat=5
+        )) / args.number
+        kernel_s = min(timeit.repeat(
+            lambda: fairness_table(eta_rows), number=args.number, repeat=5
+        )) / args.number
+
+        print(f"  participants={n_participants:<4} statistics {legacy_s * 1e6:9.1f} us"
+              f"  kernel {kernel_s * 1e6:8.1f} us  ({legacy_s / kernel_s:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""이소크론 격자 벤치마크: 빌드 시간, 파일 크기, ETA 행 조회 지연, 근사 오차
+
+실행: python -m benchmarks.bench_isochrone [--cell 250]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import timeit
+
+from app.candidates import CandidateGenerator
+from app.estimator import TransitEstimator
+from app.isochrone import SEOUL_BBOX, IsochroneGrid, build_grid
+from app.records import Coord
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cell", type=float, default=250)
+    parser.add_argument("--origins", type=int, default=2000)
+    args = parser.parse_args()
+
+    candidate_generator = CandidateGenerator()
+    estimator = TransitEstimator()
+    places = candidate_generator.places
+
+    rng = random.Random(7)
+    south, west, north, east = SEOUL_BBOX
+    origins = [Coord(rng.uniform(south, north), rng.uniform(west, east)) for _ in range(args.origins)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "isochrone.bin")
+        stats = build_grid(path, places, estimator, candidate_generator.catalog_fingerprint(),
+                           cell_meters=args.cell)
+        grid = IsochroneGrid.open_compatible(path, candidate_generator.catalog_fingerprint(), estimator)
+
+        exact_s = min(timeit.repeat(
+            lambda: [estimator.estimate_row(o, places) for o in origins], number=1, repeat=5
+        )) / len(origins)
+        grid_s = min(timeit.repeat(
+            lambda: [grid.row(o) for o in origins], number=1, repeat=5
+        )) / len(origins)
+
+        errors = [
+            abs(a - b)
+            for o in origins
+            for a, b in zip(grid.row(o), estimator.estimate_row(o, places))
+        ]
+        grid.close()
+
+    print(f"grid {stats['rows']}x{stats['cols']} cells ({args.cell:.0f} m) x {len(places)} places")
+    print(f"  build        {stats['seconds']:8.2f} s")
+    print(f"  file size    {stats['bytes'] / 1024 / 1024:8.2f} MiB")
+    print(f"  row lookup   {grid_s * 1e6:8.2f} us  (estimate_row {exact_s * 1e6:.1f} us, "
+          f"{exact_s / grid_s:.0f}x)")
+    print(f"  abs error    max {max(errors)} min, mean {sum(errors) / len(errors):.3f} min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""메모리 회귀 벤치마크: 참가자 수 x 카탈로그 크기별 /recommend 한 번의 할당량
+
+tracemalloc으로 recommend_logic 한 번 동안의 최대 할당량(peak)과 요청 후 남는 할당량
+(retained, 결과/ETA 행 캐시 항목 포함)을 측정하고 benchmarks/memory_baseline.json과 비교한다.
+기준보다 허용 오차 이상 크면 종료 코드 1로 끝난다. 지오코딩은 미리 캐시에 넣어 VWorld를 호출하지 않는다.
+
+실행: python -m benchmarks.bench_memory [--update] [--tolerance 0.15]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+from app import main as app_main
+from app.geocoder import normalize_address
+from app.isochrone import SEOUL_BBOX
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "memory_baseline.json")
+
+GROUP_SIZES = (2, 5, 10, 30)
+CATALOG_SIZES = (50, 500, 2000)
+
+# 작은 구성에서 인터프리터 내부 할당 차이로 실패하지 않도록 하는 절대 여유
+SLACK_BYTES = 32 * 1024
+
+
+def synthetic_catalog(n_places: int, rng: random.Random) -> list[list]:
+    """수도권 bbox 안의 임의 장소 n개 (export_places 형식)"""
+    south, west, north, east = SEOUL_BBOX
+    types = ("subway_station", "commercial_area", "cafe_street")
+    return [
+        [f"장소{i}", rng.uniform(south, north), rng.uniform(west, east), rng.choice(types), ["카페", "식당"]]
+        for i in range(n_places)
+    ]
+
+
+def participants_for(n: int, rng: random.Random) -> list[dict]:
+    """수도권 안의 임의 출발지 n개 (좌표는 지오코딩 캐시에 미리 저장)"""
+    south, west, north, east = SEOUL_BBOX
+    participants = []
+    for i in range(n):
+        origin = f"벤치 출발지 {n}-{i}"
+        app_main.geocoder.remember(normalize_address(origin), rng.uniform(south, north), rng.uniform(west, east))
+        participants.append({"name": f"P{i}", "origin_text": origin})
+    return participants
+
+
+def clear_caches() -> None:
+    app_main.result_cache.shrink_to(0)
+    app_main.eta_row_cache.shrink_to(0)
+    gc.collect()
+
+
+def measure(loop: asyncio.AbstractEventLoop, participants: list[dict]) -> dict:
+    # 첫 실행의 지연 import, 내부 캐시 생성 등을 측정에서 제외
+    loop.run_until_complete(app_main.recommend_logic(participants, "cafe_talk"))
+    clear_caches()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = loop.run_until_complete(app_main.recommend_logic(participants, "cafe_talk"))
+    del result
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    clear_caches()
+    return {"peak_bytes": peak - before, "retained_bytes": current - before}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="측정값으로 기준 파일 갱신")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="허용 증가 비율")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    seoul_rows = app_main.candidate_generator.export_places()
+    # 이소크론 격자는 기본 카탈로그 기준이므로, 카탈로그를 바꾸는 동안에는 사용하지 않음
+    isochrone_grid = app_main.isochrone_grid
+    app_main.isochrone_grid = None
+    loop = asyncio.new_event_loop()
+    results = {}
+    try:
+        for n_places in CATALOG_SIZES:
+            rows = seoul_rows if n_places == len(seoul_rows) else synthetic_catalog(n_places, rng)
+            app_main.candidate_generator.load_places(rows)
+            for n_participants in GROUP_SIZES:
+                results[f"{n_participants}x{n_places}"] = measure(loop, participants_for(n_participants, rng))
+    finally:
+        app_main.candidate_generator.load_places(seoul_rows)
+        app_main.isochrone_grid = isochrone_grid
+        loop.close()
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    regressions = []
+    print(f"{'participants x places':>22} {'peak KiB':>10} {'retained KiB':>13} {'baseline peak':>14}")
+    for name, measured in results.items():
+        expected = baseline.get(name)
+        note = ""
+        if expected is not None:
+            for metric in ("peak_bytes", "retained_bytes"):
+                limit = expected[metric] * (1 + args.tolerance) + SLACK_BYTES
+                if measured[metric] > limit:
+                    regressions.append(f"{name} {metric}: {measured[metric]} > {int(limit)}")
+                    note = "  REGRESSION"
+        baseline_peak = f"{expected['peak_bytes'] / 1024:.1f}" if expected is not None else "-"
+        print(f"{name:>22} {measured['peak_bytes'] / 1024:10.1f} {measured['retained_bytes'] / 1024:13.1f} "
+              f"{baseline_peak:>14}{note}")
+
+    if args.update:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline written: {BASELINE_PATH}")
+        return
+
+    if regressions:
+        print("memory regressions:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""/recommend 응답 직렬화 비용 벤치마크
+
+기존 경로(dict -> Pydantic 모델 재구성 -> response_model 재검증 -> stdlib json)와
+fast path(dict -> orjson 바이트)를 비교하고, 목표 RPS에서 절약되는 CPU 시간을 출력한다.
+
+실행: python -m benchmarks.bench_serialization [--rps 500] [--participants 4]
+"""
+
+import argparse
+import asyncio
+import json
+import timeit
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app import main
+from app.candidates import CandidateGenerator
+from app.models import Recommendation, FairnessScore, PurposeScore, RecommendResponse
+
+
+class _StationGeocoder:
+    """VWorld 호출 없이 역 이름을 카탈로그 좌표로 변환하는 벤치마크용 지오코더"""
+
+    def __init__(self):
+        self._coords = {
+            loc["label"]: {"lat": loc["lat"], "lng": loc["lng"]}
+            for loc in CandidateGenerator.MAJOR_LOCATIONS
+        }
+
+    async def geocode(self, address: str):
+        return self._coords.get(address)
+
+
+def build_result(n_participants: int) -> dict:
+    main.geocoder = _StationGeocoder()
+    labels = [loc["label"] for loc in CandidateGenerator.MAJOR_LOCATIONS]
+    participants = [
+        {"name": f"P{i + 1}", "origin_text": labels[(i * 7) % len(labels)]}
+        for i in range(n_participants)
+    ]
+    return asyncio.run(main.recommend_logic(participants, "cafe_talk"))
+
+
+def legacy_path(result: dict) -> bytes:
+    """기존 /recommend: 모델 재구성 + response_model 검증 + JSONResponse"""
+    recommendations = [
+        Recommendation(
+            rank=r["rank"],
+            label=r["label"],
+            lat=r["lat"],
+            lng=r["lng"],
+            eta_by_participant=r["eta_by_participant"],
+            fairness=FairnessScore(std=r["fairness"]["std"], mean=r["fairness"]["mean"]),
+            purpose=PurposeScore(score=r["purpose"]["score"]),
+            why=r["why"]
+        )
+        for r in result["recommendations"]
+    ]
+    response = RecommendResponse(recommendations=recommendations)
+    # FastAPI serialize_response: response_model 필드로 재검증 후 jsonable_encoder
+    validated = RecommendResponse.model_validate(response.model_dump())
+    return JSONResponse(content=jsonable_encoder(validated)).body
+
+
+def fast_path(result: dict) -> bytes:
+    """fast path: recommend_logic 결과를 orjson으로 바로 렌더링"""
+    return main._json_response(result).body
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--participants", type=int, default=4)
+    parser.add_argument("--rps", type=int, default=500)
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    result = build_result(args.participants)
+    # 응답 모델의 기본값 필드(complete, map_url 등)는 fast path에서 생략되므로 모델로 읽어 비교
+    assert RecommendResponse.model_validate(orjson.loads(fast_path(result))) == \
+        RecommendResponse.model_validate(json.loads(legacy_path(result)))
+
+    timings = {}
+    for name, fn in (("legacy", legacy_path), ("orjson", fast_path)):
+        seconds = min(timeit.repeat(lambda: fn(result), number=args.number, repeat=5))
+        timings[name] = seconds / args.number * 1e6
+
+    saved_us = timings["legacy"] - timings["orjson"]
+    print(f"participants={args.participants} payload={len(fast_path(result))} bytes")
+    for name, us in timings.items():
+        print(f"  {name:<7} {us:8.1f} us/response")
+    print(f"  saved   {saved_us:8.1f} us/response "
+          f"({timings['legacy'] / timings['orjson']:.1f}x)")
+    print(f"  @ {args.rps} RPS: {saved_us * args.rps / 1e6 * 100:.1f}% of one core saved")
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,135 @@
+"""로컬 VWorld 스텁 서버
+
+/req/address(getcoord)와 /req/search를 VWorld 응답 형식으로 흉내 낸다. 좌표는 주소 문자열의
+해시로 서울 영역 안에서 결정적으로 만들어지며, 응답 지연과 주소 API 실패 비율을 조절할 수 있다.
+일시 오류(HTTP 503) 비율과 일일 호출 한도(초과 시 status ERROR / OVER_REQUEST_LIMIT)도 흉내 낸다.
+일괄 지오코딩 CLI나 서비스를 실제 API 키/쿼터 없이 시험할 때 사용한다.
+
+    python -m benchmarks.vworld_stub --port 8765 --latency-ms 30 --miss-rate 0.1
+    VWORLD_API_KEY=stub VWORLD_BASE_URL=http://127.0.0.1:8765 python -m app.bulk_geocode addresses.csv --db /tmp/geocode.db
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+SEOUL_BBOX = (37.45, 126.85, 37.68, 127.15)
+
+
+def stub_point(text: str) -> tuple[float, float]:
+    """문자열 해시로 서울 영역 안의 결정적 좌표 생성"""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    u = int.from_bytes(digest[:4], "little") / 0xFFFFFFFF
+    v = int.from_bytes(digest[4:], "little") / 0xFFFFFFFF
+    min_lat, min_lng, max_lat, max_lng = SEOUL_BBOX
+    return min_lat + u * (max_lat - min_lat), min_lng + v * (max_lng - min_lng)
+
+
+def _misses(text: str, kind: str, miss_rate: float) -> bool:
+    digest = hashlib.blake2b(f"{kind}\x1f{text}".encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "little") / 0xFFFFFFFF < miss_rate
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address,
+        latency_ms: float = 0.0,
+        miss_rate: float = 0.0,
+        error_rate: float = 0.0,
+        daily_limit: int = 0
+    ):
+        super().__init__(address, StubHandler)
+        self.latency_seconds = latency_ms / 1000
+        self.miss_rate = miss_rate
+        self.error_rate = error_rate
+        self.daily_limit = daily_limit
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server: StubServer
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        with self.server._lock:
+            self.server.calls += 1
+            calls = self.server.calls
+        if self.server.latency_seconds:
+            time.sleep(self.server.latency_seconds)
+
+        if self.server.error_rate and random.random() < self.server.error_rate:
+            self.send_error(503)
+            return
+        if self.server.daily_limit and calls > self.server.daily_limit:
+            body = {"response": {"status": "ERROR", "error": {
+                "level": "1", "code": "OVER_REQUEST_LIMIT", "text": "일일 요청 한도를 초과했습니다."
+            }}}
+        elif url.path == "/req/address":
+            text = params.get("address", "")
+            # 도로명/지번 각각 miss_rate 비율로 실패 (둘 다 실패하면 클라이언트가 POI 검색으로 넘어감)
+            if text and not _misses(text, params.get("type", "road"), self.server.miss_rate):
+                lat, lng = stub_point(text)
+                body = {"response": {"status": "OK", "result": {"point": {"x": str(lng), "y": str(lat)}}}}
+            else:
+                body = {"response": {"status": "NOT_FOUND"}}
+        elif url.path == "/req/search":
+            text = params.get("query", "")
+            if text and not _misses(text, "place", self.server.miss_rate):
+                lat, lng = stub_point(text)
+                body = {"response": {"status": "OK", "result": {"items": [{"point": {"x": str(lng), "y": str(lat)}}]}}}
+            else:
+                body = {"response": {"status": "NOT_FOUND"}}
+        else:
+            self.send_error(404)
+            return
+
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.vworld_stub", description="로컬 VWorld 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연(ms)")
+    parser.add_argument("--miss-rate", type=float, default=0.0, help="주소 API 실패 비율 (0~1)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 503 응답 비율 (0~1)")
+    parser.add_argument("--daily-limit", type=int, default=0, help="이 호출 수 이후 OVER_REQUEST_LIMIT 오류 (0이면 없음)")
+    args = parser.parse_args()
+
+    server = StubServer((args.host, args.port), args.latency_ms, args.miss_rate, args.error_rate, args.daily_limit)
+    print(f"VWorld stub listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"served {server.calls} calls")
+
+
+if __name__ == "__main__":
+    main()
@@ -56,6 +56,12 @@ const TOOL_DEFINITION = {
           "date",
         ],
       },
+      deadline_ms: {
+        type: "integer",
+        description:
+          "Optional latency budget in milliseconds. When set, the best recommendation found within the budget is returned and the response field `complete` is false if the result is approximate.",
+        minimum: 1,
+      },
     },
     required: ["participants"],
   },
@@ -82,6 +88,10 @@ const SERVER_CAPABILITIES = {
 // Tool Execution Function (Stateless - No Session Dependency)
 // =============================================================================
 async function executeRecommendTool(args) {
+  // Request ID shared with the FastAPI backend logs/traces (X-Request-Id)
+  let requestId = crypto.randomUUID();
+  const meta = () => ({ "meetplanner/requestId": requestId });
+
   try {
     // Add default name if not provided
     const participants = (args?.participants || []).map((p, idx) => ({
@@ -92,13 +102,15 @@ async function executeRecommendTool(args) {
     // Call FastAPI backend
     const response = await fetch(`${FASTAPI_URL}/recommend`, {
       method: "POST",
-      headers: { "Content-Type": "application/json" },
+      headers: { "Content-Type": "application/json", "X-Request-Id": requestId },
       body: JSON.stringify({
         participants,
         purpose: args?.purpose || "cafe_talk",
+        deadline_ms: args?.deadline_ms,
       }),
     });
 
+    requestId = response.headers.get("x-request-id") || requestId;
     const data = await response.json();
 
     if (!response.ok) {
@@ -110,6 +122,7 @@ async function executeRecommendTool(args) {
           },
         ],
         isError: true,
+        _meta: meta(),
       };
     }
 
@@ -121,6 +134,7 @@ async function executeRecommendTool(args) {
         },
       ],
       isError: false,
+      _meta: meta(),
     };
   } catch (error) {
     return {
@@ -131,6 +145,7 @@ async function executeRecommendTool(args) {
         },
       ],
       isError: true,
+      _meta: meta(),
     };
   }
 }